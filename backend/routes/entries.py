@@ -56,7 +56,12 @@ def list_entries():
     db = current_app.config['DB']
     limit = request.args.get('limit', 50, type=int)
     offset = request.args.get('offset', 0, type=int)
-    rows = db.get_entries(limit=limit, offset=offset)
+    rows = db.get_entries(
+        limit=limit,
+        offset=offset,
+        before=request.args.get('before') or None,
+        before_id=request.args.get('before_id', type=int),
+    )
     return jsonify([_row_to_dict(r) for r in rows])
 
 
@@ -6,11 +6,34 @@ import os
 import wx
 import wx.lib.scrolledpanel as scrolled
 import wx.lib.agw.flatnotebook as fnb
+import wx.richtext as rt
 
 from ui_helpers import logger, _cfg, get_wx_color
 from image_utils import load_and_scale_image
 from widgets import ArchetypeAutocomplete
-from rich_text_panel import RichTextPanel
+from rich_text_panel import LazyRichTextPanel
+
+
+# wx.Font objects keyed by (size, weight). Built lazily because fonts can
+# only be created once the wx.App exists.
+_FONT_CACHE = {}
+
+
+def _font(size, weight=wx.FONTWEIGHT_NORMAL):
+    """Return a cached default-family font of the given size and weight"""
+    key = (size, weight)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = wx.Font(size, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, weight)
+        _FONT_CACHE[key] = font
+    return font
+
+
+# Shared empty result for batch edit lists with nothing checked
+_EMPTY = frozenset()
+
+# Batch edit control kinds, recorded when a field control is built
+_CTRL_TEXT, _CTRL_CHOICE, _CTRL_SPIN, _CTRL_CHECK = range(4)
 
 
 class CardViewDialog(wx.Dialog):
@@ -143,7 +166,7 @@ class CardViewDialog(wx.Dialog):
 
         # Card name
         name_label = wx.StaticText(self.info_panel, label=card['name'])
-        name_label.SetFont(wx.Font(16, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        name_label.SetFont(_font(16, wx.FONTWEIGHT_BOLD))
         name_label.SetForegroundColour(get_wx_color('text_primary'))
         self.info_sizer.Add(name_label, 0, wx.BOTTOM, 10)
 
@@ -158,7 +181,7 @@ class CardViewDialog(wx.Dialog):
 
         # Classification section
         class_title = wx.StaticText(self.info_panel, label="Classification")
-        class_title.SetFont(wx.Font(11, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        class_title.SetFont(_font(11, wx.FONTWEIGHT_BOLD))
         class_title.SetForegroundColour(get_wx_color('accent'))
         self.info_sizer.Add(class_title, 0, wx.BOTTOM, 8)
 
@@ -205,7 +228,7 @@ class CardViewDialog(wx.Dialog):
             self.info_sizer.Add(sep2, 0, wx.EXPAND | wx.TOP | wx.BOTTOM, 15)
 
             notes_title = wx.StaticText(self.info_panel, label="Notes")
-            notes_title.SetFont(wx.Font(11, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+            notes_title.SetFont(_font(11, wx.FONTWEIGHT_BOLD))
             notes_title.SetForegroundColour(get_wx_color('accent'))
             self.info_sizer.Add(notes_title, 0, wx.BOTTOM, 8)
 
@@ -228,7 +251,7 @@ class CardViewDialog(wx.Dialog):
                     self.info_sizer.Add(sep3, 0, wx.EXPAND | wx.TOP | wx.BOTTOM, 15)
 
                     cf_title = wx.StaticText(self.info_panel, label="Custom Fields")
-                    cf_title.SetFont(wx.Font(11, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+                    cf_title.SetFont(_font(11, wx.FONTWEIGHT_BOLD))
                     cf_title.SetForegroundColour(get_wx_color('accent'))
                     self.info_sizer.Add(cf_title, 0, wx.BOTTOM, 8)
 
@@ -252,7 +275,7 @@ class CardViewDialog(wx.Dialog):
             self.info_sizer.Add(sep4, 0, wx.EXPAND | wx.TOP | wx.BOTTOM, 15)
 
             tags_title = wx.StaticText(self.info_panel, label="Tags")
-            tags_title.SetFont(wx.Font(11, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+            tags_title.SetFont(_font(11, wx.FONTWEIGHT_BOLD))
             tags_title.SetForegroundColour(get_wx_color('accent'))
             self.info_sizer.Add(tags_title, 0, wx.BOTTOM, 8)
 
@@ -268,7 +291,7 @@ class CardViewDialog(wx.Dialog):
             self.info_sizer.Add(sep5, 0, wx.EXPAND | wx.TOP | wx.BOTTOM, 15)
 
             groups_title = wx.StaticText(self.info_panel, label="Groups")
-            groups_title.SetFont(wx.Font(11, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+            groups_title.SetFont(_font(11, wx.FONTWEIGHT_BOLD))
             groups_title.SetForegroundColour(get_wx_color('accent'))
             self.info_sizer.Add(groups_title, 0, wx.BOTTOM, 8)
 
@@ -284,7 +307,7 @@ class CardViewDialog(wx.Dialog):
     def _add_placeholder_image(self):
         """Add a placeholder when no image is available"""
         no_img = wx.StaticText(self.image_panel, label="🂠")
-        no_img.SetFont(wx.Font(72, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
+        no_img.SetFont(_font(72))
         no_img.SetForegroundColour(get_wx_color('text_dim'))
         self.image_sizer.Add(no_img, 0, wx.ALL | wx.ALIGN_CENTER, 10)
 
@@ -297,7 +320,7 @@ class CardViewDialog(wx.Dialog):
         val = wx.StaticText(self.info_panel, label=value)
         val.SetForegroundColour(get_wx_color('text_primary'))
         if font_size:
-            val.SetFont(wx.Font(font_size, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
+            val.SetFont(_font(font_size))
         row.Add(val, 0)
         self.info_sizer.Add(row, 0, wx.BOTTOM, 5)
 
@@ -381,9 +404,48 @@ class CardEditDialog(wx.Dialog):
         # Form control references (rebuilt for each card)
         self._form_controls = {}
 
+        # Card tags and select-field choices are shared by every card in the
+        # session, so they are fetched/parsed once and reused on prev/next
+        self._card_tags_cache = None
+        self._card_tag_choices = ()
+        self._select_choices_cache = {}
+
+        # Tabs whose contents are built on first selection: index -> (container, builder)
+        self._deferred_tabs = {}
+
+        # Which parts of the card the user has changed since it was loaded:
+        # 'card', 'metadata', 'tags', 'groups'
+        self._dirty = set()
+
+        # Custom field type -> control builder (unknown types use a text field)
+        self._field_builders = {
+            'multiline': self._build_multiline_field,
+            'text': self._build_text_field,
+            'number': self._build_number_field,
+            'select': self._build_select_field,
+            'checkbox': self._build_checkbox_field,
+        }
+
         self._build_ui()
         self._load_card(card_id)
 
+    def _parse_field_options(self, field):
+        """Return (options, choices) for a custom field, cached by field id"""
+        cached = self._select_choices_cache.get(field['id'])
+        if cached is not None:
+            return cached
+
+        field_options = None
+        if field['field_options']:
+            try:
+                field_options = json.loads(field['field_options'])
+            except (json.JSONDecodeError, ValueError) as e:
+                logger.warning("Failed to parse field_options for '%s': %s", field['field_name'], e)
+        choices = ('',) + tuple(field_options) if field_options else ('',)
+
+        self._select_choices_cache[field['id']] = (field_options, choices)
+        return field_options, choices
+
     def _build_ui(self):
         """Build the dialog UI structure (called once)"""
         self.main_sizer = wx.BoxSizer(wx.VERTICAL)
@@ -447,10 +509,11 @@ class CardEditDialog(wx.Dialog):
 
         self.current_card_id = card_id
 
-        # Get card data
-        card = self.db.get_card_with_metadata(card_id)
-        if not card:
+        # Get card data (as a dict so every field lookup below is a plain .get)
+        card_row = self.db.get_card_with_metadata(card_id)
+        if not card_row:
             return
+        card = dict(card_row)
 
         deck_id = card['deck_id']
         deck = self.db.get_deck(deck_id)
@@ -465,12 +528,8 @@ class CardEditDialog(wx.Dialog):
 
         # Helper to safely get card fields
         def get_field(field_name, default=''):
-            try:
-                if field_name in card.keys():
-                    return card[field_name] if card[field_name] is not None else default
-            except (KeyError, TypeError):
-                pass
-            return default
+            value = card.get(field_name)
+            return value if value is not None else default
 
         # Parse existing custom field values
         existing_custom_values = {}
@@ -494,6 +553,7 @@ class CardEditDialog(wx.Dialog):
         # Restore tab selection
         if self.notebook and current_tab > 0 and current_tab < self.notebook.GetPageCount():
             self.notebook.SetSelection(current_tab)
+            self._ensure_tab_built(current_tab)
 
         # Update navigation buttons
         self._update_nav_buttons()
@@ -516,7 +576,7 @@ class CardEditDialog(wx.Dialog):
     def _add_placeholder_image(self):
         """Add a placeholder when no image is available"""
         no_img = wx.StaticText(self.image_panel, label="🂠")
-        no_img.SetFont(wx.Font(72, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
+        no_img.SetFont(_font(72))
         no_img.SetForegroundColour(get_wx_color('text_dim'))
         self.image_sizer.Add(no_img, 0, wx.ALL | wx.ALIGN_CENTER, 10)
 
@@ -527,7 +587,10 @@ class CardEditDialog(wx.Dialog):
             'card': card,
             'deck_id': deck['id'],
             'cartomancy_type': cartomancy_type,
+            'existing_custom_values': existing_custom_values,
         }
+        self._deferred_tabs = {}
+        self._dirty.clear()
 
         # Create notebook
         style = (fnb.FNB_NO_X_BUTTON | fnb.FNB_NO_NAV_BUTTONS | fnb.FNB_NODRAG)
@@ -539,17 +602,59 @@ class CardEditDialog(wx.Dialog):
         self.notebook.SetActiveTabTextColour(get_wx_color('text_primary'))
         self.notebook.SetGradientColourTo(get_wx_color('bg_tertiary'))
         self.notebook.SetGradientColourFrom(get_wx_color('bg_secondary'))
+        self.notebook.Bind(fnb.EVT_FLATNOTEBOOK_PAGE_CHANGED, self._on_tab_changed)
 
-        # Build tabs
+        # Build tabs (Groups and Custom Fields are built when first selected)
+        card_id, deck_id = card['id'], deck['id']
         self._build_basic_tab(card, get_field)
         self._build_classification_tab(card, cartomancy_type, get_field)
         self._build_notes_tab(get_field)
-        self._build_tags_tab(card['id'])
-        self._build_groups_tab(card['id'], deck['id'])
-        self._build_custom_fields_tab(deck_custom_fields, existing_custom_values)
+        self._build_tags_tab(card_id)
+        self._add_deferred_tab(
+            "Groups", 'groups', lambda parent: self._build_groups_tab(parent, card_id, deck_id))
+        self._add_deferred_tab(
+            "Custom Fields", 'metadata',
+            lambda parent: self._build_custom_fields_tab(parent, deck_custom_fields, existing_custom_values))
 
         self.form_sizer.Add(self.notebook, 1, wx.EXPAND)
 
+    def _add_deferred_tab(self, title, dirty_key, builder):
+        """Add a placeholder page whose contents are built on first selection"""
+        container = wx.Panel(self.notebook)
+        container.SetBackgroundColour(get_wx_color('bg_primary'))
+        container.SetSizer(wx.BoxSizer(wx.VERTICAL))
+        self.notebook.AddPage(container, title)
+        self._deferred_tabs[self.notebook.GetPageCount() - 1] = (container, dirty_key, builder)
+
+    def _ensure_tab_built(self, index):
+        """Build a deferred tab's contents if it hasn't been built yet"""
+        deferred = self._deferred_tabs.pop(index, None)
+        if deferred:
+            container, dirty_key, builder = deferred
+            container.GetSizer().Add(builder(container), 1, wx.EXPAND)
+            container.Layout()
+            self._track_changes(container, dirty_key)
+
+    def _track_changes(self, page, dirty_key):
+        """Mark dirty_key as changed whenever a control on page is edited.
+
+        Bound after the page is populated, so setting initial values
+        doesn't count as a change. Control events propagate up to the page.
+        """
+        def on_change(event, key=dirty_key):
+            self._dirty.add(key)
+            event.Skip()
+
+        for event_type in (wx.EVT_TEXT, wx.EVT_CHOICE, wx.EVT_CHECKBOX,
+                           wx.EVT_SPINCTRL, wx.EVT_CHECKLISTBOX,
+                           rt.EVT_RICHTEXT_STYLE_CHANGED):
+            page.Bind(event_type, on_change)
+
+    def _on_tab_changed(self, event):
+        """Handle notebook tab change"""
+        self._ensure_tab_built(event.GetSelection())
+        event.Skip()
+
     def _build_basic_tab(self, card, get_field):
         """Build the Basic Info tab"""
         panel = wx.Panel(self.notebook)
@@ -597,6 +702,7 @@ class CardEditDialog(wx.Dialog):
         self._form_controls['card_order'] = order_ctrl
 
         panel.SetSizer(sizer)
+        self._track_changes(panel, 'card')
         self.notebook.AddPage(panel, "Basic Info")
 
     def _build_classification_tab(self, card, cartomancy_type, get_field):
@@ -640,6 +746,7 @@ class CardEditDialog(wx.Dialog):
         self._form_controls['suit'] = suit_ctrl
 
         panel.SetSizer(sizer)
+        self._track_changes(panel, 'metadata')
         self.notebook.AddPage(panel, "Classification")
 
     def _build_tarot_fields(self, panel, sizer, get_field):
@@ -775,7 +882,7 @@ class CardEditDialog(wx.Dialog):
         # Get custom fields for Chinese characters
         custom_fields = {}
         try:
-            cf_json = card.get('custom_fields') if hasattr(card, 'get') else (card['custom_fields'] if 'custom_fields' in card.keys() else None)
+            cf_json = card.get('custom_fields')
             if cf_json:
                 custom_fields = json.loads(cf_json) if isinstance(cf_json, str) else cf_json
         except (json.JSONDecodeError, ValueError, KeyError, TypeError) as e:
@@ -822,11 +929,12 @@ class CardEditDialog(wx.Dialog):
         notes_label.SetForegroundColour(get_wx_color('text_primary'))
         sizer.Add(notes_label, 0, wx.ALL, 10)
 
-        notes_ctrl = RichTextPanel(panel, value=get_field('notes', ''), min_height=150)
+        notes_ctrl = LazyRichTextPanel(panel, value=get_field('notes', ''), min_height=150)
         sizer.Add(notes_ctrl, 0, wx.EXPAND | wx.LEFT | wx.RIGHT | wx.BOTTOM, 10)
         self._form_controls['notes'] = notes_ctrl
 
         panel.SetSizer(sizer)
+        self._track_changes(panel, 'metadata')
         self.notebook.AddPage(panel, "Notes")
 
     def _build_tags_tab(self, card_id):
@@ -854,18 +962,21 @@ class CardEditDialog(wx.Dialog):
 
         # Get current card tags and all available card tags
         current_card_tags = {t['id'] for t in self.db.get_tags_for_card(card_id)}
-        all_card_tags = list(self.db.get_card_tags())
+        if self._card_tags_cache is None:
+            self._card_tags_cache = list(self.db.get_card_tags())
+            self._card_tag_choices = tuple(t['name'] for t in self._card_tags_cache)
+        all_card_tags = self._card_tags_cache
         self._form_controls['all_card_tags'] = all_card_tags
 
         # CheckListBox for tag selection
-        card_tag_choices = [tag['name'] for tag in all_card_tags]
-        card_tag_checklist = wx.CheckListBox(panel, choices=card_tag_choices)
+        card_tag_checklist = wx.CheckListBox(panel, choices=self._card_tag_choices)
         card_tag_checklist.SetBackgroundColour(get_wx_color('bg_secondary'))
         card_tag_checklist.SetForegroundColour(get_wx_color('text_primary'))
 
+        check = card_tag_checklist.Check
         for i, tag in enumerate(all_card_tags):
             if tag['id'] in current_card_tags:
-                card_tag_checklist.Check(i, True)
+                check(i, True)
 
         sizer.Add(card_tag_checklist, 1, wx.EXPAND | wx.LEFT | wx.RIGHT, 10)
         self._form_controls['tag_checklist'] = card_tag_checklist
@@ -876,11 +987,12 @@ class CardEditDialog(wx.Dialog):
         sizer.Add(add_btn, 0, wx.ALL, 10)
 
         panel.SetSizer(sizer)
+        self._track_changes(panel, 'tags')
         self.notebook.AddPage(panel, "Tags")
 
-    def _build_groups_tab(self, card_id, deck_id):
-        """Build the Groups tab"""
-        panel = scrolled.ScrolledPanel(self.notebook)
+    def _build_groups_tab(self, parent, card_id, deck_id):
+        """Build the Groups tab contents inside its placeholder page"""
+        panel = scrolled.ScrolledPanel(parent)
         panel.SetBackgroundColour(get_wx_color('bg_primary'))
         panel.SetupScrolling(scroll_x=False)
         sizer = wx.BoxSizer(wx.VERTICAL)
@@ -897,6 +1009,8 @@ class CardEditDialog(wx.Dialog):
         if all_groups:
             # Individual checkboxes with separate labels (macOS color fix)
             group_checkboxes = []
+            add_checkbox = group_checkboxes.append
+            text_color = get_wx_color('text_primary')
             for group in all_groups:
                 cb_sizer = wx.BoxSizer(wx.HORIZONTAL)
                 cb = wx.CheckBox(panel, label="")
@@ -904,10 +1018,10 @@ class CardEditDialog(wx.Dialog):
                     cb.SetValue(True)
                 cb_sizer.Add(cb, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
                 cb_label = wx.StaticText(panel, label=group['name'])
-                cb_label.SetForegroundColour(get_wx_color('text_primary'))
+                cb_label.SetForegroundColour(text_color)
                 cb_sizer.Add(cb_label, 0, wx.ALIGN_CENTER_VERTICAL)
                 sizer.Add(cb_sizer, 0, wx.LEFT | wx.RIGHT | wx.TOP, 10)
-                group_checkboxes.append(cb)
+                add_checkbox(cb)
             self._form_controls['group_checkboxes'] = group_checkboxes
         else:
             no_groups = wx.StaticText(panel, label="No groups created for this deck yet.\nUse the \"Groups...\" button in the Card Library to create groups.")
@@ -915,11 +1029,11 @@ class CardEditDialog(wx.Dialog):
             sizer.Add(no_groups, 0, wx.ALL, 10)
 
         panel.SetSizer(sizer)
-        self.notebook.AddPage(panel, "Groups")
+        return panel
 
-    def _build_custom_fields_tab(self, deck_custom_fields, existing_custom_values):
-        """Build the Custom Fields tab"""
-        panel = scrolled.ScrolledPanel(self.notebook)
+    def _build_custom_fields_tab(self, parent, deck_custom_fields, existing_custom_values):
+        """Build the Custom Fields tab contents inside its placeholder page"""
+        panel = scrolled.ScrolledPanel(parent)
         panel.SetBackgroundColour(get_wx_color('bg_primary'))
         panel.SetupScrolling(scroll_x=False)
         sizer = wx.BoxSizer(wx.VERTICAL)
@@ -929,63 +1043,21 @@ class CardEditDialog(wx.Dialog):
         if deck_custom_fields:
             custom_label = wx.StaticText(panel, label="Deck Custom Fields:")
             custom_label.SetForegroundColour(get_wx_color('text_primary'))
-            custom_label.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+            custom_label.SetFont(_font(10, wx.FONTWEIGHT_BOLD))
             sizer.Add(custom_label, 0, wx.ALL, 10)
 
+            field_builders = self._field_builders
             for field in deck_custom_fields:
                 field_name = field['field_name']
                 field_type = field['field_type']
-                field_options = None
-                if field['field_options']:
-                    try:
-                        field_options = json.loads(field['field_options'])
-                    except (json.JSONDecodeError, ValueError) as e:
-                        logger.warning("Failed to parse field_options for '%s': %s", field.get('field_name', '?'), e)
+                field_options, select_choices = self._parse_field_options(field)
+                if field_type == 'select' and not field_options:
+                    field_type = 'text'
 
                 current_value = existing_custom_values.get(field_name, '')
 
-                if field_type == 'multiline':
-                    field_sizer = wx.BoxSizer(wx.VERTICAL)
-                    f_label = wx.StaticText(panel, label=f"{field_name}:")
-                    f_label.SetForegroundColour(get_wx_color('text_primary'))
-                    field_sizer.Add(f_label, 0, wx.BOTTOM, 5)
-                    ctrl = RichTextPanel(panel, value=str(current_value), min_height=120)
-                    field_sizer.Add(ctrl, 0, wx.EXPAND)
-                else:
-                    field_sizer = wx.BoxSizer(wx.HORIZONTAL)
-                    f_label = wx.StaticText(panel, label=f"{field_name}:")
-                    f_label.SetForegroundColour(get_wx_color('text_primary'))
-                    field_sizer.Add(f_label, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 10)
-
-                    if field_type == 'text':
-                        ctrl = wx.TextCtrl(panel, value=str(current_value))
-                        ctrl.SetBackgroundColour(get_wx_color('bg_input'))
-                        ctrl.SetForegroundColour(get_wx_color('text_primary'))
-                        field_sizer.Add(ctrl, 1)
-                    elif field_type == 'number':
-                        try:
-                            num_val = int(current_value) if current_value else 0
-                        except (ValueError, TypeError) as e:
-                            logger.debug("Could not convert '%s' to number: %s", current_value, e)
-                            num_val = 0
-                        ctrl = wx.SpinCtrl(panel, min=-9999, max=9999, initial=num_val)
-                        ctrl.SetBackgroundColour(get_wx_color('bg_input'))
-                        ctrl.SetForegroundColour(get_wx_color('text_primary'))
-                        field_sizer.Add(ctrl, 0)
-                    elif field_type == 'select' and field_options:
-                        ctrl = wx.Choice(panel, choices=[''] + field_options)
-                        if current_value in field_options:
-                            ctrl.SetSelection(field_options.index(current_value) + 1)
-                        field_sizer.Add(ctrl, 1)
-                    elif field_type == 'checkbox':
-                        ctrl = wx.CheckBox(panel, label="")
-                        ctrl.SetValue(bool(current_value))
-                        field_sizer.Add(ctrl, 0)
-                    else:
-                        ctrl = wx.TextCtrl(panel, value=str(current_value))
-                        ctrl.SetBackgroundColour(get_wx_color('bg_input'))
-                        ctrl.SetForegroundColour(get_wx_color('text_primary'))
-                        field_sizer.Add(ctrl, 1)
+                builder = field_builders.get(field_type, self._build_text_field)
+                ctrl, field_sizer = builder(panel, field_name, current_value, field_options, select_choices)
 
                 custom_field_ctrls[field_name] = (ctrl, field_type)
                 sizer.Add(field_sizer, 0, wx.EXPAND | wx.LEFT | wx.RIGHT | wx.BOTTOM, 10)
@@ -998,7 +1070,65 @@ class CardEditDialog(wx.Dialog):
         self._form_controls['custom_fields'] = custom_field_ctrls
 
         panel.SetSizer(sizer)
-        self.notebook.AddPage(panel, "Custom Fields")
+        return panel
+
+    def _field_row(self, panel, field_name):
+        """Create a horizontal label row for a single-line custom field"""
+        field_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        f_label = wx.StaticText(panel, label=f"{field_name}:")
+        f_label.SetForegroundColour(get_wx_color('text_primary'))
+        field_sizer.Add(f_label, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 10)
+        return field_sizer
+
+    def _build_multiline_field(self, panel, field_name, current_value, field_options, select_choices):
+        """Build a multiline custom field (label above the editor)"""
+        field_sizer = wx.BoxSizer(wx.VERTICAL)
+        f_label = wx.StaticText(panel, label=f"{field_name}:")
+        f_label.SetForegroundColour(get_wx_color('text_primary'))
+        field_sizer.Add(f_label, 0, wx.BOTTOM, 5)
+        ctrl = LazyRichTextPanel(panel, value=str(current_value), min_height=120)
+        field_sizer.Add(ctrl, 0, wx.EXPAND)
+        return ctrl, field_sizer
+
+    def _build_text_field(self, panel, field_name, current_value, field_options, select_choices):
+        """Build a single-line text custom field (also the fallback type)"""
+        field_sizer = self._field_row(panel, field_name)
+        ctrl = wx.TextCtrl(panel, value=str(current_value))
+        ctrl.SetBackgroundColour(get_wx_color('bg_input'))
+        ctrl.SetForegroundColour(get_wx_color('text_primary'))
+        field_sizer.Add(ctrl, 1)
+        return ctrl, field_sizer
+
+    def _build_number_field(self, panel, field_name, current_value, field_options, select_choices):
+        """Build a numeric custom field"""
+        field_sizer = self._field_row(panel, field_name)
+        try:
+            num_val = int(current_value) if current_value else 0
+        except (ValueError, TypeError) as e:
+            logger.debug("Could not convert '%s' to number: %s", current_value, e)
+            num_val = 0
+        ctrl = wx.SpinCtrl(panel, min=-9999, max=9999, initial=num_val)
+        ctrl.SetBackgroundColour(get_wx_color('bg_input'))
+        ctrl.SetForegroundColour(get_wx_color('text_primary'))
+        field_sizer.Add(ctrl, 0)
+        return ctrl, field_sizer
+
+    def _build_select_field(self, panel, field_name, current_value, field_options, select_choices):
+        """Build a dropdown custom field"""
+        field_sizer = self._field_row(panel, field_name)
+        ctrl = wx.Choice(panel, choices=select_choices)
+        if current_value in field_options:
+            ctrl.SetSelection(field_options.index(current_value) + 1)
+        field_sizer.Add(ctrl, 1)
+        return ctrl, field_sizer
+
+    def _build_checkbox_field(self, panel, field_name, current_value, field_options, select_choices):
+        """Build a checkbox custom field"""
+        field_sizer = self._field_row(panel, field_name)
+        ctrl = wx.CheckBox(panel, label="")
+        ctrl.SetValue(bool(current_value))
+        field_sizer.Add(ctrl, 0)
+        return ctrl, field_sizer
 
     def _update_nav_buttons(self):
         """Update prev/next button enabled state"""
@@ -1037,22 +1167,71 @@ class CardEditDialog(wx.Dialog):
                 new_id = self.db.add_card_tag(result['name'], result['color'])
                 all_card_tags = self._form_controls['all_card_tags']
                 all_card_tags.append({'id': new_id, 'name': result['name'], 'color': result['color']})
+                self._card_tag_choices += (result['name'],)
                 checklist = self._form_controls['tag_checklist']
                 checklist.Append(result['name'])
                 checklist.Check(checklist.GetCount() - 1, True)
+                self._dirty.add('tags')
                 self.parent._refresh_card_tags_list()
             except Exception as ex:
                 wx.MessageBox(f"Could not add tag: {ex}", "Error", wx.OK | wx.ICON_ERROR)
 
     def _save_card_data(self):
-        """Save current form data to database"""
+        """Save current form data to database (only the parts that changed)"""
         card_id = self.current_card_id
         card = self._form_controls['card']
 
         new_name = self._form_controls['name'].GetValue().strip()
+        if not new_name:
+            return False
+
+        dirty = self._dirty
+        if not dirty:
+            return True
+
         new_image = self._form_controls['image_path'].GetValue().strip() or None
         new_order = self._form_controls['card_order'].GetValue()
 
+        # Write everything in one transaction (one commit per save)
+        with self.db.transaction():
+            # Update basic card info
+            if 'card' in dirty:
+                self.db.update_card(card_id, name=new_name, image_path=new_image, card_order=new_order)
+
+            # Update metadata
+            if 'metadata' in dirty:
+                self.db.update_card_metadata(card_id, **self._read_metadata_fields())
+
+            # Update card tags
+            checklist = self._form_controls.get('tag_checklist')
+            if checklist and 'tags' in dirty:
+                all_card_tags = self._form_controls.get('all_card_tags', [])
+                selected_card_tag_ids = []
+                for i in range(checklist.GetCount()):
+                    if checklist.IsChecked(i):
+                        selected_card_tag_ids.append(all_card_tags[i]['id'])
+                self.db.set_card_tags(card_id, selected_card_tag_ids)
+
+            # Update card groups
+            group_checkboxes = self._form_controls.get('group_checkboxes')
+            if group_checkboxes and 'groups' in dirty:
+                all_card_groups = self._form_controls.get('all_card_groups', [])
+                selected_group_ids = []
+                for i, cb in enumerate(group_checkboxes):
+                    if cb.GetValue():
+                        selected_group_ids.append(all_card_groups[i]['id'])
+                self.db.set_card_groups(card_id, selected_group_ids)
+
+        dirty.clear()
+
+        if new_image and new_image != card['image_path']:
+            self.thumb_cache.get_thumbnail(new_image)
+
+        return True
+
+    def _read_metadata_fields(self):
+        """Read classification, notes and custom field controls into
+        keyword arguments for db.update_card_metadata"""
         # Get archetype value
         new_archetype = self._form_controls['archetype'].GetValue().strip() or None
 
@@ -1081,8 +1260,11 @@ class CardEditDialog(wx.Dialog):
         # Get notes
         new_notes = self._form_controls['notes'].GetValue().strip() or None
 
-        # Get custom field values
-        new_custom_fields = {}
+        # Get custom field values (keep the stored values if the tab was never opened)
+        if 'custom_fields' in self._form_controls:
+            new_custom_fields = {}
+        else:
+            new_custom_fields = dict(self._form_controls['existing_custom_values'])
         custom_field_ctrls = self._form_controls.get('custom_fields', {})
         for field_name, (ctrl, field_type) in custom_field_ctrls.items():
             if field_type == 'checkbox':
@@ -1104,45 +1286,13 @@ class CardEditDialog(wx.Dialog):
         if 'iching_simp' in self._form_controls:
             new_custom_fields['simplified_chinese'] = self._form_controls['iching_simp'].GetValue()
 
-        if new_name:
-            # Update basic card info
-            self.db.update_card(card_id, name=new_name, image_path=new_image, card_order=new_order)
-
-            # Update metadata
-            self.db.update_card_metadata(
-                card_id,
-                archetype=new_archetype,
-                rank=new_rank,
-                suit=new_suit,
-                notes=new_notes,
-                custom_fields=new_custom_fields if new_custom_fields else None
-            )
-
-            # Update card tags
-            all_card_tags = self._form_controls.get('all_card_tags', [])
-            checklist = self._form_controls.get('tag_checklist')
-            if checklist:
-                selected_card_tag_ids = []
-                for i in range(checklist.GetCount()):
-                    if checklist.IsChecked(i):
-                        selected_card_tag_ids.append(all_card_tags[i]['id'])
-                self.db.set_card_tags(card_id, selected_card_tag_ids)
-
-            # Update card groups
-            all_card_groups = self._form_controls.get('all_card_groups', [])
-            group_checkboxes = self._form_controls.get('group_checkboxes')
-            if group_checkboxes:
-                selected_group_ids = []
-                for i, cb in enumerate(group_checkboxes):
-                    if cb.GetValue():
-                        selected_group_ids.append(all_card_groups[i]['id'])
-                self.db.set_card_groups(card_id, selected_group_ids)
-
-            if new_image and new_image != card['image_path']:
-                self.thumb_cache.get_thumbnail(new_image)
-
-            return True
-        return False
+        return {
+            'archetype': new_archetype,
+            'rank': new_rank,
+            'suit': new_suit,
+            'notes': new_notes,
+            'custom_fields': new_custom_fields if new_custom_fields else None,
+        }
 
     def _on_prev(self, event):
         """Navigate to previous card"""
@@ -1227,17 +1377,19 @@ class BatchEditDialog(wx.Dialog):
         self.cartomancy_type = deck['cartomancy_type_name'] if deck else 'Tarot'
 
         # Controls storage
-        self._tag_add_cbs = []
-        self._tag_remove_cbs = []
-        self._group_add_cbs = []
-        self._group_remove_cbs = []
+        self._tag_add_clb = None     # wx.CheckListBox of tags to add
+        self._tag_remove_clb = None
+        self._group_add_clb = None
+        self._group_remove_clb = None
         self._all_tags = []
         self._all_groups = []
+        self._all_tag_ids = []    # parallel to the tag add/remove checkboxes
+        self._all_group_ids = []  # parallel to the group add/remove checkboxes
         self._enable_cbs = {}   # field_name -> wx.CheckBox
-        self._field_ctrls = {}  # field_name -> control widget
+        self._field_ctrls = {}  # field_name -> (control widget, _CTRL_* kind)
         self._notes_mode = None  # radio button for append
         self._custom_field_cbs = {}
-        self._custom_field_ctrls = {}
+        self._custom_field_ctrls = {}  # field_name -> (ctrl, _CTRL_* kind, parsed options)
 
         self._build_ui()
 
@@ -1250,12 +1402,17 @@ class BatchEditDialog(wx.Dialog):
         scroll.SetupScrolling(scroll_x=False)
         content = wx.BoxSizer(wx.VERTICAL)
 
-        self._build_card_preview(scroll, content)
-        self._build_tags_section(scroll, content)
-        self._build_groups_section(scroll, content)
-        self._build_classification_section(scroll, content)
-        self._build_notes_section(scroll, content)
-        self._build_custom_fields_section(scroll, content)
+        # Suppress repaints while the (possibly large) form is built
+        self.Freeze()
+        try:
+            self._build_card_preview(scroll, content)
+            self._build_tags_section(scroll, content)
+            self._build_groups_section(scroll, content)
+            self._build_classification_section(scroll, content)
+            self._build_notes_section(scroll, content)
+            self._build_custom_fields_section(scroll, content)
+        finally:
+            self.Thaw()
 
         scroll.SetSizer(content)
         main_sizer.Add(scroll, 1, wx.EXPAND | wx.ALL, 5)
@@ -1282,20 +1439,33 @@ class BatchEditDialog(wx.Dialog):
         sep = wx.StaticLine(parent)
         sizer.Add(sep, 0, wx.EXPAND | wx.TOP | wx.BOTTOM, 8)
         title = wx.StaticText(parent, label=label)
-        title.SetFont(wx.Font(11, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        title.SetFont(_font(11, wx.FONTWEIGHT_BOLD))
         title.SetForegroundColour(get_wx_color('accent'))
         sizer.Add(title, 0, wx.LEFT | wx.BOTTOM, 10)
 
-    def _make_enable_row(self, parent, sizer, field_name, label_text):
-        """Create a row with an enable checkbox + label. Returns the sizer for the row."""
+    def _make_field_row(self, parent, sizer, label_text, ctrl, expand=False, top=True):
+        """Add an enable checkbox + label + control row to sizer. Returns the checkbox."""
         row = wx.BoxSizer(wx.HORIZONTAL)
         cb = wx.CheckBox(parent, label="")
         row.Add(cb, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
         lbl = wx.StaticText(parent, label=label_text)
         lbl.SetForegroundColour(get_wx_color('text_primary'))
         row.Add(lbl, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 10)
-        self._enable_cbs[field_name] = cb
-        return row
+        row.Add(ctrl, 1, wx.EXPAND if expand else 0)
+        flags = wx.EXPAND | wx.LEFT | wx.RIGHT
+        sizer.Add(row, 0, flags | wx.TOP if top else flags, 10)
+        return cb
+
+    def _make_text_ctrl(self, parent, **kwargs):
+        """Create a TextCtrl styled for the current theme."""
+        ctrl = wx.TextCtrl(parent, **kwargs)
+        ctrl.SetBackgroundColour(get_wx_color('bg_input'))
+        ctrl.SetForegroundColour(get_wx_color('text_primary'))
+        return ctrl
+
+    def _add_classification_row(self, parent, sizer, key, label_text, ctrl, kind, top=True):
+        self._enable_cbs[key] = self._make_field_row(parent, sizer, label_text, ctrl, top=top)
+        self._field_ctrls[key] = (ctrl, kind)
 
     # ── Card Preview ──────────────────────────────────────
 
@@ -1305,6 +1475,12 @@ class BatchEditDialog(wx.Dialog):
         preview.SetupScrolling(scroll_y=False)
         strip = wx.BoxSizer(wx.HORIZONTAL)
 
+        # Loop invariants hoisted to locals
+        bitmap_type_any = wx.BITMAP_TYPE_ANY
+        quality_high = wx.IMAGE_QUALITY_HIGH
+        text_color = get_wx_color('text_primary')
+        truncate = lambda n: n if len(n) <= 12 else n[:11] + "\u2026"  # noqa: E731
+
         for card_id in self.card_ids:
             card = self.db.get_card_with_metadata(card_id)
             if not card:
@@ -1318,28 +1494,25 @@ class BatchEditDialog(wx.Dialog):
             if image_path and os.path.exists(image_path):
                 thumb_path = self.thumb_cache.get_thumbnail_path(image_path)
                 if thumb_path and os.path.exists(thumb_path):
-                    img = wx.Image(thumb_path, wx.BITMAP_TYPE_ANY)
+                    img = wx.Image(thumb_path, bitmap_type_any)
                     w, h = img.GetSize()
                     max_w, max_h = 60, 90
                     scale = min(max_w / w, max_h / h)
-                    img = img.Scale(int(w * scale), int(h * scale), wx.IMAGE_QUALITY_HIGH)
+                    img = img.Scale(int(w * scale), int(h * scale), quality_high)
                     bmp = wx.StaticBitmap(preview, bitmap=img.ConvertToBitmap())
 
             if not bmp:
                 placeholder = wx.StaticText(preview, label="\U0001F0A0", size=(60, 90))
                 placeholder.SetForegroundColour(get_wx_color('text_dim'))
-                placeholder.SetFont(wx.Font(28, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
+                placeholder.SetFont(_font(28))
                 item.Add(placeholder, 0, wx.ALIGN_CENTER_HORIZONTAL)
             else:
                 item.Add(bmp, 0, wx.ALIGN_CENTER_HORIZONTAL)
 
             # Name (truncated)
-            name = card['name']
-            if len(name) > 12:
-                name = name[:11] + "\u2026"
-            name_lbl = wx.StaticText(preview, label=name)
-            name_lbl.SetForegroundColour(get_wx_color('text_primary'))
-            name_lbl.SetFont(wx.Font(8, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
+            name_lbl = wx.StaticText(preview, label=truncate(card['name']))
+            name_lbl.SetForegroundColour(text_color)
+            name_lbl.SetFont(_font(8))
             item.Add(name_lbl, 0, wx.ALIGN_CENTER_HORIZONTAL)
 
             strip.Add(item, 0, wx.ALL, 4)
@@ -1349,83 +1522,50 @@ class BatchEditDialog(wx.Dialog):
 
     # ── Tags ──────────────────────────────────────────────
 
+    def _build_add_remove_lists(self, parent, sizer, names):
+        """Build side-by-side Add / Remove check lists. Returns (add_clb, remove_clb)."""
+        text_secondary = get_wx_color('text_secondary')
+        text_primary = get_wx_color('text_primary')
+        bg_secondary = get_wx_color('bg_secondary')
+        height = min(len(names), 6) * 22 + 8
+
+        row = wx.BoxSizer(wx.HORIZONTAL)
+        lists = []
+        for label in ("Add:", "Remove:"):
+            col = wx.BoxSizer(wx.VERTICAL)
+            lbl = wx.StaticText(parent, label=label)
+            lbl.SetForegroundColour(text_secondary)
+            col.Add(lbl, 0, wx.BOTTOM, 3)
+            clb = wx.CheckListBox(parent, choices=names, size=(-1, height))
+            clb.SetBackgroundColour(bg_secondary)
+            clb.SetForegroundColour(text_primary)
+            col.Add(clb, 1, wx.EXPAND)
+            row.Add(col, 1, wx.EXPAND | wx.RIGHT, 10)
+            lists.append(clb)
+        sizer.Add(row, 0, wx.EXPAND | wx.LEFT | wx.RIGHT | wx.BOTTOM, 10)
+        return lists[0], lists[1]
+
     def _build_tags_section(self, parent, sizer):
         self._all_tags = list(self.db.get_card_tags())
+        self._all_tag_ids = [t['id'] for t in self._all_tags]
         if not self._all_tags:
             return
 
         self._add_section_header(parent, sizer, "Tags")
-
-        # Add row
-        add_label = wx.StaticText(parent, label="Add:")
-        add_label.SetForegroundColour(get_wx_color('text_secondary'))
-        sizer.Add(add_label, 0, wx.LEFT, 10)
-        add_wrap = wx.WrapSizer(wx.HORIZONTAL)
-        for tag in self._all_tags:
-            cb_sizer = wx.BoxSizer(wx.HORIZONTAL)
-            cb = wx.CheckBox(parent, label="")
-            cb_sizer.Add(cb, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 3)
-            lbl = wx.StaticText(parent, label=tag['name'])
-            lbl.SetForegroundColour(get_wx_color('text_primary'))
-            cb_sizer.Add(lbl, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 10)
-            add_wrap.Add(cb_sizer, 0, wx.TOP, 2)
-            self._tag_add_cbs.append(cb)
-        sizer.Add(add_wrap, 0, wx.LEFT | wx.RIGHT, 20)
-
-        # Remove row
-        rm_label = wx.StaticText(parent, label="Remove:")
-        rm_label.SetForegroundColour(get_wx_color('text_secondary'))
-        sizer.Add(rm_label, 0, wx.LEFT | wx.TOP, 10)
-        rm_wrap = wx.WrapSizer(wx.HORIZONTAL)
-        for tag in self._all_tags:
-            cb_sizer = wx.BoxSizer(wx.HORIZONTAL)
-            cb = wx.CheckBox(parent, label="")
-            cb_sizer.Add(cb, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 3)
-            lbl = wx.StaticText(parent, label=tag['name'])
-            lbl.SetForegroundColour(get_wx_color('text_primary'))
-            cb_sizer.Add(lbl, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 10)
-            rm_wrap.Add(cb_sizer, 0, wx.TOP, 2)
-            self._tag_remove_cbs.append(cb)
-        sizer.Add(rm_wrap, 0, wx.LEFT | wx.RIGHT | wx.BOTTOM, 20)
+        self._tag_add_clb, self._tag_remove_clb = self._build_add_remove_lists(
+            parent, sizer, [t['name'] for t in self._all_tags])
 
     # ── Groups ────────────────────────────────────────────
 
     def _build_groups_section(self, parent, sizer):
         self._all_groups = list(self.db.get_card_groups(self.deck_id))
+        self._all_group_ids = [g['id'] for g in self._all_groups]
         if not self._all_groups:
             return
 
         self._add_section_header(parent, sizer, "Groups")
-
-        add_label = wx.StaticText(parent, label="Add:")
-        add_label.SetForegroundColour(get_wx_color('text_secondary'))
-        sizer.Add(add_label, 0, wx.LEFT, 10)
-        add_wrap = wx.WrapSizer(wx.HORIZONTAL)
-        for group in self._all_groups:
-            cb_sizer = wx.BoxSizer(wx.HORIZONTAL)
-            cb = wx.CheckBox(parent, label="")
-            cb_sizer.Add(cb, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 3)
-            lbl = wx.StaticText(parent, label=group['name'])
-            lbl.SetForegroundColour(get_wx_color('text_primary'))
-            cb_sizer.Add(lbl, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 10)
-            add_wrap.Add(cb_sizer, 0, wx.TOP, 2)
-            self._group_add_cbs.append(cb)
-        sizer.Add(add_wrap, 0, wx.LEFT | wx.RIGHT, 20)
-
-        rm_label = wx.StaticText(parent, label="Remove:")
-        rm_label.SetForegroundColour(get_wx_color('text_secondary'))
-        sizer.Add(rm_label, 0, wx.LEFT | wx.TOP, 10)
-        rm_wrap = wx.WrapSizer(wx.HORIZONTAL)
-        for group in self._all_groups:
-            cb_sizer = wx.BoxSizer(wx.HORIZONTAL)
-            cb = wx.CheckBox(parent, label="")
-            cb_sizer.Add(cb, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 3)
-            lbl = wx.StaticText(parent, label=group['name'])
-            lbl.SetForegroundColour(get_wx_color('text_primary'))
-            cb_sizer.Add(lbl, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 10)
-            rm_wrap.Add(cb_sizer, 0, wx.TOP, 2)
-            self._group_remove_cbs.append(cb)
-        sizer.Add(rm_wrap, 0, wx.LEFT | wx.RIGHT | wx.BOTTOM, 20)
+        self._group_add_clb, self._group_remove_clb = self._build_add_remove_lists(
+            parent, sizer, [g['name'] for g in self._all_groups])
 
     # ── Classification ────────────────────────────────────
 
@@ -1433,45 +1573,30 @@ class BatchEditDialog(wx.Dialog):
         self._add_section_header(parent, sizer, "Classification")
 
         # Archetype
-        arch_row = self._make_enable_row(parent, sizer, 'archetype', "Archetype:")
-        arch_ctrl = wx.TextCtrl(parent)
-        arch_ctrl.SetBackgroundColour(get_wx_color('bg_input'))
-        arch_ctrl.SetForegroundColour(get_wx_color('text_primary'))
-        arch_row.Add(arch_ctrl, 1)
-        sizer.Add(arch_row, 0, wx.EXPAND | wx.LEFT | wx.RIGHT, 10)
-        self._field_ctrls['archetype'] = arch_ctrl
+        self._add_classification_row(parent, sizer, 'archetype', "Archetype:",
+                                     self._make_text_ctrl(parent), _CTRL_TEXT, top=False)
 
         # Rank (deck-type-specific)
         ranks = self.RANKS.get(self.cartomancy_type)
         if ranks:
             rank_label = "Hexagram Number:" if self.cartomancy_type == 'I Ching' else "Rank:"
-            rank_row = self._make_enable_row(parent, sizer, 'rank', rank_label)
-            rank_ctrl = wx.Choice(parent, choices=ranks)
-            rank_row.Add(rank_ctrl, 1)
-            sizer.Add(rank_row, 0, wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, 10)
-            self._field_ctrls['rank'] = rank_ctrl
+            self._add_classification_row(parent, sizer, 'rank', rank_label,
+                                         wx.Choice(parent, choices=ranks), _CTRL_CHOICE)
 
         # Suit
         suits = self.SUITS.get(self.cartomancy_type)
         if self.cartomancy_type == 'I Ching':
-            suit_row = self._make_enable_row(parent, sizer, 'suit', "Pinyin:")
-            suit_ctrl = wx.TextCtrl(parent)
-            suit_ctrl.SetBackgroundColour(get_wx_color('bg_input'))
-            suit_ctrl.SetForegroundColour(get_wx_color('text_primary'))
-            suit_row.Add(suit_ctrl, 1)
-            sizer.Add(suit_row, 0, wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, 10)
-            self._field_ctrls['suit'] = suit_ctrl
+            self._add_classification_row(parent, sizer, 'suit', "Pinyin:",
+                                         self._make_text_ctrl(parent), _CTRL_TEXT)
         elif suits:
             suit_label = "Playing Card Suit:" if self.cartomancy_type == 'Lenormand' else "Suit:"
-            suit_row = self._make_enable_row(parent, sizer, 'suit', suit_label)
-            suit_ctrl = wx.Choice(parent, choices=suits)
-            suit_row.Add(suit_ctrl, 1)
-            sizer.Add(suit_row, 0, wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, 10)
-            self._field_ctrls['suit'] = suit_ctrl
+            self._add_classification_row(parent, sizer, 'suit', suit_label,
+                                         wx.Choice(parent, choices=suits), _CTRL_CHOICE)
 
     # ── Notes ─────────────────────────────────────────────
 
     def _build_notes_section(self, parent, sizer):
+        text_primary = get_wx_color('text_primary')
         self._add_section_header(parent, sizer, "Notes")
 
         top_row = wx.BoxSizer(wx.HORIZONTAL)
@@ -1480,7 +1605,7 @@ class BatchEditDialog(wx.Dialog):
         self._enable_cbs['notes'] = cb
 
         notes_label = wx.StaticText(parent, label="Notes:")
-        notes_label.SetForegroundColour(get_wx_color('text_primary'))
+        notes_label.SetForegroundColour(text_primary)
         top_row.Add(notes_label, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 15)
 
         # Append / Replace radio buttons
@@ -1488,23 +1613,21 @@ class BatchEditDialog(wx.Dialog):
         rb_append.SetValue(True)
         top_row.Add(rb_append, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 3)
         append_lbl = wx.StaticText(parent, label="Append")
-        append_lbl.SetForegroundColour(get_wx_color('text_primary'))
+        append_lbl.SetForegroundColour(text_primary)
         top_row.Add(append_lbl, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 15)
 
         rb_replace = wx.RadioButton(parent, label="")
         top_row.Add(rb_replace, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 3)
         replace_lbl = wx.StaticText(parent, label="Replace")
-        replace_lbl.SetForegroundColour(get_wx_color('text_primary'))
+        replace_lbl.SetForegroundColour(text_primary)
         top_row.Add(replace_lbl, 0, wx.ALIGN_CENTER_VERTICAL)
 
         self._notes_mode = rb_append
         sizer.Add(top_row, 0, wx.LEFT | wx.RIGHT, 10)
 
-        notes_ctrl = wx.TextCtrl(parent, style=wx.TE_MULTILINE, size=(-1, 80))
-        notes_ctrl.SetBackgroundColour(get_wx_color('bg_input'))
-        notes_ctrl.SetForegroundColour(get_wx_color('text_primary'))
+        notes_ctrl = self._make_text_ctrl(parent, style=wx.TE_MULTILINE, size=(-1, 80))
         sizer.Add(notes_ctrl, 0, wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, 10)
-        self._field_ctrls['notes'] = notes_ctrl
+        self._field_ctrls['notes'] = (notes_ctrl, _CTRL_TEXT)
 
     # ── Custom Fields ─────────────────────────────────────
 
@@ -1519,18 +1642,14 @@ class BatchEditDialog(wx.Dialog):
             fname = field['field_name']
             ftype = field['field_type']
 
-            row = wx.BoxSizer(wx.HORIZONTAL)
-            cb = wx.CheckBox(parent, label="")
-            row.Add(cb, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
-            lbl = wx.StaticText(parent, label=f"{fname}:")
-            lbl.SetForegroundColour(get_wx_color('text_primary'))
-            row.Add(lbl, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 10)
-
-            ctrl = None
+            options = None
+            kind = _CTRL_TEXT
             if ftype == 'checkbox':
                 ctrl = wx.CheckBox(parent, label="")
+                kind = _CTRL_CHECK
             elif ftype == 'number':
                 ctrl = wx.SpinCtrl(parent, min=-9999, max=9999)
+                kind = _CTRL_SPIN
             elif ftype == 'select':
                 options = ['']
                 if field['field_options']:
@@ -1539,44 +1658,45 @@ class BatchEditDialog(wx.Dialog):
                     except (json.JSONDecodeError, ValueError):
                         pass
                 ctrl = wx.Choice(parent, choices=options)
+                kind = _CTRL_CHOICE
             elif ftype == 'multiline':
-                ctrl = wx.TextCtrl(parent, style=wx.TE_MULTILINE, size=(-1, 60))
-                ctrl.SetBackgroundColour(get_wx_color('bg_input'))
-                ctrl.SetForegroundColour(get_wx_color('text_primary'))
+                ctrl = self._make_text_ctrl(parent, style=wx.TE_MULTILINE, size=(-1, 60))
             else:
-                ctrl = wx.TextCtrl(parent)
-                ctrl.SetBackgroundColour(get_wx_color('bg_input'))
-                ctrl.SetForegroundColour(get_wx_color('text_primary'))
+                ctrl = self._make_text_ctrl(parent)
 
-            if ctrl:
-                if ftype == 'multiline':
-                    row.Add(ctrl, 1, wx.EXPAND)
-                else:
-                    row.Add(ctrl, 1)
-
-            sizer.Add(row, 0, wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, 10)
-            self._custom_field_cbs[fname] = cb
-            self._custom_field_ctrls[fname] = (ctrl, ftype)
+            self._custom_field_cbs[fname] = self._make_field_row(
+                parent, sizer, f"{fname}:", ctrl, expand=(ftype == 'multiline'))
+            self._custom_field_ctrls[fname] = (ctrl, kind, options)
 
     # ── Apply Logic ───────────────────────────────────────
 
     def _on_apply(self, event):
         """Apply batch changes to all selected cards."""
+        if not self.card_ids:
+            self.EndModal(wx.ID_CANCEL)
+            return
+
         # Gather which tags/groups to add/remove
-        tags_to_add = {self._all_tags[i]['id'] for i, cb in enumerate(self._tag_add_cbs) if cb.GetValue()}
-        tags_to_remove = {self._all_tags[i]['id'] for i, cb in enumerate(self._tag_remove_cbs) if cb.GetValue()}
-        groups_to_add = {self._all_groups[i]['id'] for i, cb in enumerate(self._group_add_cbs) if cb.GetValue()}
-        groups_to_remove = {self._all_groups[i]['id'] for i, cb in enumerate(self._group_remove_cbs) if cb.GetValue()}
+        def checked_ids(clb, ids):
+            if not ids:
+                return _EMPTY
+            checked = clb.GetCheckedItems()
+            return frozenset(ids[i] for i in checked) if checked else _EMPTY
+
+        tags_to_add = checked_ids(self._tag_add_clb, self._all_tag_ids)
+        tags_to_remove = checked_ids(self._tag_remove_clb, self._all_tag_ids)
+        groups_to_add = checked_ids(self._group_add_clb, self._all_group_ids)
+        groups_to_remove = checked_ids(self._group_remove_clb, self._all_group_ids)
 
         # Classification values (only if enabled)
         set_archetype = None
         if self._enable_cbs.get('archetype') and self._enable_cbs['archetype'].GetValue():
-            set_archetype = self._field_ctrls['archetype'].GetValue().strip() or None
+            set_archetype = self._field_ctrls['archetype'][0].GetValue().strip() or None
 
         set_rank = None
         if self._enable_cbs.get('rank') and self._enable_cbs['rank'].GetValue():
-            ctrl = self._field_ctrls['rank']
-            if isinstance(ctrl, wx.Choice):
+            ctrl, kind = self._field_ctrls['rank']
+            if kind == _CTRL_CHOICE:
                 sel = ctrl.GetSelection()
                 set_rank = ctrl.GetString(sel) if sel > 0 else None
             else:
@@ -1584,8 +1704,8 @@ class BatchEditDialog(wx.Dialog):
 
         set_suit = None
         if self._enable_cbs.get('suit') and self._enable_cbs['suit'].GetValue():
-            ctrl = self._field_ctrls['suit']
-            if isinstance(ctrl, wx.Choice):
+            ctrl, kind = self._field_ctrls['suit']
+            if kind == _CTRL_CHOICE:
                 sel = ctrl.GetSelection()
                 set_suit = ctrl.GetString(sel) if sel > 0 else None
             else:
@@ -1595,21 +1715,17 @@ class BatchEditDialog(wx.Dialog):
         set_notes = None
         notes_append = True
         if self._enable_cbs.get('notes') and self._enable_cbs['notes'].GetValue():
-            set_notes = self._field_ctrls['notes'].GetValue()
+            set_notes = self._field_ctrls['notes'][0].GetValue()
             notes_append = self._notes_mode.GetValue()
 
         # Custom fields
         custom_updates = {}
         for fname, cb in self._custom_field_cbs.items():
             if cb.GetValue():
-                ctrl, ftype = self._custom_field_ctrls[fname]
-                if ftype == 'checkbox':
-                    custom_updates[fname] = ctrl.GetValue()
-                elif ftype == 'number':
-                    custom_updates[fname] = ctrl.GetValue()
-                elif ftype == 'select':
+                ctrl, kind, options = self._custom_field_ctrls[fname]
+                if kind == _CTRL_CHOICE:
                     sel = ctrl.GetSelection()
-                    custom_updates[fname] = ctrl.GetString(sel) if sel > 0 else ''
+                    custom_updates[fname] = options[sel] if sel > 0 else ''
                 else:
                     custom_updates[fname] = ctrl.GetValue()
 
@@ -1622,54 +1738,56 @@ class BatchEditDialog(wx.Dialog):
             wx.MessageBox("No changes selected.", "Nothing to Apply", wx.OK | wx.ICON_INFORMATION)
             return
 
-        # Apply to each card
-        for card_id in self.card_ids:
-            # Tags
-            if tags_to_add or tags_to_remove:
-                current = {t['id'] for t in self.db.get_tags_for_card(card_id)}
-                updated = (current | tags_to_add) - tags_to_remove
-                self.db.set_card_tags(card_id, list(updated))
-
-            # Groups
-            if groups_to_add or groups_to_remove:
-                current = {g['id'] for g in self.db.get_groups_for_card(card_id)}
-                updated = (current | groups_to_add) - groups_to_remove
-                self.db.set_card_groups(card_id, list(updated))
-
-            # Classification + Notes
-            meta_kwargs = {}
-            if set_archetype is not None:
-                meta_kwargs['archetype'] = set_archetype
-            if set_rank is not None:
-                meta_kwargs['rank'] = set_rank
-            if set_suit is not None:
-                meta_kwargs['suit'] = set_suit
-
-            if set_notes is not None:
-                if notes_append:
-                    card = self.db.get_card_with_metadata(card_id)
-                    existing = card['notes'] or '' if card else ''
-                    if existing:
-                        meta_kwargs['notes'] = existing + "\n" + set_notes
-                    else:
-                        meta_kwargs['notes'] = set_notes
+        # Removal wins when a tag/group is ticked in both rows
+        if tags_to_remove:
+            tags_to_add -= tags_to_remove
+        if groups_to_remove:
+            groups_to_add -= groups_to_remove
+        membership_changes = tags_to_add or tags_to_remove or groups_to_add or groups_to_remove
+
+        db = self.db
+        get_tags = db.get_tags_for_card
+        set_tags = db.set_card_tags
+        add_tag = db.add_tag_to_card
+        get_groups = db.get_groups_for_card
+        set_groups = db.set_card_groups
+        add_group = db.add_card_to_group
+
+        # Apply to each card (all cards in one transaction)
+        with db.transaction():
+            for card_id in (self.card_ids if membership_changes else ()):
+                # Tags (adding only needs no read of the current set)
+                if tags_to_remove:
+                    current = {t['id'] for t in get_tags(card_id)}
+                    current.difference_update(tags_to_remove)
+                    current.update(tags_to_add)
+                    set_tags(card_id, list(current))
                 else:
-                    meta_kwargs['notes'] = set_notes
-
-            # Custom fields — merge with existing
-            if custom_updates:
-                card = self.db.get_card_with_metadata(card_id)
-                existing_cf = {}
-                if card and card['custom_fields']:
-                    try:
-                        existing_cf = json.loads(card['custom_fields']) if isinstance(card['custom_fields'], str) else card['custom_fields']
-                    except (json.JSONDecodeError, ValueError):
-                        pass
-                existing_cf.update(custom_updates)
-                meta_kwargs['custom_fields'] = existing_cf
-
-            if meta_kwargs:
-                self.db.update_card_metadata(card_id, **meta_kwargs)
+                    for tag_id in tags_to_add:
+                        add_tag(card_id, tag_id)
+
+                # Groups
+                if groups_to_remove:
+                    current = {g['id'] for g in get_groups(card_id)}
+                    current.difference_update(groups_to_remove)
+                    current.update(groups_to_add)
+                    set_groups(card_id, list(current))
+                else:
+                    for group_id in groups_to_add:
+                        add_group(card_id, group_id)
+
+            # Classification, notes and custom fields are the same for every
+            # card, so they go out as one prepared UPDATE (notes append and
+            # custom field merge happen in SQL)
+            db.bulk_update_card_metadata(
+                self.card_ids,
+                archetype=set_archetype,
+                rank=set_rank,
+                suit=set_suit,
+                notes=set_notes,
+                append_notes=notes_append,
+                custom_fields=custom_updates,
+            )
 
         self.applied = True
         self.EndModal(wx.ID_OK)
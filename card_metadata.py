@@ -6,7 +6,10 @@ ranks, and sort orders. Used by database.py for parsing card names and
 by mixin_library.py for sorting/categorizing cards in the UI.
 """
 
-from typing import Dict, List, Optional, Tuple
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
 # =============================================================================
 # TAROT - MAJOR ARCANA
@@ -39,91 +42,110 @@ MAJOR_ARCANA = [
     ("The World", 21),
 ]
 
+# One shared (canonical_name, number_string, "Major Arcana") tuple per card
+_MAJOR = {name: (name, str(num), 'Major Arcana') for name, num in MAJOR_ARCANA}
+
 # Aliases that map to canonical Major Arcana names
 # Each alias maps to (canonical_name, number_string, "Major Arcana")
-MAJOR_ARCANA_ALIASES: Dict[str, Tuple[str, str, str]] = {
+MAJOR_ARCANA_ALIASES: Mapping[str, Tuple[str, str, str]] = MappingProxyType({
     # The Fool (0)
-    'fool': ('The Fool', '0', 'Major Arcana'),
-    'the fool': ('The Fool', '0', 'Major Arcana'),
+    'fool': _MAJOR['The Fool'],
+    'the fool': _MAJOR['The Fool'],
     # The Magician (1)
-    'magician': ('The Magician', '1', 'Major Arcana'),
-    'the magician': ('The Magician', '1', 'Major Arcana'),
-    'magus': ('The Magician', '1', 'Major Arcana'),  # Thoth
-    'the magus': ('The Magician', '1', 'Major Arcana'),
+    'magician': _MAJOR['The Magician'],
+    'the magician': _MAJOR['The Magician'],
+    'magus': _MAJOR['The Magician'],  # Thoth
+    'the magus': _MAJOR['The Magician'],
     # The High Priestess (2)
-    'high priestess': ('The High Priestess', '2', 'Major Arcana'),
-    'the high priestess': ('The High Priestess', '2', 'Major Arcana'),
-    'priestess': ('The High Priestess', '2', 'Major Arcana'),
-    'the priestess': ('The High Priestess', '2', 'Major Arcana'),
+    'high priestess': _MAJOR['The High Priestess'],
+    'the high priestess': _MAJOR['The High Priestess'],
+    'priestess': _MAJOR['The High Priestess'],
+    'the priestess': _MAJOR['The High Priestess'],
     # The Empress (3)
-    'empress': ('The Empress', '3', 'Major Arcana'),
-    'the empress': ('The Empress', '3', 'Major Arcana'),
+    'empress': _MAJOR['The Empress'],
+    'the empress': _MAJOR['The Empress'],
     # The Emperor (4)
-    'emperor': ('The Emperor', '4', 'Major Arcana'),
-    'the emperor': ('The Emperor', '4', 'Major Arcana'),
+    'emperor': _MAJOR['The Emperor'],
+    'the emperor': _MAJOR['The Emperor'],
     # The Hierophant (5)
-    'hierophant': ('The Hierophant', '5', 'Major Arcana'),
-    'the hierophant': ('The Hierophant', '5', 'Major Arcana'),
-    'high priest': ('The Hierophant', '5', 'Major Arcana'),
-    'the high priest': ('The Hierophant', '5', 'Major Arcana'),
+    'hierophant': _MAJOR['The Hierophant'],
+    'the hierophant': _MAJOR['The Hierophant'],
+    'high priest': _MAJOR['The Hierophant'],
+    'the high priest': _MAJOR['The Hierophant'],
     # The Lovers (6)
-    'lovers': ('The Lovers', '6', 'Major Arcana'),
-    'the lovers': ('The Lovers', '6', 'Major Arcana'),
+    'lovers': _MAJOR['The Lovers'],
+    'the lovers': _MAJOR['The Lovers'],
     # The Chariot (7)
-    'chariot': ('The Chariot', '7', 'Major Arcana'),
-    'the chariot': ('The Chariot', '7', 'Major Arcana'),
+    'chariot': _MAJOR['The Chariot'],
+    'the chariot': _MAJOR['The Chariot'],
     # Strength (8)
-    'strength': ('Strength', '8', 'Major Arcana'),
-    'lust': ('Strength', '8', 'Major Arcana'),  # Thoth
+    'strength': _MAJOR['Strength'],
+    'lust': _MAJOR['Strength'],  # Thoth
     # The Hermit (9)
-    'hermit': ('The Hermit', '9', 'Major Arcana'),
-    'the hermit': ('The Hermit', '9', 'Major Arcana'),
+    'hermit': _MAJOR['The Hermit'],
+    'the hermit': _MAJOR['The Hermit'],
     # Wheel of Fortune (10)
-    'wheel of fortune': ('Wheel of Fortune', '10', 'Major Arcana'),
-    'the wheel of fortune': ('Wheel of Fortune', '10', 'Major Arcana'),
-    'wheel': ('Wheel of Fortune', '10', 'Major Arcana'),
-    'fortune': ('Wheel of Fortune', '10', 'Major Arcana'),
+    'wheel of fortune': _MAJOR['Wheel of Fortune'],
+    'the wheel of fortune': _MAJOR['Wheel of Fortune'],
+    'wheel': _MAJOR['Wheel of Fortune'],
+    'fortune': _MAJOR['Wheel of Fortune'],
     # Justice (11)
-    'justice': ('Justice', '11', 'Major Arcana'),
-    'adjustment': ('Justice', '11', 'Major Arcana'),  # Thoth
+    'justice': _MAJOR['Justice'],
+    'adjustment': _MAJOR['Justice'],  # Thoth
     # The Hanged Man (12)
-    'hanged man': ('The Hanged Man', '12', 'Major Arcana'),
-    'the hanged man': ('The Hanged Man', '12', 'Major Arcana'),
+    'hanged man': _MAJOR['The Hanged Man'],
+    'the hanged man': _MAJOR['The Hanged Man'],
     # Death (13)
-    'death': ('Death', '13', 'Major Arcana'),
+    'death': _MAJOR['Death'],
     # Temperance (14)
-    'temperance': ('Temperance', '14', 'Major Arcana'),
-    'art': ('Temperance', '14', 'Major Arcana'),  # Thoth
+    'temperance': _MAJOR['Temperance'],
+    'art': _MAJOR['Temperance'],  # Thoth
     # The Devil (15)
-    'devil': ('The Devil', '15', 'Major Arcana'),
-    'the devil': ('The Devil', '15', 'Major Arcana'),
+    'devil': _MAJOR['The Devil'],
+    'the devil': _MAJOR['The Devil'],
     # The Tower (16)
-    'tower': ('The Tower', '16', 'Major Arcana'),
-    'the tower': ('The Tower', '16', 'Major Arcana'),
+    'tower': _MAJOR['The Tower'],
+    'the tower': _MAJOR['The Tower'],
     # The Star (17)
-    'star': ('The Star', '17', 'Major Arcana'),
-    'the star': ('The Star', '17', 'Major Arcana'),
+    'star': _MAJOR['The Star'],
+    'the star': _MAJOR['The Star'],
     # The Moon (18)
-    'moon': ('The Moon', '18', 'Major Arcana'),
-    'the moon': ('The Moon', '18', 'Major Arcana'),
+    'moon': _MAJOR['The Moon'],
+    'the moon': _MAJOR['The Moon'],
     # The Sun (19)
-    'sun': ('The Sun', '19', 'Major Arcana'),
-    'the sun': ('The Sun', '19', 'Major Arcana'),
+    'sun': _MAJOR['The Sun'],
+    'the sun': _MAJOR['The Sun'],
     # Judgement (20)
-    'judgement': ('Judgement', '20', 'Major Arcana'),
-    'judgment': ('Judgement', '20', 'Major Arcana'),  # US spelling
-    'the aeon': ('Judgement', '20', 'Major Arcana'),  # Thoth
-    'aeon': ('Judgement', '20', 'Major Arcana'),
+    'judgement': _MAJOR['Judgement'],
+    'judgment': _MAJOR['Judgement'],  # US spelling
+    'the aeon': _MAJOR['Judgement'],  # Thoth
+    'aeon': _MAJOR['Judgement'],
     # The World (21)
-    'world': ('The World', '21', 'Major Arcana'),
-    'the world': ('The World', '21', 'Major Arcana'),
-    'universe': ('The World', '21', 'Major Arcana'),  # Thoth
-    'the universe': ('The World', '21', 'Major Arcana'),
-}
+    'world': _MAJOR['The World'],
+    'the world': _MAJOR['The World'],
+    'universe': _MAJOR['The World'],  # Thoth
+    'the universe': _MAJOR['The World'],
+})
+
+# Bound lookup for callers that already hold a lowercased name
+get_major_arcana = MAJOR_ARCANA_ALIASES.get
+
+
+def _fold(name: str) -> str:
+    """Normalize a card name for alias lookup (ASCII names take the cheaper lower())."""
+    name = name.strip()
+    return name.lower() if name.isascii() else name.casefold()
+
+
+def lookup_major(name: str) -> Optional[Tuple[str, str, str]]:
+    """Look up a Major Arcana card by any alias, ignoring case."""
+    return get_major_arcana(_fold(name))
+
 
 # Quick lookup: alias -> sort order (0-21)
+_MAJOR_NUM = {name: num for name, num in MAJOR_ARCANA}
 MAJOR_ARCANA_ORDER: Dict[str, int] = {
-    alias: int(info[1]) for alias, info in MAJOR_ARCANA_ALIASES.items()
+    alias: _MAJOR_NUM[info[0]] for alias, info in MAJOR_ARCANA_ALIASES.items()
 }
 
 # =============================================================================
@@ -200,6 +222,8 @@ TAROT_RANK_ALIASES: Dict[str, Tuple[str, int]] = {
     'king': ('King', 14),
 }
 
+get_tarot_rank = TAROT_RANK_ALIASES.get
+
 # Quick lookup for sorting: rank_alias -> sort_order (1-14)
 TAROT_RANK_ORDER: Dict[str, int] = {
     alias: info[1] for alias, info in TAROT_RANK_ALIASES.items()
@@ -250,102 +274,93 @@ LENORMAND_CARDS = [
     ("Cross", 36, "Clubs"),
 ]
 
+# One shared (canonical_name, number_string) tuple per card
+_LEN = {name: (name, str(num)) for name, num, _ in LENORMAND_CARDS}
+
 # Aliases for Lenormand card names -> (canonical_name, number_string)
-LENORMAND_ALIASES: Dict[str, Tuple[str, str]] = {
+LENORMAND_ALIASES: Mapping[str, Tuple[str, str]] = MappingProxyType({
     # Rider (1)
-    'rider': ('Rider', '1'), 'cavalier': ('Rider', '1'),
+    'rider': _LEN['Rider'], 'cavalier': _LEN['Rider'],
     # Clover (2)
-    'clover': ('Clover', '2'),
+    'clover': _LEN['Clover'],
     # Ship (3)
-    'ship': ('Ship', '3'),
+    'ship': _LEN['Ship'],
     # House (4)
-    'house': ('House', '4'),
+    'house': _LEN['House'],
     # Tree (5)
-    'tree': ('Tree', '5'),
+    'tree': _LEN['Tree'],
     # Clouds (6)
-    'clouds': ('Clouds', '6'), 'cloud': ('Clouds', '6'),
+    'clouds': _LEN['Clouds'], 'cloud': _LEN['Clouds'],
     # Snake (7)
-    'snake': ('Snake', '7'),
+    'snake': _LEN['Snake'],
     # Coffin (8)
-    'coffin': ('Coffin', '8'),
+    'coffin': _LEN['Coffin'],
     # Bouquet (9)
-    'bouquet': ('Bouquet', '9'), 'flowers': ('Bouquet', '9'),
+    'bouquet': _LEN['Bouquet'], 'flowers': _LEN['Bouquet'],
     # Scythe (10)
-    'scythe': ('Scythe', '10'),
+    'scythe': _LEN['Scythe'],
     # Whip (11)
-    'whip': ('Whip', '11'), 'broom': ('Whip', '11'), 'birch': ('Whip', '11'),
+    'whip': _LEN['Whip'], 'broom': _LEN['Whip'], 'birch': _LEN['Whip'],
     # Birds (12)
-    'birds': ('Birds', '12'), 'owls': ('Birds', '12'),
+    'birds': _LEN['Birds'], 'owls': _LEN['Birds'],
     # Child (13)
-    'child': ('Child', '13'),
+    'child': _LEN['Child'],
     # Fox (14)
-    'fox': ('Fox', '14'),
+    'fox': _LEN['Fox'],
     # Bear (15)
-    'bear': ('Bear', '15'),
+    'bear': _LEN['Bear'],
     # Stars (16)
-    'stars': ('Stars', '16'), 'star': ('Stars', '16'),
+    'stars': _LEN['Stars'], 'star': _LEN['Stars'],
     # Stork (17)
-    'stork': ('Stork', '17'),
+    'stork': _LEN['Stork'],
     # Dog (18)
-    'dog': ('Dog', '18'),
+    'dog': _LEN['Dog'],
     # Tower (19)
-    'tower': ('Tower', '19'),
+    'tower': _LEN['Tower'],
     # Garden (20)
-    'garden': ('Garden', '20'),
+    'garden': _LEN['Garden'],
     # Mountain (21)
-    'mountain': ('Mountain', '21'),
+    'mountain': _LEN['Mountain'],
     # Crossroads (22)
-    'crossroads': ('Crossroads', '22'), 'crossroad': ('Crossroads', '22'),
-    'paths': ('Crossroads', '22'), 'path': ('Crossroads', '22'),
+    'crossroads': _LEN['Crossroads'], 'crossroad': _LEN['Crossroads'],
+    'paths': _LEN['Crossroads'], 'path': _LEN['Crossroads'],
     # Mice (23)
-    'mice': ('Mice', '23'), 'mouse': ('Mice', '23'),
+    'mice': _LEN['Mice'], 'mouse': _LEN['Mice'],
     # Heart (24)
-    'heart': ('Heart', '24'),
+    'heart': _LEN['Heart'],
     # Ring (25)
-    'ring': ('Ring', '25'),
+    'ring': _LEN['Ring'],
     # Book (26)
-    'book': ('Book', '26'),
+    'book': _LEN['Book'],
     # Letter (27)
-    'letter': ('Letter', '27'),
+    'letter': _LEN['Letter'],
     # Man (28)
-    'man': ('Man', '28'), 'gentleman': ('Man', '28'),
+    'man': _LEN['Man'], 'gentleman': _LEN['Man'],
     # Woman (29)
-    'woman': ('Woman', '29'), 'lady': ('Woman', '29'),
+    'woman': _LEN['Woman'], 'lady': _LEN['Woman'],
     # Lily (30)
-    'lily': ('Lily', '30'), 'lilies': ('Lily', '30'),
+    'lily': _LEN['Lily'], 'lilies': _LEN['Lily'],
     # Sun (31)
-    'sun': ('Sun', '31'),
+    'sun': _LEN['Sun'],
     # Moon (32)
-    'moon': ('Moon', '32'),
+    'moon': _LEN['Moon'],
     # Key (33)
-    'key': ('Key', '33'),
+    'key': _LEN['Key'],
     # Fish (34)
-    'fish': ('Fish', '34'),
+    'fish': _LEN['Fish'],
     # Anchor (35)
-    'anchor': ('Anchor', '35'),
+    'anchor': _LEN['Anchor'],
     # Cross (36)
-    'cross': ('Cross', '36'),
-}
+    'cross': _LEN['Cross'],
+})
+
+get_lenormand_card = LENORMAND_ALIASES.get
 
-# Maps Lenormand card name -> playing card suit for categorization
+# Maps Lenormand card name (and every alias) -> playing card suit for categorization
+_LEN_SUIT = {name: suit for name, _, suit in LENORMAND_CARDS}
 LENORMAND_SUIT_MAP: Dict[str, str] = {
-    name.lower(): suit for name, _, suit in LENORMAND_CARDS
+    alias: _LEN_SUIT[name] for alias, (name, _) in LENORMAND_ALIASES.items()
 }
-# Add aliases
-LENORMAND_SUIT_MAP.update({
-    'cavalier': 'Hearts',
-    'flowers': 'Spades',
-    'broom': 'Clubs',
-    'birch': 'Clubs',
-    'owls': 'Diamonds',
-    'crossroad': 'Diamonds',
-    'paths': 'Diamonds',
-    'path': 'Diamonds',
-    'mouse': 'Clubs',
-    'gentleman': 'Hearts',
-    'lady': 'Spades',
-    'lilies': 'Spades',
-})
 
 # =============================================================================
 # PLAYING CARDS
@@ -389,10 +404,92 @@ PLAYING_CARD_SUIT_BASES: Dict[str, int] = {
     'Diamonds': 400,
 }
 
+# =============================================================================
+# ALIAS MATCHERS
+# =============================================================================
+
+class _AliasMatcher:
+    """
+    Find the first alias (in table order) that occurs in a card name.
+
+    Substring tables are compiled into one regex of zero-width lookaheads, so
+    a single scan reports every alias occurrence; at each position the
+    alternation tries aliases in table order. Picking the occurrence with the
+    lowest table index reproduces the old "loop over the table, test `in`"
+    result exactly. Word tables are matched against the name's words instead.
+
+    With longest=True the name is instead split into non-overlapping
+    leftmost-longest alias matches before table order is applied, so an
+    alias inside a longer one ("man" in "woman") is not reported.
+    """
+
+    def __init__(self, aliases: Mapping, words: bool = False, longest: bool = False):
+        self._values = list(aliases.values())
+        self._index = {key: i for i, key in enumerate(aliases)}
+        self._words = words
+        if longest:
+            pattern = '|'.join(re.escape(key) for key in sorted(aliases, key=len, reverse=True))
+            self._finditer = re.compile(f'({pattern})').finditer
+        elif not words:
+            pattern = '|'.join(re.escape(key) for key in aliases)
+            self._finditer = re.compile(f'(?=({pattern}))').finditer
+
+    def __call__(self, text: str):
+        """Return the value of the first matching alias, or None."""
+        index = self._index
+        if self._words:
+            hits = [index[w] for w in text.split() if w in index]
+        else:
+            hits = [index[m.group(1)] for m in self._finditer(text)]
+        return self._values[min(hits)] if hits else None
+
+
+find_tarot_suit = _AliasMatcher(TAROT_SUIT_ALIASES)
+find_tarot_rank = _AliasMatcher(TAROT_RANK_ALIASES, words=True)
+find_lenormand_card = _AliasMatcher(LENORMAND_ALIASES, longest=True)
+find_playing_card_suit = _AliasMatcher(PLAYING_CARD_SUIT_ALIASES)
+find_playing_card_rank = _AliasMatcher(PLAYING_CARD_RANK_ALIASES, words=True)
+
+# Lenormand card number -> (name, rank), for names like "01 Rider"
+LENORMAND_BY_NUMBER: Dict[int, Tuple[str, str]] = {
+    num: _LEN[name] for name, num, _ in LENORMAND_CARDS
+}
+
+# Canonical Lenormand name -> parsed (archetype, rank, playing card suit)
+_LENORMAND_WITH_SUIT: Dict[str, Tuple[str, str, str]] = {
+    name: (name, str(num), suit) for name, num, suit in LENORMAND_CARDS
+}
+
+# Every Major Arcana alias and canonical minor name ("five of wands") -> parsed
+# (archetype, rank, suit), so standard names skip the alias scans entirely
+_TAROT_EXACT: Dict[str, Tuple[str, str, str]] = {
+    **MAJOR_ARCANA_ALIASES,
+    **{
+        f"{rank} of {suit}".lower(): (
+            f"{rank} of {suit}",
+            str(TAROT_SUIT_BASES[suit] + TAROT_RANK_ALIASES[rank.lower()][1]),
+            suit,
+        )
+        for suit in TAROT_SUITS for rank in TAROT_RANKS
+    },
+}
+
 # =============================================================================
 # PARSING HELPER FUNCTIONS
 # =============================================================================
 
+_LENORMAND_NUM_RE = re.compile(r'^(\d+)\D')
+
+
+def _alternation(aliases) -> str:
+    return '|'.join(re.escape(key) for key in sorted(aliases, key=len, reverse=True))
+
+
+# "<rank alias> of <suit alias>" as the whole name
+_MINOR_RE = re.compile(
+    rf'({_alternation(TAROT_RANK_ALIASES)})\s+of\s+({_alternation(TAROT_SUIT_ALIASES)})'
+)
+
 def parse_tarot_major_arcana(card_name_lower: str) -> Optional[Tuple[str, str, str]]:
     """
     Check if a card name matches a Major Arcana card.
@@ -404,9 +501,10 @@ def parse_tarot_major_arcana(card_name_lower: str) -> Optional[Tuple[str, str, s
         (archetype, rank, suit) tuple if match, None otherwise
         For Major Arcana: suit is always "Major Arcana", rank is the number (0-21)
     """
-    return MAJOR_ARCANA_ALIASES.get(card_name_lower)
+    return get_major_arcana(card_name_lower)
 
 
+@lru_cache(maxsize=512)
 def parse_tarot_minor_arcana(card_name_lower: str) -> Optional[Tuple[str, str, str]]:
     """
     Parse a Minor Arcana card name to extract archetype, rank, and suit.
@@ -420,33 +518,55 @@ def parse_tarot_minor_arcana(card_name_lower: str) -> Optional[Tuple[str, str, s
         rank: sort order as string (e.g. "105" for Wands + rank 5)
         suit: canonical suit name (e.g. "Wands")
     """
-    found_suit = None
-    found_rank = None
-    found_rank_num = None
-
-    # Find suit
-    for suit_key, suit_name in TAROT_SUIT_ALIASES.items():
-        if suit_key in card_name_lower:
-            found_suit = suit_name
-            break
-
-    # Find rank
-    words = card_name_lower.split()
-    for rank_key, (rank_name, rank_num) in TAROT_RANK_ALIASES.items():
-        if rank_key in words or card_name_lower.startswith(rank_key + ' '):
-            found_rank = rank_name
-            found_rank_num = rank_num
-            break
-
-    if found_suit and found_rank:
-        archetype = f"{found_rank} of {found_suit}"
-        rank = str(TAROT_SUIT_BASES[found_suit] + found_rank_num)
+    # Common "<rank> of <suit>" form: one match, then direct lookups
+    m = _MINOR_RE.fullmatch(card_name_lower)
+    if m:
+        found_suit = TAROT_SUIT_ALIASES[m.group(2)]
+        found_rank = TAROT_RANK_ALIASES[m.group(1)]
+    else:
+        found_suit = find_tarot_suit(card_name_lower)
+        found_rank = find_tarot_rank(card_name_lower) if found_suit else None
+
+    if found_rank:
+        rank_name, rank_num = found_rank
+        archetype = f"{rank_name} of {found_suit}"
+        rank = str(TAROT_SUIT_BASES[found_suit] + rank_num)
         return archetype, rank, found_suit
 
     return None
 
 
-def parse_lenormand_card(card_name: str, card_name_lower: str) -> Optional[Tuple[str, str, None]]:
+def parse_tarot_card(card_name_lower: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Parse any Tarot card name (Major or Minor Arcana).
+
+    Args:
+        card_name_lower: Lowercase card name
+
+    Returns:
+        (archetype, rank, suit) tuple if match, None otherwise
+    """
+    return _TAROT_EXACT.get(card_name_lower) or parse_tarot_minor_arcana(card_name_lower)
+
+
+def parse_cards_batch(names: List[str]) -> List[Optional[Tuple[str, str, str]]]:
+    """
+    Parse a list of Tarot card names in one pass.
+
+    Args:
+        names: Card names as entered (any case, may be empty)
+
+    Returns:
+        List parallel to names of (archetype, rank, suit) tuples or None
+    """
+    exact = _TAROT_EXACT.get
+    minor = parse_tarot_minor_arcana
+    lowered = [name.lower().strip() if name else '' for name in names]
+    return [exact(name) or (minor(name) if name else None) for name in lowered]
+
+
+@lru_cache(maxsize=512)
+def parse_lenormand_card(card_name: str, card_name_lower: str) -> Optional[Tuple[str, str, str]]:
     """
     Parse a Lenormand card name.
 
@@ -455,31 +575,37 @@ def parse_lenormand_card(card_name: str, card_name_lower: str) -> Optional[Tuple
         card_name_lower: Lowercase card name
 
     Returns:
-        (archetype, rank, None) tuple if match, None otherwise
+        (archetype, rank, suit) tuple if match, None otherwise
         archetype: canonical card name (e.g. "Rider")
         rank: card number as string (e.g. "1")
-        suit: always None for Lenormand
+        suit: associated playing card suit (e.g. "Hearts")
     """
-    import re
-
     # Try alias match first
-    for key, (name, rank) in LENORMAND_ALIASES.items():
-        if key in card_name_lower:
-            return name, rank, None
+    found = find_lenormand_card(card_name_lower)
+    if found:
+        return _LENORMAND_WITH_SUIT[found[0]]
 
     # Try matching by number prefix (e.g., "01 Rider", "1. Rider")
-    num_match = re.match(r'^(\d+)\D', card_name)
+    num_match = _LENORMAND_NUM_RE.match(card_name)
     if num_match:
-        num = int(num_match.group(1))
-        if 1 <= num <= 36:
-            # Find the card with this number
-            for key, (name, rank) in LENORMAND_ALIASES.items():
-                if rank == str(num):
-                    return name, rank, None
+        found = LENORMAND_BY_NUMBER.get(int(num_match.group(1)))
+        if found:
+            return _LENORMAND_WITH_SUIT[found[0]]
 
     return None
 
 
+# Joker parse results and sort values by color
+_JOKERS = {'red': ('Red Joker', 'Joker', None), 'black': ('Black Joker', 'Joker', None)}
+_JOKER_SORT = {'red': 1, 'black': 2}
+
+
+def _joker_color(card_name_lower: str) -> str:
+    """'black' only for black jokers; red wins if both appear and is the default."""
+    return 'black' if 'black' in card_name_lower and 'red' not in card_name_lower else 'red'
+
+
+@lru_cache(maxsize=512)
 def parse_playing_card(card_name_lower: str) -> Optional[Tuple[str, str, str]]:
     """
     Parse a playing card name.
@@ -492,30 +618,15 @@ def parse_playing_card(card_name_lower: str) -> Optional[Tuple[str, str, str]]:
     """
     # Check for joker
     if 'joker' in card_name_lower:
-        if 'red' in card_name_lower:
-            return 'Red Joker', 'Joker', None
-        elif 'black' in card_name_lower:
-            return 'Black Joker', 'Joker', None
-        else:
-            return 'Red Joker', 'Joker', None  # Default to red
+        return _JOKERS[_joker_color(card_name_lower)]
 
-    found_suit = None
-    found_rank = None
+    found_suit = find_playing_card_suit(card_name_lower)
+    found_rank = find_playing_card_rank(card_name_lower) if found_suit else None
 
-    for suit_key, suit_name in PLAYING_CARD_SUIT_ALIASES.items():
-        if suit_key in card_name_lower:
-            found_suit = suit_name
-            break
-
-    words = card_name_lower.split()
-    for rank_key, (rank_name, _) in PLAYING_CARD_RANK_ALIASES.items():
-        if rank_key in words or card_name_lower.startswith(rank_key + ' '):
-            found_rank = rank_name
-            break
-
-    if found_suit and found_rank:
-        archetype = f"{found_rank} of {found_suit}"
-        return archetype, found_rank, found_suit
+    if found_rank:
+        rank_name = found_rank[0]
+        archetype = f"{rank_name} of {found_suit}"
+        return archetype, rank_name, found_suit
 
     return None
 
@@ -533,6 +644,18 @@ def get_lenormand_suit(card_name_lower: str) -> Optional[str]:
     return LENORMAND_SUIT_MAP.get(card_name_lower.strip())
 
 
+# Custom suit name keys and the base they sort under
+_CUSTOM_SUIT_KEYS = (('wands', 100), ('cups', 200), ('swords', 300), ('pentacles', 400))
+
+# Suit name -> sort base for get_tarot_sort_key, in match priority order.
+# Custom names slot in between the canonical names and this tail.
+_SUIT_ORDER_TAIL: Dict[str, int] = {
+    **{suit.lower(): base for suit, base in TAROT_SUIT_BASES.items()},
+    **{alias: TAROT_SUIT_BASES[canonical] for alias, canonical in TAROT_SUIT_ALIASES.items()},
+}
+_STATIC_SUIT_ORDER: Dict[str, int] = {**TAROT_SUIT_BASES, **_SUIT_ORDER_TAIL}
+
+
 def get_tarot_sort_key(card_name_lower: str, custom_suit_names: Optional[Dict] = None):
     """
     Get a sort key for a tarot card name.
@@ -546,26 +669,33 @@ def get_tarot_sort_key(card_name_lower: str, custom_suit_names: Optional[Dict] =
         card_name_lower: Lowercase card name
         custom_suit_names: Optional dict mapping 'wands'/'cups'/'swords'/'pentacles' to custom names
     """
+    if not custom_suit_names:
+        hit = _TAROT_EXACT_SORT.get(card_name_lower)
+        if hit:
+            return hit
+
+    custom_names = None
+    if custom_suit_names:
+        # Hashable form of the dict so results can be cached
+        custom_names = tuple(custom_suit_names.get(key, '').lower() for key, _ in _CUSTOM_SUIT_KEYS)
+    return _tarot_sort_key(card_name_lower, custom_names)
+
+
+@lru_cache(maxsize=512)
+def _tarot_sort_key(card_name_lower: str, custom_names: Optional[Tuple[str, ...]]):
+    """get_tarot_sort_key with custom suit names as a tuple parallel to _CUSTOM_SUIT_KEYS."""
     # Check Major Arcana
     if card_name_lower in MAJOR_ARCANA_ORDER:
         return (0, MAJOR_ARCANA_ORDER[card_name_lower], 0)
 
     # Check Minor Arcana
-    # Build suit order including custom names
-    suit_order = dict(TAROT_SUIT_BASES)
-    if custom_suit_names:
-        for key, base in [('wands', 100), ('cups', 200), ('swords', 300), ('pentacles', 400)]:
-            custom = custom_suit_names.get(key, '').lower()
-            if custom:
-                suit_order[custom] = base
-
-    # Also add lowercase canonical names
-    for suit, base in TAROT_SUIT_BASES.items():
-        suit_order[suit.lower()] = base
-
-    # Add common aliases
-    for alias, canonical in TAROT_SUIT_ALIASES.items():
-        suit_order[alias] = TAROT_SUIT_BASES[canonical]
+    # Suit order including custom names (only rebuilt when there are any)
+    suit_order = _STATIC_SUIT_ORDER
+    if custom_names:
+        custom_order = {custom: base for (_, base), custom in zip(_CUSTOM_SUIT_KEYS, custom_names)
+                        if custom}
+        if custom_order:
+            suit_order = {**TAROT_SUIT_BASES, **custom_order, **_SUIT_ORDER_TAIL}
 
     # Find suit in card name
     for suit_name, suit_val in suit_order.items():
@@ -579,6 +709,46 @@ def get_tarot_sort_key(card_name_lower: str, custom_suit_names: Optional[Dict] =
     return (2, 999, 0)
 
 
+# Sort keys for every standard tarot name (Major Arcana aliases and
+# canonical minor names), for decks without custom suit names
+_TAROT_EXACT_SORT: Dict[str, Tuple[int, int, int]] = {
+    name: _tarot_sort_key.__wrapped__(name, None) for name in _TAROT_EXACT
+}
+
+
+# Suit substrings and their sort base, checked in this order
+_PC_SORT_SUITS = (
+    ('spades', 100), ('spade', 100),
+    ('hearts', 200), ('heart', 200),
+    ('clubs', 300), ('club', 300),
+    ('diamonds', 400), ('diamond', 400),
+)
+
+# Ranks: 2-10, J, Q, K, A (2=1, ..., K=12, A=13)
+_PC_RANK_VALUES: Dict[str, int] = {
+    'two': 1, '2': 1,
+    'three': 2, '3': 2,
+    'four': 3, '4': 3,
+    'five': 4, '5': 4,
+    'six': 5, '6': 5,
+    'seven': 6, '7': 6,
+    'eight': 7, '8': 7,
+    'nine': 8, '9': 8,
+    'ten': 9, '10': 9,
+    'jack': 10, 'j': 10,
+    'queen': 11, 'q': 11,
+    'king': 12, 'k': 12,
+    'ace': 13, 'a': 13,
+}
+
+# (" of" probe, prefix probe, value) per rank, with the strings built once
+_PC_RANK_PROBES = tuple(
+    (f'{rank_name} of', rank_name + ' ', rank_val)
+    for rank_name, rank_val in _PC_RANK_VALUES.items()
+)
+
+
+@lru_cache(maxsize=512)
 def get_playing_card_sort_key(card_name_lower: str):
     """
     Get a sort key for a playing card name.
@@ -589,36 +759,13 @@ def get_playing_card_sort_key(card_name_lower: str):
     """
     # Jokers come first
     if 'joker' in card_name_lower:
-        if 'red' in card_name_lower:
-            return 1
-        elif 'black' in card_name_lower:
-            return 2
-        return 1
+        return _JOKER_SORT[_joker_color(card_name_lower)]
 
     # Find suit and rank
-    for suit_name, suit_base in [('spades', 100), ('spade', 100),
-                                  ('hearts', 200), ('heart', 200),
-                                  ('clubs', 300), ('club', 300),
-                                  ('diamonds', 400), ('diamond', 400)]:
+    for suit_name, suit_base in _PC_SORT_SUITS:
         if suit_name in card_name_lower:
-            # Ranks: 2-10, J, Q, K, A (2=1, ..., K=12, A=13)
-            rank_values = {
-                'two': 1, '2': 1,
-                'three': 2, '3': 2,
-                'four': 3, '4': 3,
-                'five': 4, '5': 4,
-                'six': 5, '6': 5,
-                'seven': 6, '7': 6,
-                'eight': 7, '8': 7,
-                'nine': 8, '9': 8,
-                'ten': 9, '10': 9,
-                'jack': 10, 'j': 10,
-                'queen': 11, 'q': 11,
-                'king': 12, 'k': 12,
-                'ace': 13, 'a': 13,
-            }
-            for rank_name, rank_val in rank_values.items():
-                if f'{rank_name} of' in card_name_lower or card_name_lower.startswith(rank_name + ' '):
+            for of_probe, prefix, rank_val in _PC_RANK_PROBES:
+                if of_probe in card_name_lower or card_name_lower.startswith(prefix):
                     return suit_base + rank_val
             return suit_base + 50  # Unknown rank
 
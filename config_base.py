@@ -12,6 +12,10 @@ from typing import Any, Dict
 
 logger = logging.getLogger(__name__)
 
+# Merged JsonConfig contents keyed by (class, merge mode, path, mtime, size),
+# so reloading an unchanged file skips the parse and merge
+_LOAD_CACHE: Dict[tuple, dict] = {}
+
 
 def deep_copy(d: dict) -> dict:
     """
@@ -23,15 +27,11 @@ def deep_copy(d: dict) -> dict:
     Returns:
         A new dictionary with all nested dicts and lists copied
     """
-    result = {}
-    for k, v in d.items():
-        if isinstance(v, dict):
-            result[k] = deep_copy(v)
-        elif isinstance(v, list):
-            result[k] = v[:]
-        else:
-            result[k] = v
-    return result
+    # Configs are plain JSON data, so exact type checks are enough
+    return {
+        k: deep_copy(v) if type(v) is dict else v[:] if type(v) is list else v
+        for k, v in d.items()
+    }
 
 
 def deep_merge(base: dict, override: dict):
@@ -44,11 +44,16 @@ def deep_merge(base: dict, override: dict):
         base: The base dictionary to merge into
         override: Values to merge (overrides base)
     """
-    for k, v in override.items():
-        if k in base and isinstance(base[k], dict) and isinstance(v, dict):
-            deep_merge(base[k], v)
-        else:
-            base[k] = v
+    # Explicit stack of (base, override) pairs instead of recursion
+    stack = [(base, override)]
+    while stack:
+        base, override = stack.pop()
+        for k, v in override.items():
+            current = base.get(k)
+            if type(current) is dict and type(v) is dict:
+                stack.append((current, v))
+            else:
+                base[k] = v
 
 
 def shallow_merge(base: dict, override: dict) -> dict:
@@ -89,13 +94,12 @@ def load_json_file(file_path: Path) -> Dict[str, Any]:
     Raises:
         No exceptions - returns empty dict on error and logs warning
     """
-    if not file_path.exists():
-        return {}
-
     try:
-        with open(file_path, "r") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError, OSError) as e:
+        with open(file_path, "rb") as f:
+            return json.loads(f.read())
+    except FileNotFoundError:
+        return {}
+    except (json.JSONDecodeError, UnicodeDecodeError, IOError, OSError) as e:
         logger.warning(f"Failed to load JSON from {file_path}: {e}")
         return {}
 
@@ -111,8 +115,10 @@ def save_json_file(file_path: Path, data: dict):
     Raises:
         IOError, OSError on file write failure
     """
+    # Encode first so the file is written in one call (json.dump writes per chunk)
+    text = json.dumps(data, indent=2)
     with open(file_path, "w") as f:
-        json.dump(data, f, indent=2)
+        f.write(text)
 
 
 class JsonConfig:
@@ -145,8 +151,22 @@ class JsonConfig:
         self.merge_mode = merge_mode
         self.config = self._load()
 
+    def _cache_key(self):
+        """Key for _LOAD_CACHE, or None if the file can't be stat'ed."""
+        try:
+            st = self.config_file.stat()
+        except OSError:
+            return None
+        return (type(self), self.merge_mode, str(self.config_file.resolve()),
+                st.st_mtime_ns, st.st_size)
+
     def _load(self) -> dict:
         """Load config from file, merged with defaults."""
+        key = self._cache_key()
+        cached = _LOAD_CACHE.get(key) if key else None
+        if cached is not None:
+            return deep_copy(cached)
+
         config = deep_copy(self.DEFAULTS)
         saved = load_json_file(self.config_file)
 
@@ -156,6 +176,8 @@ class JsonConfig:
             else:
                 config = shallow_merge(config, saved)
 
+        if key:
+            _LOAD_CACHE[key] = deep_copy(config)
         return config
 
     def get(self, section: str, key: str, fallback: Any = None) -> Any:
@@ -191,6 +213,10 @@ class JsonConfig:
             save_json_file(self.config_file, self.config)
         except (IOError, OSError) as e:
             logger.error(f"Failed to save config to {self.config_file}: {e}")
+            return
+        key = self._cache_key()
+        if key:
+            _LOAD_CACHE[key] = deep_copy(self.config)
 
     def reload(self):
         """Reload config from file."""
@@ -9,50 +9,201 @@ import json
 import zipfile
 import shutil
 import tempfile
+import threading
+import weakref
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional, List
 import os
 
 from logger_config import get_logger
 from app_config import get_config
 from card_metadata import (
-    MAJOR_ARCANA_ALIASES,
-    TAROT_SUIT_ALIASES,
-    TAROT_RANK_ALIASES,
-    TAROT_SUIT_BASES,
-    LENORMAND_ALIASES,
-    PLAYING_CARD_SUIT_ALIASES,
-    PLAYING_CARD_RANK_ALIASES,
+    parse_tarot_card,
+    parse_cards_batch,
+    parse_lenormand_card,
+    parse_playing_card,
 )
 
 logger = get_logger('database')
 _cfg = get_config()
 
+# Column (de)serializers for the small JSON values stored in rows
+# (suit names, spread positions, cards used). orjson is an optional,
+# faster drop-in; exports keep the stdlib json for their formatting.
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+# Stored in PRAGMA user_version once _migrate_columns and _seed_defaults
+# have run
+_SCHEMA_VERSION = 1
+
+# Entries kept per lookup cache (decks, suit and court names, single rows)
+_LOOKUP_CACHE_SIZE = 128
+
+
+class _ThreadConnection:
+    """One thread's connection plus its queued cache invalidations.
+
+    Lives in a threading.local, so it is dropped, and the connection
+    closed, when its thread exits.
+    """
+    __slots__ = ('conn', 'pending_invalidations', '__weakref__')
+
+    def __init__(self):
+        self.conn = None
+        self.pending_invalidations = []
+
+    def __del__(self):
+        if self.conn is not None:
+            try:
+                self.conn.close()
+            except Exception:
+                pass
+
 
 class Database:
+    # Read-only defaults shared by every deck without custom names
+    _DEFAULT_SUIT_NAMES = MappingProxyType({
+        'wands': 'Wands',
+        'cups': 'Cups',
+        'swords': 'Swords',
+        'pentacles': 'Pentacles'
+    })
+    _DEFAULT_COURT_NAMES = MappingProxyType({
+        'page': 'Page',
+        'knight': 'Knight',
+        'queen': 'Queen',
+        'king': 'King'
+    })
+
     def __init__(self, db_path: str = None):
         if db_path is None:
             db_path = _cfg.get("paths", "database", "tarot_journal.db")
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
-        self._in_transaction = False
-
-        # WAL mode: allows reads during writes and protects against
-        # data corruption if the app crashes mid-write
-        self.conn.execute('PRAGMA journal_mode=WAL')
+        # One connection per thread (see conn), so WAL readers on worker
+        # threads don't queue behind the UI thread's cursor. Each lives in
+        # thread-local storage and closes when its thread exits; _pool
+        # tracks the live ones so close() can reach them all
+        self._local = threading.local()
+        self._pool = weakref.WeakSet()
+        self._pool_lock = threading.Lock()
+        # Threads currently inside transaction()
+        self._transaction_threads = set()
+        self._has_fts = False
+        self._has_card_fts = False
+        # Read-mostly lookups hit on every redraw; see _invalidate_deck()
+        self._deck_cache = {}
+        self._suit_names_cache = {}
+        self._court_names_cache = {}
+        self._cartomancy_types_cache = None
+        # Single-row getters (get_profile, get_spread, get_tag, ...), keyed
+        # by table then id; sqlite3.Row is immutable, so rows are shared
+        self._row_caches = {}
+        # The caches are shared by all threads. Bumped on every
+        # invalidation so a read that raced a commit doesn't store the
+        # row it saw before it (see _cache_put)
+        self._cache_generation = 0
+        self._cache_lock = threading.Lock()
 
         self._create_tables()
+        # Gather planner statistics for any table that lacks or has stale
+        # ones, as SQLite recommends when opening a long-lived connection
+        self.conn.execute('PRAGMA optimize=0x10002')
 
         # Ensure the connection is closed if the app exits unexpectedly
         atexit.register(self.close)
 
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """The calling thread's connection, opened on first use."""
+        state = self._thread_state()
+        if state.conn is None:
+            state.conn = self._connect()
+        return state.conn
+
+    def _thread_state(self) -> _ThreadConnection:
+        state = getattr(self._local, 'state', None)
+        if state is None:
+            state = self._local.state = _ThreadConnection()
+            with self._pool_lock:
+                self._pool.add(state)
+        return state
+
+    def _connect(self) -> sqlite3.Connection:
+        # The module issues well over the default 128 distinct statements;
+        # a larger cache keeps them all prepared
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+        conn.row_factory = sqlite3.Row
+
+        # WAL mode: allows reads during writes and protects against
+        # data corruption if the app crashes mid-write
+        conn.execute('PRAGMA journal_mode=WAL')
+        # NORMAL is durable under WAL and avoids an fsync on every commit
+        conn.execute('PRAGMA synchronous=NORMAL')
+        # Keep temp tables/sorts in memory, a ~20 MB page cache, and
+        # memory-mapped reads
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-20000')
+        conn.execute('PRAGMA mmap_size=268435456')
+        # Cap the rows ANALYZE samples per index when PRAGMA optimize runs
+        conn.execute('PRAGMA analysis_limit=400')
+        return conn
+
+    def _close_connections(self, optimize: bool = False):
+        """Close every pooled connection; threads reconnect on next use."""
+        with self._pool_lock:
+            states = list(self._pool)
+        for state in states:
+            conn, state.conn = state.conn, None
+            if conn is None:
+                continue
+            try:
+                if optimize:
+                    # Refresh planner statistics for tables that need it (cheap;
+                    # recommended by SQLite before closing a long-lived connection)
+                    conn.execute('PRAGMA optimize')
+                conn.close()
+            except Exception as e:
+                logger.debug("Error closing database connection: %s", e)
+
+    @property
+    def _in_transaction(self) -> bool:
+        return threading.get_ident() in self._transaction_threads
+
+    @property
+    def _has_uncommitted_changes(self) -> bool:
+        """True while this thread holds writes other threads can't see yet."""
+        if self._in_transaction:
+            return True
+        state = getattr(self._local, 'state', None)
+        return state is not None and state.conn is not None and state.conn.in_transaction
+
     def _commit(self):
         """Commit unless inside a managed transaction (which commits at the end)."""
         if not self._in_transaction:
             self.conn.commit()
+            self._apply_pending_invalidations()
+
+    def _max_variables(self):
+        """SQLite's limit on bound parameters per statement."""
+        try:
+            return self.conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+        except AttributeError:
+            # getlimit needs Python 3.11; 999 is the lowest default SQLite ships
+            return 999
 
     @contextmanager
     def transaction(self):
@@ -61,19 +212,119 @@ class Database:
         If anything fails, all changes since the start are rolled back
         so the database never ends up in a half-finished state.
         """
-        self._in_transaction = True
+        thread_id = threading.get_ident()
+        self._transaction_threads.add(thread_id)
         try:
             yield
             self.conn.commit()
+            self._transaction_threads.discard(thread_id)
+            self._apply_pending_invalidations()
         except Exception:
             self.conn.rollback()
+            # Nothing was cached mid-transaction (see _cache_get), so the
+            # rolled-back writes never reached the shared caches
+            self._thread_state().pending_invalidations.clear()
             raise
         finally:
-            self._in_transaction = False
+            self._transaction_threads.discard(thread_id)
+
+    # --- Shared lookup caches ---
+    # Other threads keep reading the committed rows until this thread
+    # commits, so a thread with uncommitted writes neither reads nor fills
+    # the caches, and its invalidations are queued and applied after the
+    # commit; dropping them earlier would let another thread re-cache the
+    # old row in the meantime.
+
+    def _invalidate(self, drop, *args):
+        if self._has_uncommitted_changes:
+            self._thread_state().pending_invalidations.append((drop, args))
+        else:
+            with self._cache_lock:
+                self._cache_generation += 1
+                drop(*args)
+
+    def _apply_pending_invalidations(self):
+        state = self._thread_state()
+        pending, state.pending_invalidations = state.pending_invalidations, []
+        if pending:
+            with self._cache_lock:
+                self._cache_generation += 1
+                for drop, args in pending:
+                    drop(*args)
+
+    def _invalidate_deck(self, deck_id: int = None):
+        """Drop cached lookups for one deck, or everything if no id is given."""
+        self._invalidate(self._drop_deck, deck_id)
+
+    def _clear_caches(self):
+        """Drop every cached lookup now, e.g. after the database file is replaced."""
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._drop_deck(None)
+
+    def _drop_deck(self, deck_id):
+        if deck_id is None:
+            self._deck_cache.clear()
+            self._suit_names_cache.clear()
+            self._court_names_cache.clear()
+            self._cartomancy_types_cache = None
+            self._row_caches.clear()
+        else:
+            self._deck_cache.pop(deck_id, None)
+            self._suit_names_cache.pop(deck_id, None)
+            self._court_names_cache.pop(deck_id, None)
+
+    def _drop_cartomancy_types(self):
+        self._cartomancy_types_cache = None
+
+    def _get_cached_row(self, table: str, row_id: int):
+        """SELECT * for one row by id, served from the row cache when possible."""
+        cache = self._row_caches.setdefault(table, {})
+        row = self._cache_get(cache, row_id)
+        if row is None:
+            generation = self._cache_generation
+            row = self.conn.execute(f'SELECT * FROM {table} WHERE id = ?', (row_id,)).fetchone()
+            if row is not None:
+                self._cache_put(cache, row_id, row, generation)
+        return row
+
+    def _invalidate_row(self, table: str, row_id: int):
+        """Drop one cached row after it is updated or deleted."""
+        self._invalidate(self._drop_row, table, row_id)
+
+    def _drop_row(self, table, row_id):
+        self._row_caches.get(table, {}).pop(row_id, None)
+
+    def _cache_get(self, cache: dict, key):
+        """Cached value, or None on a miss or while this thread has uncommitted writes."""
+        if self._has_uncommitted_changes:
+            return None
+        return cache.get(key)
+
+    def _cache_put(self, cache: dict, key, value, generation: int):
+        """Store a value read at `generation`, evicting the oldest entry once
+        the cache is full. Skipped if an invalidation landed since the read."""
+        if self._has_uncommitted_changes:
+            return
+        with self._cache_lock:
+            if generation != self._cache_generation:
+                return
+            if len(cache) >= _LOOKUP_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[key] = value
 
     def _create_tables(self):
-        cursor = self.conn.cursor()
-        
+        # sqlite3 only opens transactions implicitly for DML, so without an
+        # explicit BEGIN every CREATE/ALTER below would commit on its own
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            self._create_schema(self.conn.cursor())
+        except Exception:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+
+    def _create_schema(self, cursor):
         # Cartomancy types (tarot, lenormand, oracle)
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS cartomancy_types (
@@ -96,27 +347,6 @@ class Database:
             )
         ''')
 
-        # Migration: add suit_names and court_names columns if missing
-        cursor.execute("PRAGMA table_info(decks)")
-        columns = [col[1] for col in cursor.fetchall()]
-        if 'suit_names' not in columns:
-            cursor.execute('ALTER TABLE decks ADD COLUMN suit_names TEXT')
-        if 'court_names' not in columns:
-            cursor.execute('ALTER TABLE decks ADD COLUMN court_names TEXT')
-        # Migration: add deck metadata columns
-        if 'date_published' not in columns:
-            cursor.execute('ALTER TABLE decks ADD COLUMN date_published TEXT')
-        if 'publisher' not in columns:
-            cursor.execute('ALTER TABLE decks ADD COLUMN publisher TEXT')
-        if 'credits' not in columns:
-            cursor.execute('ALTER TABLE decks ADD COLUMN credits TEXT')
-        if 'notes' not in columns:
-            cursor.execute('ALTER TABLE decks ADD COLUMN notes TEXT')
-        if 'card_back_image' not in columns:
-            cursor.execute('ALTER TABLE decks ADD COLUMN card_back_image TEXT')
-        if 'booklet_info' not in columns:
-            cursor.execute('ALTER TABLE decks ADD COLUMN booklet_info TEXT')
-
         # Cards table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS cards (
@@ -134,20 +364,6 @@ class Database:
             )
         ''')
 
-        # Migration: add new columns to cards table if missing
-        cursor.execute("PRAGMA table_info(cards)")
-        card_columns = [col[1] for col in cursor.fetchall()]
-        if 'archetype' not in card_columns:
-            cursor.execute('ALTER TABLE cards ADD COLUMN archetype TEXT')
-        if 'rank' not in card_columns:
-            cursor.execute('ALTER TABLE cards ADD COLUMN rank TEXT')
-        if 'suit' not in card_columns:
-            cursor.execute('ALTER TABLE cards ADD COLUMN suit TEXT')
-        if 'notes' not in card_columns:
-            cursor.execute('ALTER TABLE cards ADD COLUMN notes TEXT')
-        if 'custom_fields' not in card_columns:
-            cursor.execute('ALTER TABLE cards ADD COLUMN custom_fields TEXT')
-        
         # Spreads table (saved spread layouts)
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS spreads (
@@ -160,24 +376,6 @@ class Database:
             )
         ''')
 
-        # Migration: add cartomancy_type column if missing
-        cursor.execute("PRAGMA table_info(spreads)")
-        columns = [col[1] for col in cursor.fetchall()]
-        if 'cartomancy_type' not in columns:
-            cursor.execute('ALTER TABLE spreads ADD COLUMN cartomancy_type TEXT')
-
-        # Migration: add allowed_deck_types column for multi-deck-type spreads
-        if 'allowed_deck_types' not in columns:
-            cursor.execute('ALTER TABLE spreads ADD COLUMN allowed_deck_types TEXT')
-
-        # Migration: add default_deck_id column for spread-specific default deck
-        if 'default_deck_id' not in columns:
-            cursor.execute('ALTER TABLE spreads ADD COLUMN default_deck_id INTEGER REFERENCES decks(id)')
-
-        # Migration: add deck_slots column for multi-deck spreads
-        if 'deck_slots' not in columns:
-            cursor.execute('ALTER TABLE spreads ADD COLUMN deck_slots TEXT')
-
         # Journal entries table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS journal_entries (
@@ -193,18 +391,6 @@ class Database:
             )
         ''')
 
-        # Migrate journal_entries table if needed
-        cursor.execute('PRAGMA table_info(journal_entries)')
-        columns = [col[1] for col in cursor.fetchall()]
-        if 'reading_datetime' not in columns:
-            cursor.execute('ALTER TABLE journal_entries ADD COLUMN reading_datetime TIMESTAMP')
-        if 'location_name' not in columns:
-            cursor.execute('ALTER TABLE journal_entries ADD COLUMN location_name TEXT')
-        if 'location_lat' not in columns:
-            cursor.execute('ALTER TABLE journal_entries ADD COLUMN location_lat REAL')
-        if 'location_lon' not in columns:
-            cursor.execute('ALTER TABLE journal_entries ADD COLUMN location_lon REAL')
-
         # Entry readings (links entries to spreads and cards used)
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS entry_readings (
@@ -306,23 +492,6 @@ class Database:
             )
         ''')
 
-        # Migration: add sort_order to card_groups
-        cursor.execute('PRAGMA table_info(card_groups)')
-        columns = [col[1] for col in cursor.fetchall()]
-        if 'sort_order' not in columns:
-            cursor.execute('ALTER TABLE card_groups ADD COLUMN sort_order INTEGER DEFAULT 0')
-            # Initialize sort_order for existing groups based on name order
-            cursor.execute('SELECT id, deck_id FROM card_groups ORDER BY deck_id, name')
-            rows = cursor.fetchall()
-            current_deck = None
-            pos = 0
-            for row in rows:
-                if row[1] != current_deck:
-                    current_deck = row[1]
-                    pos = 0
-                cursor.execute('UPDATE card_groups SET sort_order = ? WHERE id = ?', (pos, row[0]))
-                pos += 1
-
         # Deck type assignments junction table (allows decks to have multiple types)
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS deck_type_assignments (
@@ -357,14 +526,6 @@ class Database:
             )
         ''')
 
-        # Migration: add querent_id and reader_id to journal_entries
-        cursor.execute('PRAGMA table_info(journal_entries)')
-        columns = [col[1] for col in cursor.fetchall()]
-        if 'querent_id' not in columns:
-            cursor.execute('ALTER TABLE journal_entries ADD COLUMN querent_id INTEGER REFERENCES profiles(id)')
-        if 'reader_id' not in columns:
-            cursor.execute('ALTER TABLE journal_entries ADD COLUMN reader_id INTEGER REFERENCES profiles(id)')
-
         # Follow-up notes table (for adding notes to entries after the fact)
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS follow_up_notes (
@@ -416,15 +577,55 @@ class Database:
             )
         ''')
 
-        # Insert default cartomancy types
-        default_types = ['Tarot', 'Lenormand', 'Kipper', 'Playing Cards', 'Oracle', 'I Ching']
-        for ct in default_types:
-            cursor.execute(
-                'INSERT OR IGNORE INTO cartomancy_types (name) VALUES (?)',
-                (ct,)
-            )
-
-        # Migrate existing deck types to junction table
+        # Column migrations and default data for new or older databases.
+        # The migrations probe PRAGMA table_info, so both are skipped
+        # once the stored schema version is current.
+        cursor.execute('PRAGMA user_version')
+        needs_migration = cursor.fetchone()[0] < _SCHEMA_VERSION
+        if needs_migration:
+            self._migrate_columns(cursor)
+
+        # Indexes for foreign-key lookups, search filters and date ordering
+        # Covers get_entry_readings' ORDER BY position_order
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_er_entry_order ON entry_readings(entry_id, position_order)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_er_deck ON entry_readings(deck_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_er_spread ON entry_readings(spread_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_er_type ON entry_readings(cartomancy_type)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_er_deckname ON entry_readings(deck_name)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_er_spreadname ON entry_readings(spread_name)')
+        # Reverse-direction indexes for the many-to-many tables, whose
+        # primary keys only cover lookups by the owning row. Including the
+        # owner id lets tag/group/type filters be answered from the index.
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_et_tag_entry ON entry_tags(tag_id, entry_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_dta_tag_deck ON deck_tag_assignments(tag_id, deck_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_cta_tag_card ON card_tag_assignments(tag_id, card_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_cga_group_card ON card_group_assignments(group_id, card_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_dtype_type_deck ON deck_type_assignments(type_id, deck_id)')
+        # Matches get_entries' ORDER BY created_at DESC, id DESC so paging
+        # streams from the index
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_je_created_id ON journal_entries(created_at DESC, id DESC)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_je_querent ON journal_entries(querent_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_je_reader ON journal_entries(reader_id)')
+        # Covers get_cards' ORDER BY card_order, name
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_cards_deck_order ON cards(deck_id, card_order, name)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_cards_deck_name ON cards(deck_id, name)')
+        # Covers get_follow_up_notes' ORDER BY created_at
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_fun_entry_created ON follow_up_notes(entry_id, created_at)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_dcf_deck ON deck_custom_fields(deck_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_ccf_card ON card_custom_fields(card_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_archetypes_type_name ON card_archetypes(cartomancy_type, name)')
+
+        self._has_fts = self._create_search_index(cursor)
+        self._has_card_fts = self._create_reading_cards_table(cursor)
+        self._create_entry_readings_view(cursor)
+
+        if needs_migration:
+            self._seed_defaults(cursor)
+            cursor.execute(f'PRAGMA user_version = {_SCHEMA_VERSION}')
+
+        # Migrate existing deck types to junction table. Not version-gated:
+        # add_deck doesn't write the junction table, so decks created since
+        # the last launch are picked up here.
         cursor.execute('SELECT COUNT(*) FROM deck_type_assignments')
         if cursor.fetchone()[0] == 0:
             # Junction table is empty - populate from existing cartomancy_type_id
@@ -434,6 +635,16 @@ class Database:
                 WHERE cartomancy_type_id IS NOT NULL
             ''')
 
+    def _seed_defaults(self, cursor):
+        """Insert default cartomancy types and card archetypes, and bring
+        archetypes from older versions up to date."""
+        # Insert default cartomancy types
+        default_types = ['Tarot', 'Lenormand', 'Kipper', 'Playing Cards', 'Oracle', 'I Ching']
+        cursor.executemany(
+            'INSERT OR IGNORE INTO cartomancy_types (name) VALUES (?)',
+            [(ct,) for ct in default_types]
+        )
+
         # Seed card archetypes if table is empty
         cursor.execute('SELECT COUNT(*) FROM card_archetypes')
         if cursor.fetchone()[0] == 0:
@@ -449,7 +660,106 @@ class Database:
             if row and row[0] == 'Ace':  # Old schema used 'Ace', new uses '101'
                 self._migrate_tarot_numbering(cursor)
 
-        self._commit()
+    def _migrate_columns(self, cursor):
+        """Add columns introduced after a table was first created.
+
+        New column migrations go here; bump _SCHEMA_VERSION with them so
+        existing databases run this (and _seed_defaults) again.
+        """
+        # Read every table's column names in one query rather than a
+        # PRAGMA table_info round-trip per table
+        cursor.execute('''
+            SELECT m.name, p.name
+            FROM sqlite_master m, pragma_table_info(m.name) p
+            WHERE m.type = 'table'
+        ''')
+        table_columns = {}
+        for table_name, column_name in cursor.fetchall():
+            table_columns.setdefault(table_name, set()).add(column_name)
+
+        # Migration: add suit_names and court_names columns if missing
+        columns = table_columns['decks']
+        if 'suit_names' not in columns:
+            cursor.execute('ALTER TABLE decks ADD COLUMN suit_names TEXT')
+        if 'court_names' not in columns:
+            cursor.execute('ALTER TABLE decks ADD COLUMN court_names TEXT')
+        # Migration: add deck metadata columns
+        if 'date_published' not in columns:
+            cursor.execute('ALTER TABLE decks ADD COLUMN date_published TEXT')
+        if 'publisher' not in columns:
+            cursor.execute('ALTER TABLE decks ADD COLUMN publisher TEXT')
+        if 'credits' not in columns:
+            cursor.execute('ALTER TABLE decks ADD COLUMN credits TEXT')
+        if 'notes' not in columns:
+            cursor.execute('ALTER TABLE decks ADD COLUMN notes TEXT')
+        if 'card_back_image' not in columns:
+            cursor.execute('ALTER TABLE decks ADD COLUMN card_back_image TEXT')
+        if 'booklet_info' not in columns:
+            cursor.execute('ALTER TABLE decks ADD COLUMN booklet_info TEXT')
+
+        # Migration: add new columns to cards table if missing
+        card_columns = table_columns['cards']
+        if 'archetype' not in card_columns:
+            cursor.execute('ALTER TABLE cards ADD COLUMN archetype TEXT')
+        if 'rank' not in card_columns:
+            cursor.execute('ALTER TABLE cards ADD COLUMN rank TEXT')
+        if 'suit' not in card_columns:
+            cursor.execute('ALTER TABLE cards ADD COLUMN suit TEXT')
+        if 'notes' not in card_columns:
+            cursor.execute('ALTER TABLE cards ADD COLUMN notes TEXT')
+        if 'custom_fields' not in card_columns:
+            cursor.execute('ALTER TABLE cards ADD COLUMN custom_fields TEXT')
+
+        # Migration: add cartomancy_type column if missing
+        columns = table_columns['spreads']
+        if 'cartomancy_type' not in columns:
+            cursor.execute('ALTER TABLE spreads ADD COLUMN cartomancy_type TEXT')
+
+        # Migration: add allowed_deck_types column for multi-deck-type spreads
+        if 'allowed_deck_types' not in columns:
+            cursor.execute('ALTER TABLE spreads ADD COLUMN allowed_deck_types TEXT')
+
+        # Migration: add default_deck_id column for spread-specific default deck
+        if 'default_deck_id' not in columns:
+            cursor.execute('ALTER TABLE spreads ADD COLUMN default_deck_id INTEGER REFERENCES decks(id)')
+
+        # Migration: add deck_slots column for multi-deck spreads
+        if 'deck_slots' not in columns:
+            cursor.execute('ALTER TABLE spreads ADD COLUMN deck_slots TEXT')
+
+        # Migrate journal_entries table if needed
+        columns = table_columns['journal_entries']
+        if 'reading_datetime' not in columns:
+            cursor.execute('ALTER TABLE journal_entries ADD COLUMN reading_datetime TIMESTAMP')
+        if 'location_name' not in columns:
+            cursor.execute('ALTER TABLE journal_entries ADD COLUMN location_name TEXT')
+        if 'location_lat' not in columns:
+            cursor.execute('ALTER TABLE journal_entries ADD COLUMN location_lat REAL')
+        if 'location_lon' not in columns:
+            cursor.execute('ALTER TABLE journal_entries ADD COLUMN location_lon REAL')
+
+        # Migration: add sort_order to card_groups
+        columns = table_columns['card_groups']
+        if 'sort_order' not in columns:
+            cursor.execute('ALTER TABLE card_groups ADD COLUMN sort_order INTEGER DEFAULT 0')
+            # Initialize sort_order for existing groups based on name order
+            cursor.execute('SELECT id, deck_id FROM card_groups ORDER BY deck_id, name')
+            rows = cursor.fetchall()
+            current_deck = None
+            pos = 0
+            for row in rows:
+                if row[1] != current_deck:
+                    current_deck = row[1]
+                    pos = 0
+                cursor.execute('UPDATE card_groups SET sort_order = ? WHERE id = ?', (pos, row[0]))
+                pos += 1
+
+        # Migration: add querent_id and reader_id to journal_entries
+        columns = table_columns['journal_entries']
+        if 'querent_id' not in columns:
+            cursor.execute('ALTER TABLE journal_entries ADD COLUMN querent_id INTEGER REFERENCES profiles(id)')
+        if 'reader_id' not in columns:
+            cursor.execute('ALTER TABLE journal_entries ADD COLUMN reader_id INTEGER REFERENCES profiles(id)')
 
     def _seed_card_archetypes(self, cursor):
         """Seed the card_archetypes table with standard archetypes for all types.
@@ -461,8 +771,6 @@ class Database:
         - Swords: 301-314
         - Pentacles: 401-414
         """
-        archetypes = []
-
         # Tarot - Major Arcana (22): numbered 0-21
         major_arcana = [
             ('The Fool', '0'), ('The Magician', '1'), ('The High Priestess', '2'),
@@ -474,19 +782,6 @@ class Database:
             ('The Moon', '18'), ('The Sun', '19'), ('Judgement', '20'),
             ('The World', '21')
         ]
-        for name, rank in major_arcana:
-            archetypes.append((name, 'Tarot', rank, 'Major Arcana', 'major'))
-
-        # Tarot - Minor Arcana (56)
-        # Suit base numbers: Wands=100, Cups=200, Swords=300, Pentacles=400
-        tarot_rank_names = ['Ace', 'Two', 'Three', 'Four', 'Five', 'Six', 'Seven',
-                            'Eight', 'Nine', 'Ten', 'Page', 'Knight', 'Queen', 'King']
-        tarot_suits = [('Wands', 100), ('Cups', 200), ('Swords', 300), ('Pentacles', 400)]
-        for suit_name, suit_base in tarot_suits:
-            for i, rank_name in enumerate(tarot_rank_names):
-                name = f"{rank_name} of {suit_name}"
-                rank_num = str(suit_base + i + 1)  # 101, 102, ... 114 for Wands
-                archetypes.append((name, 'Tarot', rank_num, suit_name, 'minor'))
 
         # Lenormand (36)
         lenormand_cards = [
@@ -500,27 +795,54 @@ class Database:
             ('Woman', '29'), ('Lily', '30'), ('Sun', '31'), ('Moon', '32'),
             ('Key', '33'), ('Fish', '34'), ('Anchor', '35'), ('Cross', '36')
         ]
-        for name, rank in lenormand_cards:
-            archetypes.append((name, 'Lenormand', rank, None, 'lenormand'))
-
-        # Playing Cards (54)
-        playing_ranks = ['Ace', 'Two', 'Three', 'Four', 'Five', 'Six', 'Seven',
-                         'Eight', 'Nine', 'Ten', 'Jack', 'Queen', 'King']
-        playing_suits = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
-        for suit in playing_suits:
-            for rank in playing_ranks:
-                name = f"{rank} of {suit}"
-                archetypes.append((name, 'Playing Cards', rank, suit, 'playing'))
-
-        # Jokers
-        archetypes.append(('Red Joker', 'Playing Cards', 'Joker', None, 'playing'))
-        archetypes.append(('Black Joker', 'Playing Cards', 'Joker', None, 'playing'))
-
-        # Insert all archetypes
-        cursor.executemany('''
+
+        # Insert everything in one statement. The named cards are bound as
+        # JSON arrays; the suited cards are the cross product of suits and
+        # ranks. ORDER BY keeps the ids in the order get_archetypes relies on.
+        cursor.execute('''
+            WITH
+            -- Tarot - Minor Arcana (56): Wands=100, Cups=200, Swords=300, Pentacles=400
+            tarot_suits(suit, base) AS (
+                VALUES ('Wands', 100), ('Cups', 200), ('Swords', 300), ('Pentacles', 400)
+            ),
+            tarot_ranks(rank_name, num) AS (
+                VALUES ('Ace', 1), ('Two', 2), ('Three', 3), ('Four', 4), ('Five', 5),
+                       ('Six', 6), ('Seven', 7), ('Eight', 8), ('Nine', 9), ('Ten', 10),
+                       ('Page', 11), ('Knight', 12), ('Queen', 13), ('King', 14)
+            ),
+            -- Playing Cards (52 + 2 Jokers)
+            playing_suits(suit, num) AS (
+                VALUES ('Hearts', 1), ('Diamonds', 2), ('Clubs', 3), ('Spades', 4)
+            ),
+            playing_ranks(rank_name, num) AS (
+                VALUES ('Ace', 1), ('Two', 2), ('Three', 3), ('Four', 4), ('Five', 5),
+                       ('Six', 6), ('Seven', 7), ('Eight', 8), ('Nine', 9), ('Ten', 10),
+                       ('Jack', 11), ('Queen', 12), ('King', 13)
+            ),
+            seed(grp, ord, name, cartomancy_type, rank, suit, card_type) AS (
+                SELECT 0, key, json_extract(value, '$[0]'), 'Tarot',
+                       json_extract(value, '$[1]'), 'Major Arcana', 'major'
+                FROM json_each(?1)
+                UNION ALL
+                SELECT 1, base + num, rank_name || ' of ' || suit, 'Tarot',
+                       CAST(base + num AS TEXT), suit, 'minor'
+                FROM tarot_suits, tarot_ranks
+                UNION ALL
+                SELECT 2, key, json_extract(value, '$[0]'), 'Lenormand',
+                       json_extract(value, '$[1]'), NULL, 'lenormand'
+                FROM json_each(?2)
+                UNION ALL
+                SELECT 3, s.num * 100 + r.num, r.rank_name || ' of ' || s.suit,
+                       'Playing Cards', r.rank_name, s.suit, 'playing'
+                FROM playing_suits s, playing_ranks r
+                UNION ALL
+                VALUES (4, 1, 'Red Joker', 'Playing Cards', 'Joker', NULL, 'playing'),
+                       (4, 2, 'Black Joker', 'Playing Cards', 'Joker', NULL, 'playing')
+            )
             INSERT OR IGNORE INTO card_archetypes (name, cartomancy_type, rank, suit, card_type)
-            VALUES (?, ?, ?, ?, ?)
-        ''', archetypes)
+            SELECT name, cartomancy_type, rank, suit, card_type FROM seed
+            ORDER BY grp, ord
+        ''', (_dumps(major_arcana), _dumps(lenormand_cards)))
 
     def _migrate_tarot_numbering(self, cursor):
         """Migrate Tarot archetypes from old naming schema to new numbering schema.
@@ -534,7 +856,7 @@ class Database:
         - Pentacles: 401-414
         """
         # Major Arcana: Roman numerals -> Arabic numbers
-        major_updates = [
+        new_ranks = dict((name, rank) for rank, name in [
             ('0', 'The Fool'), ('1', 'The Magician'), ('2', 'The High Priestess'),
             ('3', 'The Empress'), ('4', 'The Emperor'), ('5', 'The Hierophant'),
             ('6', 'The Lovers'), ('7', 'The Chariot'), ('8', 'Strength'),
@@ -543,12 +865,7 @@ class Database:
             ('15', 'The Devil'), ('16', 'The Tower'), ('17', 'The Star'),
             ('18', 'The Moon'), ('19', 'The Sun'), ('20', 'Judgement'),
             ('21', 'The World')
-        ]
-        for new_rank, name in major_updates:
-            cursor.execute('''
-                UPDATE card_archetypes SET rank = ?
-                WHERE name = ? AND cartomancy_type = 'Tarot'
-            ''', (new_rank, name))
+        ])
 
         # Minor Arcana: rank names -> numbers with suit prefix
         rank_name_to_num = {
@@ -560,22 +877,34 @@ class Database:
 
         for suit_name, suit_base in suit_bases.items():
             for rank_name, rank_num in rank_name_to_num.items():
-                new_rank = str(suit_base + rank_num)
-                card_name = f"{rank_name} of {suit_name}"
-                cursor.execute('''
-                    UPDATE card_archetypes SET rank = ?
-                    WHERE name = ? AND cartomancy_type = 'Tarot'
-                ''', (new_rank, card_name))
+                new_ranks[f"{rank_name} of {suit_name}"] = str(suit_base + rank_num)
+
+        # One UPDATE for all 78 cards, looking each name up in the JSON map
+        cursor.execute('''
+            UPDATE card_archetypes
+            SET rank = (SELECT value FROM json_each(?1) WHERE key = card_archetypes.name)
+            WHERE cartomancy_type = 'Tarot'
+              AND name IN (SELECT key FROM json_each(?1))
+        ''', (_dumps(new_ranks),))
 
     # === Cartomancy Types ===
     def get_cartomancy_types(self):
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM cartomancy_types ORDER BY name')
-        return cursor.fetchall()
+        types = None if self._has_uncommitted_changes else self._cartomancy_types_cache
+        if types is None:
+            generation = self._cache_generation
+            cursor = self.conn.cursor()
+            cursor.execute('SELECT * FROM cartomancy_types ORDER BY name')
+            types = tuple(cursor.fetchall())
+            if not self._has_uncommitted_changes:
+                with self._cache_lock:
+                    if generation == self._cache_generation:
+                        self._cartomancy_types_cache = types
+        return list(types)
     
     def add_cartomancy_type(self, name: str):
         cursor = self.conn.cursor()
         cursor.execute('INSERT INTO cartomancy_types (name) VALUES (?)', (name,))
+        self._invalidate(self._drop_cartomancy_types)
         self._commit()
         return cursor.lastrowid
     
@@ -615,15 +944,24 @@ class Database:
         return result
     
     def get_deck(self, deck_id: int):
-        cursor = self.conn.cursor()
+        deck = self._cache_get(self._deck_cache, deck_id)
+        if deck is None:
+            generation = self._cache_generation
+            deck = self._get_deck_uncached(deck_id)
+            if deck is None:
+                return None
+            self._cache_put(self._deck_cache, deck_id, deck, generation)
+        # Callers annotate the returned dict, so hand out a copy
+        return dict(deck)
+
+    def _get_deck_uncached(self, deck_id: int):
         # Get deck with primary type (for backward compatibility)
-        cursor.execute('''
+        row = self.conn.execute('''
             SELECT d.*, ct.name as cartomancy_type_name
             FROM decks d
             JOIN cartomancy_types ct ON d.cartomancy_type_id = ct.id
             WHERE d.id = ?
-        ''', (deck_id,))
-        row = cursor.fetchone()
+        ''', (deck_id,)).fetchone()
         if row:
             # Get all types from junction table
             types = self.get_types_for_deck(deck_id)
@@ -641,12 +979,13 @@ class Database:
     def add_deck(self, name: str, cartomancy_type_id: int, image_folder: str = None,
                  suit_names: dict = None, court_names: dict = None):
         cursor = self.conn.cursor()
-        suit_names_json = json.dumps(suit_names) if suit_names else None
-        court_names_json = json.dumps(court_names) if court_names else None
+        suit_names_json = _dumps(suit_names) if suit_names else None
+        court_names_json = _dumps(court_names) if court_names else None
         cursor.execute(
             'INSERT INTO decks (name, cartomancy_type_id, image_folder, suit_names, court_names) VALUES (?, ?, ?, ?, ?)',
             (name, cartomancy_type_id, image_folder, suit_names_json, court_names_json)
         )
+        self._invalidate_deck(cursor.lastrowid)
         self._commit()
         return cursor.lastrowid
     
@@ -655,36 +994,53 @@ class Database:
                     credits: str = None, notes: str = None, card_back_image: str = None,
                     booklet_info: str = None, cartomancy_type_id: int = None):
         cursor = self.conn.cursor()
+        updates = []
+        params = []
+
         if name:
-            cursor.execute('UPDATE decks SET name = ? WHERE id = ?', (name, deck_id))
+            updates.append('name = ?')
+            params.append(name)
         if cartomancy_type_id is not None:
-            cursor.execute('UPDATE decks SET cartomancy_type_id = ? WHERE id = ?', (cartomancy_type_id, deck_id))
+            updates.append('cartomancy_type_id = ?')
+            params.append(cartomancy_type_id)
         if image_folder:
-            cursor.execute('UPDATE decks SET image_folder = ? WHERE id = ?', (image_folder, deck_id))
+            updates.append('image_folder = ?')
+            params.append(image_folder)
         if suit_names is not None:
-            suit_names_json = json.dumps(suit_names) if suit_names else None
-            cursor.execute('UPDATE decks SET suit_names = ? WHERE id = ?', (suit_names_json, deck_id))
+            updates.append('suit_names = ?')
+            params.append(_dumps(suit_names) if suit_names else None)
         if court_names is not None:
-            court_names_json = json.dumps(court_names) if court_names else None
-            cursor.execute('UPDATE decks SET court_names = ? WHERE id = ?', (court_names_json, deck_id))
+            updates.append('court_names = ?')
+            params.append(_dumps(court_names) if court_names else None)
         if date_published is not None:
-            cursor.execute('UPDATE decks SET date_published = ? WHERE id = ?', (date_published, deck_id))
+            updates.append('date_published = ?')
+            params.append(date_published)
         if publisher is not None:
-            cursor.execute('UPDATE decks SET publisher = ? WHERE id = ?', (publisher, deck_id))
+            updates.append('publisher = ?')
+            params.append(publisher)
         if credits is not None:
-            cursor.execute('UPDATE decks SET credits = ? WHERE id = ?', (credits, deck_id))
+            updates.append('credits = ?')
+            params.append(credits)
         if notes is not None:
-            cursor.execute('UPDATE decks SET notes = ? WHERE id = ?', (notes, deck_id))
+            updates.append('notes = ?')
+            params.append(notes)
         if card_back_image is not None:
-            cursor.execute('UPDATE decks SET card_back_image = ? WHERE id = ?', (card_back_image, deck_id))
+            updates.append('card_back_image = ?')
+            params.append(card_back_image)
         if booklet_info is not None:
-            cursor.execute('UPDATE decks SET booklet_info = ? WHERE id = ?', (booklet_info, deck_id))
+            updates.append('booklet_info = ?')
+            params.append(booklet_info)
+
+        if updates:
+            params.append(deck_id)
+            cursor.execute(f'UPDATE decks SET {", ".join(updates)} WHERE id = ?', params)
+        self._invalidate_deck(deck_id)
         self._commit()
 
     # === Deck Type Assignments (multiple types per deck) ===
     def get_types_for_deck(self, deck_id: int) -> List[dict]:
         """Get all cartomancy types assigned to a deck."""
-        cursor = self.conn.cursor()
+        cursor = self._fast_cursor()
         cursor.execute('''
             SELECT ct.id, ct.name
             FROM deck_type_assignments dta
@@ -700,14 +1056,14 @@ class Database:
         # Remove existing assignments
         cursor.execute('DELETE FROM deck_type_assignments WHERE deck_id = ?', (deck_id,))
         # Add new assignments
-        for type_id in type_ids:
-            cursor.execute(
-                'INSERT INTO deck_type_assignments (deck_id, type_id) VALUES (?, ?)',
-                (deck_id, type_id)
-            )
+        cursor.executemany(
+            'INSERT INTO deck_type_assignments (deck_id, type_id) VALUES (?, ?)',
+            [(deck_id, type_id) for type_id in type_ids]
+        )
         # Also update the legacy cartomancy_type_id (use first type for backward compatibility)
         if type_ids:
             cursor.execute('UPDATE decks SET cartomancy_type_id = ? WHERE id = ?', (type_ids[0], deck_id))
+        self._invalidate_deck(deck_id)
         self._commit()
 
     def add_type_to_deck(self, deck_id: int, type_id: int):
@@ -717,6 +1073,7 @@ class Database:
             'INSERT OR IGNORE INTO deck_type_assignments (deck_id, type_id) VALUES (?, ?)',
             (deck_id, type_id)
         )
+        self._invalidate_deck(deck_id)
         self._commit()
 
     def remove_type_from_deck(self, deck_id: int, type_id: int):
@@ -726,73 +1083,97 @@ class Database:
             'DELETE FROM deck_type_assignments WHERE deck_id = ? AND type_id = ?',
             (deck_id, type_id)
         )
+        self._invalidate_deck(deck_id)
         self._commit()
 
     def get_deck_suit_names(self, deck_id: int) -> dict:
         """Get custom suit names for a deck, or defaults"""
-        deck = self.get_deck(deck_id)
-        if deck and deck['suit_names']:
-            return json.loads(deck['suit_names'])
-        return {
-            'wands': 'Wands',
-            'cups': 'Cups',
-            'swords': 'Swords',
-            'pentacles': 'Pentacles'
-        }
+        suit_names = self._cache_get(self._suit_names_cache, deck_id)
+        if suit_names is None:
+            generation = self._cache_generation
+            suit_names_json = self._get_deck_column(deck_id, 'suit_names')
+            if suit_names_json:
+                suit_names = _loads(suit_names_json)
+            else:
+                suit_names = self._DEFAULT_SUIT_NAMES
+            self._cache_put(self._suit_names_cache, deck_id, suit_names, generation)
+        return dict(suit_names)
 
     def get_deck_court_names(self, deck_id: int) -> dict:
         """Get custom court card names for a deck, or defaults"""
-        deck = self.get_deck(deck_id)
-        if deck:
-            try:
-                court_names = deck['court_names']
-                if court_names:
-                    return json.loads(court_names)
-            except (KeyError, TypeError):
-                pass
-        return {
-            'page': 'Page',
-            'knight': 'Knight',
-            'queen': 'Queen',
-            'king': 'King'
-        }
+        court_names = self._cache_get(self._court_names_cache, deck_id)
+        if court_names is None:
+            generation = self._cache_generation
+            court_names_json = self._get_deck_column(deck_id, 'court_names')
+            if court_names_json:
+                court_names = _loads(court_names_json)
+            else:
+                court_names = self._DEFAULT_COURT_NAMES
+            self._cache_put(self._court_names_cache, deck_id, court_names, generation)
+        return dict(court_names)
+
+    def _get_deck_column(self, deck_id: int, column: str):
+        """Read one decks column, from the get_deck cache when it has the row."""
+        deck = self._cache_get(self._deck_cache, deck_id)
+        if deck is not None:
+            return deck[column]
+        row = self._fast_cursor().execute(f'SELECT {column} FROM decks WHERE id = ?', (deck_id,)).fetchone()
+        return row[0] if row else None
+
+    def _fast_cursor(self):
+        """Cursor that returns plain tuples instead of sqlite3.Row, for
+        internal reads that only unpack rows by position."""
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        return cursor
 
     def update_deck_suit_names(self, deck_id: int, suit_names: dict, old_suit_names: dict = None):
         """Update suit names and rename all cards accordingly"""
         cursor = self.conn.cursor()
         
         # Update deck
-        suit_names_json = json.dumps(suit_names)
+        suit_names_json = _dumps(suit_names)
         cursor.execute('UPDATE decks SET suit_names = ? WHERE id = ?', (suit_names_json, deck_id))
         
         # Update cards if old names provided
         if old_suit_names:
+            renames = []
             for suit_key in ['wands', 'cups', 'swords', 'pentacles']:
                 old_name = old_suit_names.get(suit_key)
                 new_name = suit_names.get(suit_key)
                 if old_name and new_name and old_name != new_name:
-                    # Replace "of OldSuit" with "of NewSuit"
-                    cursor.execute('''
-                        UPDATE cards 
-                        SET name = REPLACE(name, ?, ?)
-                        WHERE deck_id = ? AND name LIKE ?
-                    ''', (f'of {old_name}', f'of {new_name}', deck_id, f'%of {old_name}'))
+                    renames.append((f'of {old_name}', f'of {new_name}'))
+            if renames:
+                # Replace "of OldSuit" with "of NewSuit" for every renamed
+                # suit in one pass over the deck's cards
+                cases = ' '.join(['WHEN name LIKE ? THEN REPLACE(name, ?, ?)'] * len(renames))
+                matches = ' OR '.join(['name LIKE ?'] * len(renames))
+                params = []
+                for old, new in renames:
+                    params.extend((f'%{old}', old, new))
+                params.append(deck_id)
+                params.extend(f'%{old}' for old, _ in renames)
+                cursor.execute(f'''
+                    UPDATE cards
+                    SET name = CASE {cases} ELSE name END
+                    WHERE deck_id = ? AND ({matches})
+                ''', params)
         
+        self._invalidate_deck(deck_id)
         self._commit()
     
     def delete_deck(self, deck_id: int):
         cursor = self.conn.cursor()
         cursor.execute('DELETE FROM decks WHERE id = ?', (deck_id,))
+        self._invalidate_deck(deck_id)
         self._commit()
     
     # === Cards ===
     def get_cards(self, deck_id: int):
-        cursor = self.conn.cursor()
-        cursor.execute(
+        return self.conn.execute(
             'SELECT * FROM cards WHERE deck_id = ? ORDER BY card_order, name',
             (deck_id,)
-        )
-        return cursor.fetchall()
+        ).fetchall()
 
     def search_cards(self, query: str = None, deck_id: int = None, deck_type: str = None,
                      card_category: str = None, archetype: str = None, rank: str = None,
@@ -908,13 +1289,13 @@ class Database:
         return cursor.fetchall()
 
     def get_card(self, card_id: int):
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM cards WHERE id = ?', (card_id,))
-        return cursor.fetchone()
+        return self.conn.execute('SELECT * FROM cards WHERE id = ?', (card_id,)).fetchone()
     
     def add_card(self, deck_id: int, name: str, image_path: str = None, card_order: int = 0,
-                 auto_metadata: bool = True):
-        """Add a card to a deck. If auto_metadata is True, automatically assign archetype/rank/suit."""
+                 auto_metadata: bool = True, cartomancy_type: str = None):
+        """Add a card to a deck. If auto_metadata is True, automatically assign archetype/rank/suit.
+        Callers adding many cards to one deck can pass the deck's cartomancy_type
+        so it isn't looked up for every card."""
         cursor = self.conn.cursor()
         cursor.execute(
             'INSERT INTO cards (deck_id, name, image_path, card_order) VALUES (?, ?, ?, ?)',
@@ -925,9 +1306,11 @@ class Database:
 
         # Auto-assign metadata based on card name
         if auto_metadata:
-            deck = self.get_deck(deck_id)
-            if deck:
-                cartomancy_type = deck['cartomancy_type_name']
+            if cartomancy_type is None:
+                deck = self.get_deck(deck_id)
+                if deck:
+                    cartomancy_type = deck['cartomancy_type_name']
+            if cartomancy_type is not None:
                 self.auto_assign_card_metadata(card_id, name, cartomancy_type)
 
         return card_id
@@ -965,58 +1348,76 @@ class Database:
 
         # Check if new dict format or legacy tuple format
         if cards and isinstance(cards[0], dict):
-            # New format with pre-computed metadata
-            # Insert cards and collect custom_fields to apply after
-            cards_with_custom_fields = []
+            # New format with pre-computed metadata; custom_fields are stored
+            # the way update_card_metadata stores them
+            rows = []
             for c in cards:
+                custom_fields = c.get('custom_fields')
+                if custom_fields and not isinstance(custom_fields, str):
+                    custom_fields = json.dumps(custom_fields)
+                rows.append((c['name'], c['image_path'], c['sort_order'],
+                             c.get('archetype'), c.get('rank'), c.get('suit'),
+                             custom_fields or None))
+            # Bind the whole deck as one JSON array and expand it with
+            # json_each, so the import is a single INSERT statement
+            cursor.execute('''
+                INSERT INTO cards (deck_id, name, image_path, card_order, archetype, rank, suit,
+                                   custom_fields)
+                SELECT ?, json_extract(value, '$[0]'), json_extract(value, '$[1]'),
+                       json_extract(value, '$[2]'), json_extract(value, '$[3]'),
+                       json_extract(value, '$[4]'), json_extract(value, '$[5]'),
+                       json_extract(value, '$[6]')
+                FROM json_each(?)
+            ''', (deck_id, _dumps(rows)))
+        else:
+            # AUTOINCREMENT never reuses ids, so the cards added here are
+            # exactly those above the current maximum
+            cursor.execute('SELECT COALESCE(MAX(id), 0) FROM cards')
+            last_existing_id = cursor.fetchone()[0]
+
+            # Legacy tuple format: one multi-row INSERT per chunk, sized to
+            # stay under SQLite's bound-parameter limit
+            rows_per_insert = min(500, self._max_variables() // 4)
+            for start in range(0, len(cards), rows_per_insert):
+                batch = cards[start:start + rows_per_insert]
+                values = ', '.join(['(?, ?, ?, ?)'] * len(batch))
                 cursor.execute(
-                    '''INSERT INTO cards (deck_id, name, image_path, card_order, archetype, rank, suit)
-                       VALUES (?, ?, ?, ?, ?, ?, ?)''',
-                    (deck_id, c['name'], c['image_path'], c['sort_order'],
-                     c.get('archetype'), c.get('rank'), c.get('suit'))
+                    f'INSERT INTO cards (deck_id, name, image_path, card_order) VALUES {values}',
+                    [v for name, path, order in batch for v in (deck_id, name, path, order)]
                 )
-                card_id = cursor.lastrowid
-                if c.get('custom_fields'):
-                    cards_with_custom_fields.append((card_id, c['custom_fields']))
-
-            # Apply custom_fields after all cards are inserted
-            for card_id, custom_fields in cards_with_custom_fields:
-                self.update_card_metadata(card_id, custom_fields=custom_fields)
-        else:
-            # Legacy tuple format
-            cursor.executemany(
-                'INSERT INTO cards (deck_id, name, image_path, card_order) VALUES (?, ?, ?, ?)',
-                [(deck_id, name, path, order) for name, path, order in cards]
-            )
-            self._commit()
 
-            # Auto-assign metadata for all cards
+            # Auto-assign metadata for the cards just added
             if auto_metadata:
                 deck = self.get_deck(deck_id)
                 if deck:
                     cartomancy_type = deck['cartomancy_type_name']
-                    # Get all cards we just added and assign metadata
-                    all_cards = self.get_cards(deck_id)
-                    for card in all_cards:
-                        # Only update if metadata is not already set
-                        existing_archetype = card['archetype'] if 'archetype' in card.keys() else None
-                        if not existing_archetype:
-                            self.auto_assign_card_metadata(card['id'], card['name'], cartomancy_type)
-                    return
+                    new_cards = self._fast_cursor().execute(
+                        'SELECT id, name FROM cards WHERE id > ? AND deck_id = ?',
+                        (last_existing_id, deck_id)
+                    ).fetchall()
+                    if cartomancy_type == 'Tarot':
+                        parsed = [result or (None, None, None)
+                                  for result in parse_cards_batch([name for _, name in new_cards])]
+                    else:
+                        parsed = [self.parse_card_name_for_archetype(name, cartomancy_type)
+                                  for _, name in new_cards]
+                    updates = [(archetype, rank, suit, card_id)
+                               for (card_id, _), (archetype, rank, suit) in zip(new_cards, parsed)
+                               if archetype or rank or suit]
+                    cursor.executemany(
+                        'UPDATE cards SET archetype = ?, rank = ?, suit = ? WHERE id = ?',
+                        updates
+                    )
 
         self._commit()
         logger.info("Bulk added %d cards to deck %d", len(cards), deck_id)
 
     # === Spreads ===
     def get_spreads(self):
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM spreads ORDER BY name')
-        return cursor.fetchall()
+        return self.conn.execute('SELECT * FROM spreads ORDER BY name').fetchall()
     
     def get_spread(self, spread_id: int):
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM spreads WHERE id = ?', (spread_id,))
-        return cursor.fetchone()
+        return self._get_cached_row('spreads', spread_id)
     
     def add_spread(self, name: str, positions: list, description: str = None,
                    cartomancy_type: str = None, allowed_deck_types: list = None,
@@ -1031,14 +1432,30 @@ class Database:
         cursor = self.conn.cursor()
         cursor.execute(
             'INSERT INTO spreads (name, description, positions, cartomancy_type, allowed_deck_types, default_deck_id, deck_slots) VALUES (?, ?, ?, ?, ?, ?, ?)',
-            (name, description, json.dumps(positions), cartomancy_type,
-             json.dumps(allowed_deck_types) if allowed_deck_types else None,
+            (name, description, _dumps(positions), cartomancy_type,
+             _dumps(allowed_deck_types) if allowed_deck_types else None,
              default_deck_id,
-             json.dumps(deck_slots) if deck_slots else None)
+             _dumps(deck_slots) if deck_slots else None)
         )
         self._commit()
         return cursor.lastrowid
 
+    def bulk_add_spreads(self, spreads: list):
+        """Add many spreads in one statement and commit.
+
+        spreads is a list of (name, positions, description, cartomancy_type)
+        tuples, matching add_spread's leading arguments.
+        """
+        if not spreads:
+            return
+        cursor = self.conn.cursor()
+        cursor.executemany(
+            'INSERT INTO spreads (name, description, positions, cartomancy_type) VALUES (?, ?, ?, ?)',
+            [(name, description, _dumps(positions), cartomancy_type)
+             for name, positions, description, cartomancy_type in spreads]
+        )
+        self._commit()
+
     def update_spread(self, spread_id: int, name: str = None, positions: list = None,
                       description: str = None, allowed_deck_types: list = None,
                       default_deck_id: int = None, clear_default_deck: bool = False,
@@ -1047,45 +1464,282 @@ class Database:
         if name:
             cursor.execute('UPDATE spreads SET name = ? WHERE id = ?', (name, spread_id))
         if positions:
-            cursor.execute('UPDATE spreads SET positions = ? WHERE id = ?', (json.dumps(positions), spread_id))
+            cursor.execute('UPDATE spreads SET positions = ? WHERE id = ?', (_dumps(positions), spread_id))
         if description is not None:
             cursor.execute('UPDATE spreads SET description = ? WHERE id = ?', (description, spread_id))
         if allowed_deck_types is not None:
             cursor.execute('UPDATE spreads SET allowed_deck_types = ? WHERE id = ?',
-                          (json.dumps(allowed_deck_types) if allowed_deck_types else None, spread_id))
+                          (_dumps(allowed_deck_types) if allowed_deck_types else None, spread_id))
         if default_deck_id is not None or clear_default_deck:
             cursor.execute('UPDATE spreads SET default_deck_id = ? WHERE id = ?',
                           (default_deck_id, spread_id))
         if deck_slots is not None:
             cursor.execute('UPDATE spreads SET deck_slots = ? WHERE id = ?',
-                          (json.dumps(deck_slots) if deck_slots else None, spread_id))
+                          (_dumps(deck_slots) if deck_slots else None, spread_id))
+        self._invalidate_row('spreads', spread_id)
         self._commit()
     
     def delete_spread(self, spread_id: int):
         cursor = self.conn.cursor()
         cursor.execute('DELETE FROM spreads WHERE id = ?', (spread_id,))
+        self._invalidate_row('spreads', spread_id)
         self._commit()
     
+    def _create_search_index(self, cursor):
+        """Create the full-text index over entry titles and content.
+
+        Uses an external-content FTS5 table kept in sync by triggers. The
+        trigram tokenizer matches arbitrary substrings case-insensitively,
+        the same results the old LIKE '%query%' search gave. Returns False
+        if this SQLite build lacks FTS5 or trigram support.
+        """
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'journal_entries_fts'"
+        )
+        exists = cursor.fetchone() is not None
+        try:
+            if not exists:
+                cursor.execute('''
+                    CREATE VIRTUAL TABLE journal_entries_fts USING fts5(
+                        title, content,
+                        content='journal_entries', content_rowid='id',
+                        tokenize='trigram'
+                    )
+                ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS journal_entries_fts_ai
+                AFTER INSERT ON journal_entries BEGIN
+                    INSERT INTO journal_entries_fts(rowid, title, content)
+                    VALUES (new.id, new.title, new.content);
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS journal_entries_fts_ad
+                AFTER DELETE ON journal_entries BEGIN
+                    INSERT INTO journal_entries_fts(journal_entries_fts, rowid, title, content)
+                    VALUES ('delete', old.id, old.title, old.content);
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS journal_entries_fts_au
+                AFTER UPDATE OF title, content ON journal_entries BEGIN
+                    INSERT INTO journal_entries_fts(journal_entries_fts, rowid, title, content)
+                    VALUES ('delete', old.id, old.title, old.content);
+                    INSERT INTO journal_entries_fts(rowid, title, content)
+                    VALUES (new.id, new.title, new.content);
+                END
+            ''')
+            if not exists:
+                # Index entries written before the table existed
+                cursor.execute(
+                    "INSERT INTO journal_entries_fts(journal_entries_fts) VALUES ('rebuild')"
+                )
+        except sqlite3.OperationalError as e:
+            logger.warning("Full-text search unavailable, using LIKE: %s", e)
+            return False
+        return True
+
+    def _create_entry_readings_view(self, cursor):
+        """Create entry_readings_v, which resolves a reading's spread and deck
+        names through spread_id/deck_id.
+
+        entry_readings keeps its own spread_name/deck_name copies: they are
+        what a reading shows once its deck or spread is deleted, and what
+        export/import and get_stats match on. The view falls back to them.
+        """
+        cursor.execute('''
+            CREATE VIEW IF NOT EXISTS entry_readings_v AS
+            SELECT er.id, er.entry_id,
+                   er.spread_id, COALESCE(s.name, er.spread_name) AS spread_name,
+                   er.deck_id, COALESCE(d.name, er.deck_name) AS deck_name,
+                   er.cartomancy_type, er.cards_used, er.position_order
+            FROM entry_readings er
+            LEFT JOIN spreads s ON s.id = er.spread_id
+            LEFT JOIN decks d ON d.id = er.deck_id
+        ''')
+
+    def _create_reading_cards_table(self, cursor):
+        """Create entry_reading_cards, one row per card named in a reading's
+        cards_used JSON, and entry_reading_cards_fts, a trigram index over
+        its names, so partial card-name search is an index lookup.
+
+        Triggers on entry_readings keep the table in sync for every write
+        path, and triggers on the table keep the index in sync. Returns
+        False if this SQLite build lacks FTS5 or trigram support.
+        """
+        columns = {row[1] for row in cursor.execute('PRAGMA table_info(entry_reading_cards)')}
+        if columns and 'id' not in columns:
+            # Older layout without the id the index keys on; the rows are
+            # derived from cards_used, so drop them and rebuild below
+            cursor.execute('DROP TABLE IF EXISTS entry_reading_cards_fts')
+            cursor.execute('DROP TABLE entry_reading_cards')
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'entry_reading_cards'"
+        )
+        exists = cursor.fetchone() is not None
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS entry_reading_cards (
+                id INTEGER PRIMARY KEY,
+                reading_id INTEGER NOT NULL,
+                card_name TEXT NOT NULL COLLATE NOCASE,
+                FOREIGN KEY (reading_id) REFERENCES entry_readings(id) ON DELETE CASCADE
+            )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_erc_reading ON entry_reading_cards(reading_id)')
+
+        # cards_used holds either plain names or {"name": ...} objects
+        select_cards = '''
+            SELECT {reading}.id, CASE j.type WHEN 'object'
+                                 THEN json_extract(j.value, '$.name') ELSE j.value END
+            FROM json_each(CASE WHEN json_valid({reading}.cards_used)
+                           THEN {reading}.cards_used ELSE '[]' END) j
+            WHERE j.type IN ('text', 'object')
+              AND (j.type = 'text' OR json_type(j.value, '$.name') = 'text')
+        '''
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS entry_reading_cards_ai
+            AFTER INSERT ON entry_readings BEGIN
+                INSERT INTO entry_reading_cards (reading_id, card_name)
+                {select_cards.format(reading='new')};
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS entry_reading_cards_ad
+            AFTER DELETE ON entry_readings BEGIN
+                DELETE FROM entry_reading_cards WHERE reading_id = old.id;
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS entry_reading_cards_au
+            AFTER UPDATE OF cards_used ON entry_readings BEGIN
+                DELETE FROM entry_reading_cards WHERE reading_id = old.id;
+                INSERT INTO entry_reading_cards (reading_id, card_name)
+                {select_cards.format(reading='new')};
+            END
+        ''')
+        if not exists:
+            # Index readings saved before the table existed
+            cursor.execute(f'''
+                INSERT INTO entry_reading_cards (reading_id, card_name)
+                {select_cards.format(reading='er').replace('FROM json_each', 'FROM entry_readings er, json_each')}
+            ''')
+
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'entry_reading_cards_fts'"
+        )
+        fts_exists = cursor.fetchone() is not None
+        try:
+            if not fts_exists:
+                cursor.execute('''
+                    CREATE VIRTUAL TABLE entry_reading_cards_fts USING fts5(
+                        card_name,
+                        content='entry_reading_cards', content_rowid='id',
+                        tokenize='trigram'
+                    )
+                ''')
+            # Rows are only ever inserted and deleted, never updated
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS entry_reading_cards_fts_ai
+                AFTER INSERT ON entry_reading_cards BEGIN
+                    INSERT INTO entry_reading_cards_fts(rowid, card_name)
+                    VALUES (new.id, new.card_name);
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS entry_reading_cards_fts_ad
+                AFTER DELETE ON entry_reading_cards BEGIN
+                    INSERT INTO entry_reading_cards_fts(entry_reading_cards_fts, rowid, card_name)
+                    VALUES ('delete', old.id, old.card_name);
+                END
+            ''')
+            if not fts_exists:
+                # Index card names written before the table existed
+                cursor.execute(
+                    "INSERT INTO entry_reading_cards_fts(entry_reading_cards_fts) VALUES ('rebuild')"
+                )
+        except sqlite3.OperationalError as e:
+            logger.warning("Card-name index unavailable, using LIKE: %s", e)
+            return False
+        return True
+
     # === Journal Entries ===
-    def get_entries(self, limit: int = 50, offset: int = 0):
+    def get_entries(self, limit: int = 50, offset: int = 0, before: str = None,
+                    before_id: int = None):
+        """Get entries, newest first.
+
+        To page, pass the last row's created_at as before (and its id as
+        before_id to break timestamp ties) instead of an offset: the seek
+        through idx_je_created costs the same at any depth, whereas OFFSET
+        reads and discards every skipped row.
+        """
         cursor = self.conn.cursor()
-        cursor.execute('''
-            SELECT * FROM journal_entries 
-            ORDER BY created_at DESC 
-            LIMIT ? OFFSET ?
-        ''', (limit, offset))
+        if before is None:
+            cursor.execute('''
+                SELECT * FROM journal_entries 
+                ORDER BY created_at DESC, id DESC 
+                LIMIT ? OFFSET ?
+            ''', (limit, offset))
+        elif before_id is None:
+            cursor.execute('''
+                SELECT * FROM journal_entries 
+                WHERE created_at < ?
+                ORDER BY created_at DESC, id DESC 
+                LIMIT ?
+            ''', (before, limit))
+        else:
+            cursor.execute('''
+                SELECT * FROM journal_entries 
+                WHERE (created_at, id) < (?, ?)
+                ORDER BY created_at DESC, id DESC 
+                LIMIT ?
+            ''', (before, before_id, limit))
         return cursor.fetchall()
+
+    def get_entries_iter(self, before: str = None):
+        """Yield every entry older than before (all entries if None),
+        newest first, as dicts read one row at a time from the cursor.
+
+        Consume the iterator on the thread that created it.
+        """
+        cursor = self.conn.cursor()
+        if before is None:
+            cursor.execute('SELECT * FROM journal_entries ORDER BY created_at DESC, id DESC')
+        else:
+            cursor.execute('''
+                SELECT * FROM journal_entries
+                WHERE created_at < ?
+                ORDER BY created_at DESC, id DESC
+            ''', (before,))
+        for row in cursor:
+            yield dict(row)
     
     def get_entry(self, entry_id: int):
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM journal_entries WHERE id = ?', (entry_id,))
-        return cursor.fetchone()
+        return self.conn.execute('SELECT * FROM journal_entries WHERE id = ?', (entry_id,)).fetchone()
     
     def search_entries(self, query: str = None, tag_ids: list = None, 
                       deck_id: int = None, spread_id: int = None,
                       cartomancy_type: str = None, card_name: str = None,
                       date_from: str = None, date_to: str = None):
         """Search entries with various filters"""
+        return self._execute_entry_search(
+            query, tag_ids, deck_id, spread_id, cartomancy_type, card_name,
+            date_from, date_to
+        ).fetchall()
+
+    def search_entries_iter(self, **filters):
+        """Like search_entries, but yields each match as a dict while
+        stepping the cursor instead of building the whole result list.
+
+        Consume the iterator on the thread that created it; the cursor
+        belongs to that thread's connection.
+        """
+        for row in self._execute_entry_search(**filters):
+            yield dict(row)
+
+    def _execute_entry_search(self, query: str = None, tag_ids: list = None,
+                              deck_id: int = None, spread_id: int = None,
+                              cartomancy_type: str = None, card_name: str = None,
+                              date_from: str = None, date_to: str = None):
         cursor = self.conn.cursor()
         
         sql = 'SELECT DISTINCT je.* FROM journal_entries je'
@@ -1111,12 +1765,31 @@ class Database:
                 conditions.append('er.cartomancy_type = ?')
                 params.append(cartomancy_type)
             if card_name:
-                conditions.append('er.cards_used LIKE ?')
-                params.append(f'%{card_name}%')
+                # Partial names match too ("Tower" finds "The Tower");
+                # trigrams need at least three characters to match anything
+                if self._has_card_fts and len(card_name) >= 3:
+                    conditions.append(
+                        'er.id IN (SELECT erc.reading_id FROM entry_reading_cards_fts '
+                        'JOIN entry_reading_cards erc ON erc.id = entry_reading_cards_fts.rowid '
+                        'WHERE entry_reading_cards_fts MATCH ?)'
+                    )
+                    params.append('"' + card_name.replace('"', '""') + '"')
+                else:
+                    joins.append('JOIN entry_reading_cards erc ON erc.reading_id = er.id')
+                    conditions.append('erc.card_name LIKE ?')
+                    params.append(f'%{card_name}%')
         
         if query:
-            conditions.append('(je.title LIKE ? OR je.content LIKE ?)')
-            params.extend([f'%{query}%', f'%{query}%'])
+            # Trigrams need at least three characters to match anything
+            if self._has_fts and len(query) >= 3:
+                conditions.append(
+                    'je.id IN (SELECT rowid FROM journal_entries_fts '
+                    'WHERE journal_entries_fts MATCH ?)'
+                )
+                params.append('"' + query.replace('"', '""') + '"')
+            else:
+                conditions.append('(je.title LIKE ? OR je.content LIKE ?)')
+                params.extend([f'%{query}%', f'%{query}%'])
         
         if date_from:
             conditions.append('je.created_at >= ?')
@@ -1132,7 +1805,7 @@ class Database:
         sql += ' ORDER BY je.created_at DESC'
         
         cursor.execute(sql, params)
-        return cursor.fetchall()
+        return cursor
     
     def add_entry(self, title: str = None, content: str = None,
                   reading_datetime: str = None, location_name: str = None,
@@ -1157,7 +1830,6 @@ class Database:
                      location_lat: float = None, location_lon: float = None,
                      querent_id: int = None, reader_id: int = None):
         cursor = self.conn.cursor()
-        now = datetime.now().isoformat()
         updates = []
         params = []
 
@@ -1187,8 +1859,11 @@ class Database:
             params.append(reader_id if reader_id != 0 else None)
 
         if updates:
+            # Local ISO timestamps, matching add_entry; SQLite's
+            # CURRENT_TIMESTAMP is UTC in a different format and would
+            # mis-sort against existing rows
             updates.append('updated_at = ?')
-            params.append(now)
+            params.append(datetime.now().isoformat())
             params.append(entry_id)
             cursor.execute(f'UPDATE journal_entries SET {", ".join(updates)} WHERE id = ?', params)
             self._commit()
@@ -1200,12 +1875,10 @@ class Database:
     
     # === Entry Readings ===
     def get_entry_readings(self, entry_id: int):
-        cursor = self.conn.cursor()
-        cursor.execute(
+        return self.conn.execute(
             'SELECT * FROM entry_readings WHERE entry_id = ? ORDER BY position_order',
             (entry_id,)
-        )
-        return cursor.fetchall()
+        ).fetchall()
     
     def add_entry_reading(self, entry_id: int, spread_id: int = None, spread_name: str = None,
                          deck_id: int = None, deck_name: str = None, 
@@ -1217,7 +1890,7 @@ class Database:
             (entry_id, spread_id, spread_name, deck_id, deck_name, cartomancy_type, cards_used, position_order)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         ''', (entry_id, spread_id, spread_name, deck_id, deck_name, 
-              cartomancy_type, json.dumps(cards_used) if cards_used else None, position_order))
+              cartomancy_type, _dumps(cards_used) if cards_used else None, position_order))
         self._commit()
         return cursor.lastrowid
     
@@ -1234,52 +1907,65 @@ class Database:
         """
         cursor = self.conn.cursor()
 
+        # Readings, tags and notes are fetched for all exported entries at
+        # once and grouped by entry_id, rather than queried per entry. The
+        # id list is bound as one JSON array so it isn't limited by
+        # SQLite's bound-parameter cap.
         if entry_ids:
-            placeholders = ','.join('?' * len(entry_ids))
-            cursor.execute(f'SELECT * FROM journal_entries WHERE id IN ({placeholders})', entry_ids)
+            entry_filter = 'WHERE {column} IN (SELECT value FROM json_each(?))'
+            params = (_dumps(list(entry_ids)),)
         else:
-            cursor.execute('SELECT * FROM journal_entries')
+            entry_filter = ''
+            params = ()
+
+        cursor.execute(
+            f'SELECT * FROM journal_entries {entry_filter.format(column="id")}', params
+        )
+        entries = cursor.fetchall()
+
+        readings_by_entry = defaultdict(list)
+        cursor.execute(f'''
+            SELECT * FROM entry_readings {entry_filter.format(column="entry_id")}
+            ORDER BY entry_id, position_order, id
+        ''', params)
+        for reading in cursor.fetchall():
+            reading_dict = dict(reading)
+            # Parse cards_used JSON string
+            if reading_dict.get('cards_used'):
+                reading_dict['cards_used'] = _loads(reading_dict['cards_used'])
+            readings_by_entry[reading_dict['entry_id']].append(reading_dict)
+
+        tags_by_entry = defaultdict(list)
+        cursor.execute(f'''
+            SELECT et.entry_id AS tagged_entry_id, t.* FROM tags t
+            JOIN entry_tags et ON t.id = et.tag_id
+            {entry_filter.format(column="et.entry_id")}
+            ORDER BY et.entry_id, et.tag_id
+        ''', params)
+        for tag in cursor.fetchall():
+            tag_dict = dict(tag)
+            tags_by_entry[tag_dict.pop('tagged_entry_id')].append(tag_dict)
+
+        notes_by_entry = defaultdict(list)
+        cursor.execute(f'''
+            SELECT * FROM follow_up_notes {entry_filter.format(column="entry_id")}
+            ORDER BY entry_id, created_at ASC, id
+        ''', params)
+        for note in cursor.fetchall():
+            notes_by_entry[note['entry_id']].append(dict(note))
+
+        # Querent and reader profile names (for portability)
+        profile_names = {profile['id']: profile['name'] for profile in self.get_profiles()}
 
         entries_data = []
-        for entry in cursor.fetchall():
+        for entry in entries:
             entry_dict = dict(entry)
             entry_id = entry_dict['id']
-
-            # Get readings for this entry
-            readings = self.get_entry_readings(entry_id)
-            entry_dict['readings'] = []
-            for reading in readings:
-                reading_dict = dict(reading)
-                # Parse cards_used JSON string
-                if reading_dict.get('cards_used'):
-                    reading_dict['cards_used'] = json.loads(reading_dict['cards_used'])
-                entry_dict['readings'].append(reading_dict)
-
-            # Get tags for this entry
-            cursor.execute('''
-                SELECT t.* FROM tags t
-                JOIN entry_tags et ON t.id = et.tag_id
-                WHERE et.entry_id = ?
-            ''', (entry_id,))
-            entry_dict['tags'] = [dict(tag) for tag in cursor.fetchall()]
-
-            # Get querent and reader profile names (for portability)
-            if entry_dict.get('querent_id'):
-                querent = self.get_profile(entry_dict['querent_id'])
-                entry_dict['querent_name'] = querent['name'] if querent else None
-            else:
-                entry_dict['querent_name'] = None
-
-            if entry_dict.get('reader_id'):
-                reader = self.get_profile(entry_dict['reader_id'])
-                entry_dict['reader_name'] = reader['name'] if reader else None
-            else:
-                entry_dict['reader_name'] = None
-
-            # Get follow-up notes
-            follow_up_notes = self.get_follow_up_notes(entry_id)
-            entry_dict['follow_up_notes'] = [dict(note) for note in follow_up_notes]
-
+            entry_dict['readings'] = readings_by_entry.get(entry_id, [])
+            entry_dict['tags'] = tags_by_entry.get(entry_id, [])
+            entry_dict['querent_name'] = profile_names.get(entry_dict.get('querent_id'))
+            entry_dict['reader_name'] = profile_names.get(entry_dict.get('reader_id'))
+            entry_dict['follow_up_notes'] = notes_by_entry.get(entry_id, [])
             entries_data.append(entry_dict)
 
         return {
@@ -1341,25 +2027,36 @@ class Database:
         skipped_count = 0
         tag_map = {}  # old_tag_id -> new_tag_id
 
+        # Name -> id lookups, built once. setdefault keeps the first match
+        # in each getter's order, as the old per-entry linear scans did.
+        profile_ids = {}
+        for p in self.get_profiles():
+            profile_ids.setdefault(p['name'], p['id'])
+        spread_ids = {}
+        for s in self.get_spreads():
+            spread_ids.setdefault(s['name'], s['id'])
+        deck_ids = {}
+        for d in self.get_decks():
+            deck_ids.setdefault(d['name'], d['id'])
+        tag_ids = {}
+        for t in self.get_tags():
+            tag_ids.setdefault(t['name'], t['id'])
+
+        # Follow-up notes for every entry, inserted together at the end
+        follow_up_rows = []
+
         with self.transaction():
+          cursor = self.conn.cursor()
           for entry_data in data['entries']:
             # Look up querent and reader by name
             querent_id = None
             reader_id = None
 
             if entry_data.get('querent_name'):
-                profiles = self.get_profiles()
-                for p in profiles:
-                    if p['name'] == entry_data['querent_name']:
-                        querent_id = p['id']
-                        break
+                querent_id = profile_ids.get(entry_data['querent_name'])
 
             if entry_data.get('reader_name'):
-                profiles = self.get_profiles()
-                for p in profiles:
-                    if p['name'] == entry_data['reader_name']:
-                        reader_id = p['id']
-                        break
+                reader_id = profile_ids.get(entry_data['reader_name'])
 
             # Create new entry (don't reuse IDs)
             entry_id = self.add_entry(
@@ -1373,36 +2070,31 @@ class Database:
                 reader_id=reader_id
             )
 
-            # Import readings
+            # Import readings, one executemany per entry
+            reading_rows = []
             for reading in entry_data.get('readings', []):
                 # Look up spread and deck by name (IDs may differ)
                 spread_id = None
                 deck_id = None
 
                 if reading.get('spread_name'):
-                    spreads = self.get_spreads()
-                    for s in spreads:
-                        if s['name'] == reading['spread_name']:
-                            spread_id = s['id']
-                            break
+                    spread_id = spread_ids.get(reading['spread_name'])
 
                 if reading.get('deck_name'):
-                    decks = self.get_decks()
-                    for d in decks:
-                        if d['name'] == reading['deck_name']:
-                            deck_id = d['id']
-                            break
-
-                self.add_entry_reading(
-                    entry_id=entry_id,
-                    spread_id=spread_id,
-                    spread_name=reading.get('spread_name'),
-                    deck_id=deck_id,
-                    deck_name=reading.get('deck_name'),
-                    cartomancy_type=reading.get('cartomancy_type'),
-                    cards_used=reading.get('cards_used'),
-                    position_order=reading.get('position_order', 0)
-                )
+                    deck_id = deck_ids.get(reading['deck_name'])
+
+                cards_used = reading.get('cards_used')
+                reading_rows.append((
+                    entry_id, spread_id, reading.get('spread_name'), deck_id,
+                    reading.get('deck_name'), reading.get('cartomancy_type'),
+                    _dumps(cards_used) if cards_used else None,
+                    reading.get('position_order', 0)
+                ))
+            cursor.executemany('''
+                INSERT INTO entry_readings
+                (entry_id, spread_id, spread_name, deck_id, deck_name, cartomancy_type, cards_used, position_order)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', reading_rows)
 
             # Import tags
             if merge_tags:
@@ -1411,38 +2103,35 @@ class Database:
 
                     if old_tag_id not in tag_map:
                         # Check if tag with same name exists
-                        existing_tags = self.get_tags()
-                        existing_tag = None
-                        for t in existing_tags:
-                            if t['name'] == tag_data['name']:
-                                existing_tag = t
-                                break
-
-                        if existing_tag:
-                            tag_map[old_tag_id] = existing_tag['id']
+                        existing_tag_id = tag_ids.get(tag_data['name'])
+
+                        if existing_tag_id is not None:
+                            tag_map[old_tag_id] = existing_tag_id
                         else:
                             # Create new tag
                             new_tag_id = self.add_tag(
                                 name=tag_data['name'],
                                 color=tag_data.get('color', '#6B5B95')
                             )
+                            tag_ids[tag_data['name']] = new_tag_id
                             tag_map[old_tag_id] = new_tag_id
 
                     # Link tag to entry
                     self.add_entry_tag(entry_id, tag_map[old_tag_id])
 
-            # Import follow-up notes
+            # Import follow-up notes, keeping their original timestamps
             for note_data in entry_data.get('follow_up_notes', []):
-                # Insert directly with original timestamp preserved
-                cursor = self.conn.cursor()
-                cursor.execute('''
-                    INSERT INTO follow_up_notes (entry_id, content, created_at)
-                    VALUES (?, ?, ?)
-                ''', (entry_id, note_data.get('content', ''), note_data.get('created_at')))
-                self._commit()
+                follow_up_rows.append(
+                    (entry_id, note_data.get('content', ''), note_data.get('created_at'))
+                )
 
             imported_count += 1
 
+          cursor.executemany('''
+              INSERT INTO follow_up_notes (entry_id, content, created_at)
+              VALUES (?, ?, ?)
+          ''', follow_up_rows)
+
         result = {
             'imported': imported_count,
             'skipped': skipped_count,
@@ -1483,15 +2172,11 @@ class Database:
     # === Profiles ===
     def get_profiles(self):
         """Get all profiles"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM profiles ORDER BY name')
-        return cursor.fetchall()
+        return self.conn.execute('SELECT * FROM profiles ORDER BY name').fetchall()
 
     def get_profile(self, profile_id: int):
         """Get a single profile by ID"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM profiles WHERE id = ?', (profile_id,))
-        return cursor.fetchone()
+        return self._get_cached_row('profiles', profile_id)
 
     def add_profile(self, name: str, gender: str = None, birth_date: str = None,
                     birth_time: str = None, birth_place_name: str = None,
@@ -1541,6 +2226,7 @@ class Database:
         if updates:
             params.append(profile_id)
             cursor.execute(f'UPDATE profiles SET {", ".join(updates)} WHERE id = ?', params)
+            self._invalidate_row('profiles', profile_id)
             self._commit()
 
     def delete_profile(self, profile_id: int):
@@ -1551,18 +2237,17 @@ class Database:
         cursor.execute('UPDATE journal_entries SET reader_id = NULL WHERE reader_id = ?', (profile_id,))
         # Delete the profile
         cursor.execute('DELETE FROM profiles WHERE id = ?', (profile_id,))
+        self._invalidate_row('profiles', profile_id)
         self._commit()
 
     # === Follow-up Notes ===
     def get_follow_up_notes(self, entry_id: int):
         """Get all follow-up notes for an entry, ordered by date"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
+        return self.conn.execute('''
             SELECT * FROM follow_up_notes
             WHERE entry_id = ?
             ORDER BY created_at ASC
-        ''', (entry_id,))
-        return cursor.fetchall()
+        ''', (entry_id,)).fetchall()
 
     def add_follow_up_note(self, entry_id: int, content: str):
         """Add a follow-up note to an entry"""
@@ -1590,14 +2275,10 @@ class Database:
 
     # === Tags ===
     def get_tags(self):
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM tags ORDER BY name')
-        return cursor.fetchall()
+        return self.conn.execute('SELECT * FROM tags ORDER BY name').fetchall()
     
     def get_tag(self, tag_id: int):
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM tags WHERE id = ?', (tag_id,))
-        return cursor.fetchone()
+        return self._get_cached_row('tags', tag_id)
     
     def add_tag(self, name: str, color: str = '#6B5B95'):
         cursor = self.conn.cursor()
@@ -1611,22 +2292,22 @@ class Database:
             cursor.execute('UPDATE tags SET name = ? WHERE id = ?', (name, tag_id))
         if color:
             cursor.execute('UPDATE tags SET color = ? WHERE id = ?', (color, tag_id))
+        self._invalidate_row('tags', tag_id)
         self._commit()
     
     def delete_tag(self, tag_id: int):
         cursor = self.conn.cursor()
         cursor.execute('DELETE FROM tags WHERE id = ?', (tag_id,))
+        self._invalidate_row('tags', tag_id)
         self._commit()
     
     def get_entry_tags(self, entry_id: int):
-        cursor = self.conn.cursor()
-        cursor.execute('''
+        return self.conn.execute('''
             SELECT t.* FROM tags t
             JOIN entry_tags et ON t.id = et.tag_id
             WHERE et.entry_id = ?
             ORDER BY t.name
-        ''', (entry_id,))
-        return cursor.fetchall()
+        ''', (entry_id,)).fetchall()
     
     def add_entry_tag(self, entry_id: int, tag_id: int):
         cursor = self.conn.cursor()
@@ -1648,25 +2329,20 @@ class Database:
         """Replace all tags for an entry"""
         cursor = self.conn.cursor()
         cursor.execute('DELETE FROM entry_tags WHERE entry_id = ?', (entry_id,))
-        for tag_id in tag_ids:
-            cursor.execute(
-                'INSERT INTO entry_tags (entry_id, tag_id) VALUES (?, ?)',
-                (entry_id, tag_id)
-            )
+        cursor.executemany(
+            'INSERT INTO entry_tags (entry_id, tag_id) VALUES (?, ?)',
+            [(entry_id, tag_id) for tag_id in tag_ids]
+        )
         self._commit()
 
     # === Deck Tags ===
     def get_deck_tags(self):
         """Get all deck tags"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM deck_tags ORDER BY name')
-        return cursor.fetchall()
+        return self.conn.execute('SELECT * FROM deck_tags ORDER BY name').fetchall()
 
     def get_deck_tag(self, tag_id: int):
         """Get a single deck tag by ID"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM deck_tags WHERE id = ?', (tag_id,))
-        return cursor.fetchone()
+        return self._get_cached_row('deck_tags', tag_id)
 
     def add_deck_tag(self, name: str, color: str = '#6B5B95'):
         """Create a new deck tag"""
@@ -1682,24 +2358,24 @@ class Database:
             cursor.execute('UPDATE deck_tags SET name = ? WHERE id = ?', (name, tag_id))
         if color:
             cursor.execute('UPDATE deck_tags SET color = ? WHERE id = ?', (color, tag_id))
+        self._invalidate_row('deck_tags', tag_id)
         self._commit()
 
     def delete_deck_tag(self, tag_id: int):
         """Delete a deck tag (cascades to assignments)"""
         cursor = self.conn.cursor()
         cursor.execute('DELETE FROM deck_tags WHERE id = ?', (tag_id,))
+        self._invalidate_row('deck_tags', tag_id)
         self._commit()
 
     def get_tags_for_deck(self, deck_id: int):
         """Get all tags assigned to a deck"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
+        return self.conn.execute('''
             SELECT t.* FROM deck_tags t
             JOIN deck_tag_assignments dta ON t.id = dta.tag_id
             WHERE dta.deck_id = ?
             ORDER BY t.name
-        ''', (deck_id,))
-        return cursor.fetchall()
+        ''', (deck_id,)).fetchall()
 
     def add_tag_to_deck(self, deck_id: int, tag_id: int):
         """Assign a tag to a deck"""
@@ -1723,25 +2399,20 @@ class Database:
         """Replace all tags for a deck"""
         cursor = self.conn.cursor()
         cursor.execute('DELETE FROM deck_tag_assignments WHERE deck_id = ?', (deck_id,))
-        for tag_id in tag_ids:
-            cursor.execute(
-                'INSERT INTO deck_tag_assignments (deck_id, tag_id) VALUES (?, ?)',
-                (deck_id, tag_id)
-            )
+        cursor.executemany(
+            'INSERT INTO deck_tag_assignments (deck_id, tag_id) VALUES (?, ?)',
+            [(deck_id, tag_id) for tag_id in tag_ids]
+        )
         self._commit()
 
     # === Card Tags ===
     def get_card_tags(self):
         """Get all card tags"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM card_tags ORDER BY name')
-        return cursor.fetchall()
+        return self.conn.execute('SELECT * FROM card_tags ORDER BY name').fetchall()
 
     def get_card_tag(self, tag_id: int):
         """Get a single card tag by ID"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM card_tags WHERE id = ?', (tag_id,))
-        return cursor.fetchone()
+        return self._get_cached_row('card_tags', tag_id)
 
     def add_card_tag(self, name: str, color: str = '#6B5B95'):
         """Create a new card tag"""
@@ -1757,36 +2428,34 @@ class Database:
             cursor.execute('UPDATE card_tags SET name = ? WHERE id = ?', (name, tag_id))
         if color:
             cursor.execute('UPDATE card_tags SET color = ? WHERE id = ?', (color, tag_id))
+        self._invalidate_row('card_tags', tag_id)
         self._commit()
 
     def delete_card_tag(self, tag_id: int):
         """Delete a card tag (cascades to assignments)"""
         cursor = self.conn.cursor()
         cursor.execute('DELETE FROM card_tags WHERE id = ?', (tag_id,))
+        self._invalidate_row('card_tags', tag_id)
         self._commit()
 
     def get_tags_for_card(self, card_id: int):
         """Get all tags directly assigned to a card"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
+        return self.conn.execute('''
             SELECT t.* FROM card_tags t
             JOIN card_tag_assignments cta ON t.id = cta.tag_id
             WHERE cta.card_id = ?
             ORDER BY t.name
-        ''', (card_id,))
-        return cursor.fetchall()
+        ''', (card_id,)).fetchall()
 
     def get_inherited_tags_for_card(self, card_id: int):
         """Get deck tags inherited by a card (from its parent deck)"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
+        return self.conn.execute('''
             SELECT dt.* FROM deck_tags dt
             JOIN deck_tag_assignments dta ON dt.id = dta.tag_id
             JOIN cards c ON c.deck_id = dta.deck_id
             WHERE c.id = ?
             ORDER BY dt.name
-        ''', (card_id,))
-        return cursor.fetchall()
+        ''', (card_id,)).fetchall()
 
     def add_tag_to_card(self, card_id: int, tag_id: int):
         """Assign a tag to a card"""
@@ -1810,25 +2479,20 @@ class Database:
         """Replace all tags for a card"""
         cursor = self.conn.cursor()
         cursor.execute('DELETE FROM card_tag_assignments WHERE card_id = ?', (card_id,))
-        for tag_id in tag_ids:
-            cursor.execute(
-                'INSERT INTO card_tag_assignments (card_id, tag_id) VALUES (?, ?)',
-                (card_id, tag_id)
-            )
+        cursor.executemany(
+            'INSERT INTO card_tag_assignments (card_id, tag_id) VALUES (?, ?)',
+            [(card_id, tag_id) for tag_id in tag_ids]
+        )
         self._commit()
 
     # === Card Groups (per-deck custom groupings) ===
     def get_card_groups(self, deck_id: int):
         """Get all card groups for a deck, ordered by sort_order"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM card_groups WHERE deck_id = ? ORDER BY sort_order, name', (deck_id,))
-        return cursor.fetchall()
+        return self.conn.execute('SELECT * FROM card_groups WHERE deck_id = ? ORDER BY sort_order, name', (deck_id,)).fetchall()
 
     def get_card_group(self, group_id: int):
         """Get a single card group by ID"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM card_groups WHERE id = ?', (group_id,))
-        return cursor.fetchone()
+        return self.conn.execute('SELECT * FROM card_groups WHERE id = ?', (group_id,)).fetchone()
 
     def add_card_group(self, deck_id: int, name: str, color: str = '#6B5B95'):
         """Create a new card group for a deck, placed at the end"""
@@ -1871,34 +2535,40 @@ class Database:
 
     def get_groups_for_card(self, card_id: int):
         """Get all groups a card belongs to"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
+        return self.conn.execute('''
             SELECT g.* FROM card_groups g
             JOIN card_group_assignments cga ON g.id = cga.group_id
             WHERE cga.card_id = ?
             ORDER BY g.sort_order, g.name
-        ''', (card_id,))
-        return cursor.fetchall()
+        ''', (card_id,)).fetchall()
 
     def set_card_groups(self, card_id: int, group_ids: list):
         """Replace all group memberships for a card"""
         cursor = self.conn.cursor()
         cursor.execute('DELETE FROM card_group_assignments WHERE card_id = ?', (card_id,))
-        for group_id in group_ids:
-            cursor.execute(
-                'INSERT INTO card_group_assignments (card_id, group_id) VALUES (?, ?)',
-                (card_id, group_id)
-            )
+        cursor.executemany(
+            'INSERT INTO card_group_assignments (card_id, group_id) VALUES (?, ?)',
+            [(card_id, group_id) for group_id in group_ids]
+        )
+        self._commit()
+
+    def add_card_to_group(self, card_id: int, group_id: int):
+        """Add a card to a group"""
+        cursor = self.conn.cursor()
+        cursor.execute(
+            'INSERT OR IGNORE INTO card_group_assignments (card_id, group_id) VALUES (?, ?)',
+            (card_id, group_id)
+        )
         self._commit()
 
     def get_cards_in_group(self, group_id: int):
         """Get all card IDs in a specific group"""
-        cursor = self.conn.cursor()
+        cursor = self._fast_cursor()
         cursor.execute(
             'SELECT card_id FROM card_group_assignments WHERE group_id = ?',
             (group_id,)
         )
-        return [row['card_id'] for row in cursor.fetchall()]
+        return [row[0] for row in cursor.fetchall()]
 
     # === Card Archetypes ===
     def get_archetypes(self, cartomancy_type: str = None):
@@ -1936,12 +2606,10 @@ class Database:
 
     def get_archetype_by_name(self, name: str, cartomancy_type: str):
         """Get a specific archetype by name and type"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
+        return self.conn.execute('''
             SELECT * FROM card_archetypes
             WHERE name = ? AND cartomancy_type = ?
-        ''', (name, cartomancy_type))
-        return cursor.fetchone()
+        ''', (name, cartomancy_type)).fetchone()
 
     def parse_card_name_for_archetype(self, card_name: str, cartomancy_type: str):
         """
@@ -1965,83 +2633,15 @@ class Database:
 
     def _parse_tarot_card_name(self, card_name: str, card_name_lower: str):
         """Parse Tarot card names and return (archetype, rank, suit)"""
-        # Check for exact major arcana match
-        if card_name_lower in MAJOR_ARCANA_ALIASES:
-            return MAJOR_ARCANA_ALIASES[card_name_lower]
-
-        # Minor Arcana parsing - find suit and rank
-        found_suit = None
-        found_rank = None
-        found_rank_num = None
-
-        for suit_key, suit_name in TAROT_SUIT_ALIASES.items():
-            if suit_key in card_name_lower:
-                found_suit = suit_name
-                break
-
-        for rank_key, (rank_name, rank_num) in TAROT_RANK_ALIASES.items():
-            if rank_key in card_name_lower.split() or card_name_lower.startswith(rank_key + ' '):
-                found_rank = rank_name
-                found_rank_num = rank_num
-                break
-
-        if found_suit and found_rank:
-            archetype = f"{found_rank} of {found_suit}"
-            rank = str(TAROT_SUIT_BASES[found_suit] + found_rank_num)
-            return archetype, rank, found_suit
-
-        return None, None, None
+        return parse_tarot_card(card_name_lower) or (None, None, None)
 
     def _parse_lenormand_card_name(self, card_name: str, card_name_lower: str):
         """Parse Lenormand card names and return (archetype, rank, suit)"""
-        import re
-
-        # Try alias match first
-        for key, (name, rank) in LENORMAND_ALIASES.items():
-            if key in card_name_lower:
-                return name, rank, None
-
-        # Try matching by number prefix (e.g., "01 Rider", "1. Rider")
-        num_match = re.match(r'^(\d+)\D', card_name)
-        if num_match:
-            num = int(num_match.group(1))
-            if 1 <= num <= 36:
-                # Find the card with this number
-                for key, (name, rank) in LENORMAND_ALIASES.items():
-                    if rank == str(num):
-                        return name, rank, None
-
-        return None, None, None
+        return parse_lenormand_card(card_name, card_name_lower) or (None, None, None)
 
     def _parse_playing_card_name(self, card_name: str, card_name_lower: str):
         """Parse Playing Card names and return (archetype, rank, suit)"""
-        # Check for joker
-        if 'joker' in card_name_lower:
-            if 'red' in card_name_lower:
-                return 'Red Joker', 'Joker', None
-            elif 'black' in card_name_lower:
-                return 'Black Joker', 'Joker', None
-            else:
-                return 'Red Joker', 'Joker', None  # Default to red
-
-        found_suit = None
-        found_rank = None
-
-        for suit_key, suit_name in PLAYING_CARD_SUIT_ALIASES.items():
-            if suit_key in card_name_lower:
-                found_suit = suit_name
-                break
-
-        for rank_key, (rank_name, _) in PLAYING_CARD_RANK_ALIASES.items():
-            if rank_key in card_name_lower.split() or card_name_lower.startswith(rank_key + ' '):
-                found_rank = rank_name
-                break
-
-        if found_suit and found_rank:
-            archetype = f"{found_rank} of {found_suit}"
-            return archetype, found_rank, found_suit
-
-        return None, None, None
+        return parse_playing_card(card_name_lower) or (None, None, None)
 
     def auto_assign_card_metadata(self, card_id: int, card_name: str, cartomancy_type: str,
                                    preset_name: str = None):
@@ -2150,12 +2750,17 @@ class Database:
                         updated += 1
         else:
             # Fall back to legacy parsing (no preset ordering)
-            for card in cards:
-                existing_archetype = card['archetype'] if 'archetype' in card.keys() else None
-                if not overwrite and existing_archetype:
-                    continue
+            if not overwrite:
+                cards = [card for card in cards
+                         if not (card['archetype'] if 'archetype' in card.keys() else None)]
+            if cartomancy_type == 'Tarot':
+                parsed = [result or (None, None, None)
+                          for result in parse_cards_batch([card['name'] for card in cards])]
+            else:
+                parsed = [self.parse_card_name_for_archetype(card['name'], cartomancy_type)
+                          for card in cards]
 
-                archetype, rank, suit = self.parse_card_name_for_archetype(card['name'], cartomancy_type)
+            for card, (archetype, rank, suit) in zip(cards, parsed):
                 if archetype or rank or suit:
                     self.update_card_metadata(card['id'], archetype=archetype, rank=rank, suit=suit)
                     updated += 1
@@ -2196,28 +2801,67 @@ class Database:
             cursor.execute(f'UPDATE cards SET {", ".join(updates)} WHERE id = ?', params)
             self._commit()
 
+    def bulk_update_card_metadata(self, card_ids: list, archetype: str = None, rank: str = None,
+                                  suit: str = None, notes: str = None, append_notes: bool = False,
+                                  custom_fields: dict = None):
+        """Apply the same metadata change to many cards with one prepared UPDATE.
+
+        Fields left as None are not touched. With append_notes, notes are
+        added on a new line after any existing notes. custom_fields are
+        merged into each card's existing custom fields (unparseable stored
+        values are replaced).
+        """
+        updates = []
+        params = []
+
+        if archetype is not None:
+            updates.append('archetype = ?')
+            params.append(archetype)
+        if rank is not None:
+            updates.append('rank = ?')
+            params.append(rank)
+        if suit is not None:
+            updates.append('suit = ?')
+            params.append(suit)
+        if notes is not None:
+            if append_notes:
+                updates.append("notes = CASE WHEN COALESCE(notes, '') = '' THEN ? "
+                               "ELSE notes || char(10) || ? END")
+                params.extend([notes, notes])
+            else:
+                updates.append('notes = ?')
+                params.append(notes)
+        if custom_fields:
+            updates.append("custom_fields = json_patch(CASE WHEN json_valid(custom_fields) "
+                           "THEN custom_fields ELSE '{}' END, ?)")
+            params.append(json.dumps(custom_fields, separators=(',', ':')))
+
+        if updates and card_ids:
+            cursor = self.conn.cursor()
+            cursor.executemany(
+                f'UPDATE cards SET {", ".join(updates)} WHERE id = ?',
+                [(*params, card_id) for card_id in card_ids]
+            )
+            self._commit()
+
     def get_card_with_metadata(self, card_id: int):
         """Get a card with all its metadata"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
+        return self.conn.execute('''
             SELECT c.*, d.cartomancy_type_id, ct.name as cartomancy_type_name
             FROM cards c
             JOIN decks d ON c.deck_id = d.id
             JOIN cartomancy_types ct ON d.cartomancy_type_id = ct.id
             WHERE c.id = ?
-        ''', (card_id,))
-        return cursor.fetchone()
+        ''', (card_id,)).fetchone()
 
     # === Deck Custom Fields ===
     def get_deck_custom_fields(self, deck_id: int):
         """Get custom field definitions for a deck"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
+        return self.conn.execute('''
             SELECT * FROM deck_custom_fields
             WHERE deck_id = ?
             ORDER BY field_order, id
-        ''', (deck_id,))
-        return cursor.fetchall()
+        ''', (deck_id,)).fetchall()
 
     def add_deck_custom_field(self, deck_id: int, field_name: str, field_type: str,
                               field_options: list = None, field_order: int = 0):
@@ -2266,13 +2910,11 @@ class Database:
     # === Card Custom Fields ===
     def get_card_custom_fields(self, card_id: int):
         """Get custom fields for a specific card"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
+        return self.conn.execute('''
             SELECT * FROM card_custom_fields
             WHERE card_id = ?
             ORDER BY field_order, id
-        ''', (card_id,))
-        return cursor.fetchall()
+        ''', (card_id,)).fetchall()
 
     def add_card_custom_field(self, card_id: int, field_name: str, field_type: str,
                               field_value: str = None, field_options: list = None,
@@ -2324,18 +2966,18 @@ class Database:
 
     def get_deck_card_custom_field_values(self, deck_id: int, field_name: str):
         """Get all values for a deck-level custom field across all cards in the deck"""
-        cursor = self.conn.cursor()
+        cursor = self._fast_cursor()
         cursor.execute('''
             SELECT c.id as card_id, c.name as card_name, c.custom_fields
             FROM cards c
             WHERE c.deck_id = ?
         ''', (deck_id,))
         results = []
-        for row in cursor.fetchall():
-            custom_fields = json.loads(row['custom_fields']) if row['custom_fields'] else {}
+        for card_id, card_name, custom_fields_json in cursor.fetchall():
+            custom_fields = json.loads(custom_fields_json) if custom_fields_json else {}
             results.append({
-                'card_id': row['card_id'],
-                'card_name': row['card_name'],
+                'card_id': card_id,
+                'card_name': card_name,
                 'value': custom_fields.get(field_name)
             })
         return results
@@ -2356,17 +2998,14 @@ class Database:
         cursor = self.conn.cursor()
         stats = {}
         
-        cursor.execute('SELECT COUNT(*) FROM journal_entries')
-        stats['total_entries'] = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM decks')
-        stats['total_decks'] = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM cards')
-        stats['total_cards'] = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM spreads')
-        stats['total_spreads'] = cursor.fetchone()[0]
+        cursor.execute('''
+            SELECT (SELECT COUNT(*) FROM journal_entries),
+                   (SELECT COUNT(*) FROM decks),
+                   (SELECT COUNT(*) FROM cards),
+                   (SELECT COUNT(*) FROM spreads)
+        ''')
+        (stats['total_entries'], stats['total_decks'],
+         stats['total_cards'], stats['total_spreads']) = cursor.fetchone()
         
         # Most used decks
         cursor.execute('''
@@ -2559,13 +3198,16 @@ class Database:
 
             # Import cards
             cards_imported = 0
+            deck = self.get_deck(deck_id)
+            cartomancy_type = deck['cartomancy_type_name'] if deck else None
             for card_data in deck_data.get('cards', []):
                 # Add the card
                 card_id = self.add_card(
                     deck_id=deck_id,
                     name=card_data['name'],
                     image_path=card_data.get('image_path'),
-                    card_order=card_data.get('card_order', 0)
+                    card_order=card_data.get('card_order', 0),
+                    cartomancy_type=cartomancy_type
                 )
 
                 # Update metadata
@@ -2615,7 +3257,7 @@ class Database:
         # Collect image paths if needed
         image_paths = []
         if include_images:
-            cursor = self.conn.cursor()
+            cursor = self._fast_cursor()
             cursor.execute("SELECT DISTINCT image_path FROM cards WHERE image_path IS NOT NULL AND image_path != ''")
             image_paths = [row[0] for row in cursor.fetchall()]
 
@@ -2634,6 +3276,7 @@ class Database:
 
             # Copy database (always flush, even inside a transaction)
             self.conn.commit()
+            self._apply_pending_invalidations()
             db_backup_path = temp_path / "tarot_journal.db"
             shutil.copy2(self.db_path, db_backup_path)
 
@@ -2723,8 +3366,9 @@ class Database:
                 with zipfile.ZipFile(filepath, 'r') as zf:
                     zf.extractall(temp_path)
 
-                # Close current database connection
-                self.conn.close()
+                # Close all database connections
+                self._close_connections()
+                self._clear_caches()
 
                 try:
                     # Replace database
@@ -2758,9 +3402,13 @@ class Database:
                                             shutil.copy2(img_file, dest_path)
                                             images_restored += 1
 
-                    # Reconnect to database
-                    self.conn = sqlite3.connect(self.db_path)
-                    self.conn.row_factory = sqlite3.Row
+                    # Connections reopen on next use; older backups predate the
+                    # search index, card-name table and readings view
+                    cursor = self.conn.cursor()
+                    self._has_fts = self._create_search_index(cursor)
+                    self._has_card_fts = self._create_reading_cards_table(cursor)
+                    self._create_entry_readings_view(cursor)
+                    self.conn.commit()
 
                     # Delete safety backup on success
                     if safety_backup_path and Path(safety_backup_path).exists():
@@ -2781,9 +3429,6 @@ class Database:
                     logger.error("Restore failed, rolling back to safety backup: %s", e)
                     if safety_backup_path and Path(safety_backup_path).exists():
                         shutil.copy2(safety_backup_path, self.db_path)
-                    # Reconnect to database
-                    self.conn = sqlite3.connect(self.db_path)
-                    self.conn.row_factory = sqlite3.Row
                     raise e
 
         except Exception as e:
@@ -2796,19 +3441,16 @@ class Database:
             raise e
 
     def close(self):
-        """Close the database connection (safe to call more than once)."""
-        if self.conn:
-            try:
-                self.conn.close()
-            except Exception as e:
-                logger.debug("Error closing database connection: %s", e)
-            self.conn = None
+        """Close all database connections (safe to call more than once)."""
+        self._close_connections(optimize=True)
 
 
 # Create default spreads
 def create_default_spreads(db: Database):
     """Create some common tarot and lenormand spreads"""
     spreads = db.get_spreads()
+    # Collected here and inserted with a single executemany/commit
+    default_spreads = []
     if len(spreads) == 0:
         # Card dimensions - smaller for better fit
         cw, ch = 60, 90  # card width, height
@@ -2816,17 +3458,17 @@ def create_default_spreads(db: Database):
         # === TAROT SPREADS ===
         
         # Single card
-        db.add_spread(
+        default_spreads.append((
             "Daily Draw",
             [
                 {"x": 200, "y": 100, "label": "Card of the Day", "width": cw, "height": ch}
             ],
             "A single card for daily reflection",
             "Tarot"
-        )
+        ))
         
         # Three card spread (line)
-        db.add_spread(
+        default_spreads.append((
             "Three Card Line",
             [
                 {"x": 80, "y": 100, "label": "Past", "width": cw, "height": ch},
@@ -2835,10 +3477,10 @@ def create_default_spreads(db: Database):
             ],
             "A simple past-present-future reading",
             "Tarot"
-        )
+        ))
         
         # Five card spread (line)
-        db.add_spread(
+        default_spreads.append((
             "Five Card Line",
             [
                 {"x": 40, "y": 100, "label": "1", "width": cw, "height": ch},
@@ -2849,10 +3491,10 @@ def create_default_spreads(db: Database):
             ],
             "Five cards in a row",
             "Tarot"
-        )
+        ))
         
         # Five card cross
-        db.add_spread(
+        default_spreads.append((
             "Five Card Cross",
             [
                 {"x": 150, "y": 110, "label": "Present", "width": cw, "height": ch},
@@ -2863,10 +3505,10 @@ def create_default_spreads(db: Database):
             ],
             "A five card cross spread for deeper insight",
             "Tarot"
-        )
+        ))
         
         # Celtic Cross - compact layout
-        db.add_spread(
+        default_spreads.append((
             "Celtic Cross",
             [
                 {"x": 120, "y": 130, "label": "Present", "width": cw, "height": ch},
@@ -2882,13 +3524,13 @@ def create_default_spreads(db: Database):
             ],
             "The classic 10-card Celtic Cross spread",
             "Tarot"
-        )
+        ))
 
         # 15-Card Golden Dawn / Thoth Spread
         # Layout: Wide X shape with horizontal triads
         # Center triad in middle, 4 triads at diagonal corners
         # Card size 50x75, gap of 8 between cards
-        db.add_spread(
+        default_spreads.append((
             "Golden Dawn 15-Card",
             [
                 # Spirit/Significator Triad (Center) - Cards 2, 1, 3 horizontal
@@ -2918,12 +3560,12 @@ def create_default_spreads(db: Database):
             ],
             "The 15-card Golden Dawn/Thoth spread with five elemental triads. Uses elemental dignities, not reversals.",
             "Tarot"
-        )
+        ))
 
         # === LENORMAND SPREADS ===
         
         # Three card line (Lenormand)
-        db.add_spread(
+        default_spreads.append((
             "Lenormand 3-Card",
             [
                 {"x": 80, "y": 100, "label": "1", "width": cw, "height": ch},
@@ -2932,10 +3574,10 @@ def create_default_spreads(db: Database):
             ],
             "Simple three-card Lenormand line",
             "Lenormand"
-        )
+        ))
         
         # Five card line (Lenormand)
-        db.add_spread(
+        default_spreads.append((
             "Lenormand 5-Card",
             [
                 {"x": 40, "y": 100, "label": "1", "width": cw, "height": ch},
@@ -2946,10 +3588,10 @@ def create_default_spreads(db: Database):
             ],
             "Five-card Lenormand line",
             "Lenormand"
-        )
+        ))
         
         # 3x3 Box (Lenormand)
-        db.add_spread(
+        default_spreads.append((
             "Lenormand 3x3 Box",
             [
                 {"x": 80, "y": 10, "label": "1", "width": cw, "height": ch},
@@ -2964,7 +3606,7 @@ def create_default_spreads(db: Database):
             ],
             "Nine-card Lenormand box spread",
             "Lenormand"
-        )
+        ))
         
         # Grand Tableau (8x4 + 4 = 36 cards)
         gt_positions = []
@@ -2981,12 +3623,14 @@ def create_default_spreads(db: Database):
                         "height": gt_ch
                     })
         
-        db.add_spread(
+        default_spreads.append((
             "Grand Tableau (9x4)",
             gt_positions,
             "Full 36-card Lenormand Grand Tableau",
             "Lenormand"
-        )
+        ))
+
+    db.bulk_add_spreads(default_spreads)
 
     # Always check for missing default spreads (for existing users)
     _add_missing_default_spreads(db)
@@ -3073,6 +3717,11 @@ def _fix_thoth_deck_metadata(db: Database):
     db.auto_assign_deck_metadata(thoth_deck['id'], overwrite=True, preset_name='Tarot (Thoth)')
 
 
+# Card image types picked up from the bundled default deck folders
+# (a tuple so str.endswith can test them all in one call)
+_DECK_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
+
+
 def create_default_decks(db: Database):
     """Import default decks if they exist and no decks have been added yet"""
     from import_presets import ImportPresets
@@ -3124,64 +3773,82 @@ def create_default_decks(db: Database):
         }
     ]
 
+    # Cartomancy type IDs by name
+    type_ids = {ct['name']: ct['id'] for ct in db.get_cartomancy_types()}
+
+    # script_dir is already resolved, so these paths are absolute
+    to_scan = []
     for deck_info in default_decks:
-        # Use script directory as base for relative paths
         folder_path = script_dir / deck_info['folder']
-
         # Skip if folder doesn't exist
-        if not folder_path.exists():
-            continue
+        if folder_path.exists() and deck_info['type'] in type_ids:
+            to_scan.append((deck_info, folder_path))
+
+    # Folder scans and filename mapping are independent per deck, so run
+    # them concurrently; the inserts stay on this thread
+    with ThreadPoolExecutor(max_workers=len(to_scan) or 1) as executor:
+        scans = list(executor.map(
+            lambda item: _scan_default_deck(presets, item[1], item[0]['preset']),
+            to_scan
+        ))
+
+    with db.transaction():
+        for (deck_info, folder_path), (card_back_path, cards_to_add) in zip(to_scan, scans):
+            # Create the deck
+            deck_id = db.add_deck(
+                name=deck_info['name'],
+                cartomancy_type_id=type_ids[deck_info['type']],
+                image_folder=str(folder_path)
+            )
 
-        # Get cartomancy type ID
-        type_id = None
-        for ct in db.get_cartomancy_types():
-            if ct['name'] == deck_info['type']:
-                type_id = ct['id']
-                break
+            if card_back_path:
+                db.update_deck(deck_id, card_back_image=card_back_path)
 
-        if not type_id:
-            continue
+            db.bulk_add_cards(deck_id, cards_to_add)
+
+
+def _scan_default_deck(presets, folder_path: Path, preset_name: str):
+    """List a default deck folder and map its images to cards.
 
-        # Create the deck
-        deck_id = db.add_deck(
-            name=deck_info['name'],
-            cartomancy_type_id=type_id,
-            image_folder=str(folder_path.absolute())
+    Returns (card_back_path, cards) with cards sorted by sort order.
+    """
+    # Look for card back image
+    card_back_path = presets.find_card_back_image(str(folder_path), preset_name)
+
+    # Import cards from folder; DirEntry.is_file() uses the type info
+    # scandir already read, so filtering costs no extra stat calls
+    with os.scandir(folder_path) as it:
+        entries = sorted(
+            (entry for entry in it
+             if entry.name.lower().endswith(_DECK_IMAGE_EXTENSIONS)
+             and entry.is_file()),
+            key=lambda entry: entry.name
         )
 
-        # Look for card back image
-        card_back_path = presets.find_card_back_image(str(folder_path), deck_info['preset'])
-        if card_back_path:
-            db.update_deck(deck_id, card_back_image=card_back_path)
-
-        # Import cards from folder
-        valid_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
-        cards_to_add = []
-
-        for filepath in sorted(folder_path.iterdir()):
-            if filepath.suffix.lower() in valid_extensions:
-                # Skip card back images
-                if presets.is_card_back_file(filepath.name, deck_info['preset']):
-                    continue
-
-                # Map filename to card name using preset
-                card_name = presets.map_filename_to_card(
-                    filepath.name,
-                    deck_info['preset']
-                )
+    is_card_back_file = presets.is_card_back_file
+    map_filename_to_card = presets.map_filename_to_card
+    get_card_metadata = presets.get_card_metadata
+
+    cards_to_add = []
+    for entry in entries:
+        # Skip card back images
+        if is_card_back_file(entry.name, preset_name):
+            continue
+
+        # Map filename to card name using preset
+        card_name = map_filename_to_card(entry.name, preset_name)
+
+        # Get full metadata including verbose rank names
+        metadata = get_card_metadata(card_name, preset_name)
+
+        cards_to_add.append({
+            'name': card_name,
+            'image_path': entry.path,
+            'sort_order': metadata.get('sort_order', 0),
+            'archetype': metadata.get('archetype'),
+            'rank': metadata.get('rank'),
+            'suit': metadata.get('suit')
+        })
 
-                # Get full metadata including verbose rank names
-                metadata = presets.get_card_metadata(card_name, deck_info['preset'])
-
-                cards_to_add.append({
-                    'name': card_name,
-                    'image_path': str(filepath.absolute()),
-                    'sort_order': metadata.get('sort_order', 0),
-                    'archetype': metadata.get('archetype'),
-                    'rank': metadata.get('rank'),
-                    'suit': metadata.get('suit')
-                })
-
-        # Sort by sort order and add to database
-        cards_to_add.sort(key=lambda x: x['sort_order'])
-        db.bulk_add_cards(deck_id, cards_to_add)
+    cards_to_add.sort(key=lambda x: x['sort_order'])
+    return card_back_path, cards_to_add
@@ -1583,57 +1583,59 @@ class JournalMixin:
             querent_id_param = querent_id if querent_id else 0
             reader_id_param = reader_id if reader_id else 0
 
-            self.db.update_entry(
-                entry_id,
-                title=title,
-                content=content,
-                reading_datetime=reading_datetime,
-                location_name=location_name,
-                location_lat=location_lat,
-                location_lon=location_lon,
-                querent_id=querent_id_param,
-                reader_id=reader_id_param
-            )
-
-            # Save reading
-            self.db.delete_entry_readings(entry_id)
-
-            spread_name = spread_choice.GetStringSelection()
-            deck_name = deck_choice.GetStringSelection()
-
-            if spread_name or deck_name or dlg._spread_cards:
-                spread_id = self._spread_map.get(spread_name)
-                deck_id = self._deck_map.get(deck_name)
-
-                cartomancy_type = None
-                if deck_id:
-                    deck = self.db.get_deck(deck_id)
-                    if deck:
-                        cartomancy_type = deck['cartomancy_type_name']
-
-                # Save cards with reversed state, deck info, and position index
-                cards_used = [
-                    {
-                        'name': c['name'],
-                        'reversed': c.get('reversed', False),
-                        'deck_id': c.get('deck_id'),
-                        'deck_name': c.get('deck_name'),
-                        'position_index': pos_idx
-                    }
-                    for pos_idx, c in dlg._spread_cards.items()
-                ]
-                deck_name_clean = deck_name.split(' (')[0] if deck_name else None
-
-                self.db.add_entry_reading(
-                    entry_id=entry_id,
-                    spread_id=spread_id,
-                    spread_name=spread_name,
-                    deck_id=deck_id,
-                    deck_name=deck_name_clean,
-                    cartomancy_type=cartomancy_type,
-                    cards_used=cards_used
+            # Entry fields and its reading are saved with a single commit
+            with self.db.transaction():
+                self.db.update_entry(
+                    entry_id,
+                    title=title,
+                    content=content,
+                    reading_datetime=reading_datetime,
+                    location_name=location_name,
+                    location_lat=location_lat,
+                    location_lon=location_lon,
+                    querent_id=querent_id_param,
+                    reader_id=reader_id_param
                 )
 
+                # Save reading
+                self.db.delete_entry_readings(entry_id)
+
+                spread_name = spread_choice.GetStringSelection()
+                deck_name = deck_choice.GetStringSelection()
+
+                if spread_name or deck_name or dlg._spread_cards:
+                    spread_id = self._spread_map.get(spread_name)
+                    deck_id = self._deck_map.get(deck_name)
+
+                    cartomancy_type = None
+                    if deck_id:
+                        deck = self.db.get_deck(deck_id)
+                        if deck:
+                            cartomancy_type = deck['cartomancy_type_name']
+
+                    # Save cards with reversed state, deck info, and position index
+                    cards_used = [
+                        {
+                            'name': c['name'],
+                            'reversed': c.get('reversed', False),
+                            'deck_id': c.get('deck_id'),
+                            'deck_name': c.get('deck_name'),
+                            'position_index': pos_idx
+                        }
+                        for pos_idx, c in dlg._spread_cards.items()
+                    ]
+                    deck_name_clean = deck_name.split(' (')[0] if deck_name else None
+
+                    self.db.add_entry_reading(
+                        entry_id=entry_id,
+                        spread_id=spread_id,
+                        spread_name=spread_name,
+                        deck_id=deck_id,
+                        deck_name=deck_name_clean,
+                        cartomancy_type=cartomancy_type,
+                        cards_used=cards_used
+                    )
+
             self._refresh_entries_list()
             self.current_entry_id = entry_id
             self._display_entry_in_viewer(entry_id)
@@ -17,10 +17,7 @@ from rich_text_panel import RichTextPanel
 from image_utils import load_and_scale_image
 from card_metadata import (
     LENORMAND_SUIT_MAP,
-    MAJOR_ARCANA_ORDER,
-    TAROT_SUIT_BASES,
-    TAROT_SUIT_ALIASES,
-    TAROT_RANK_ORDER,
+    get_tarot_sort_key,
     get_playing_card_sort_key,
 )
 
@@ -894,17 +891,6 @@ class LibraryMixin:
         """Sort cards by card_order field (set during import/auto-assign).
         Fallback: Major Arcana first (Fool-World), then Wands, Cups, Swords, Pentacles (Ace-King)"""
 
-        # Build suit order including custom suit names
-        suit_order = dict(TAROT_SUIT_BASES)  # Start with canonical bases
-        # Add custom suit names if provided
-        for key, base in [('wands', 100), ('cups', 200), ('swords', 300), ('pentacles', 400)]:
-            custom = suit_names.get(key, '').lower()
-            if custom:
-                suit_order[custom] = base
-        # Add lowercase canonical names and common aliases
-        for alias, canonical in TAROT_SUIT_ALIASES.items():
-            suit_order[alias] = TAROT_SUIT_BASES[canonical]
-
         def get_sort_key(card):
             # Primary: use card_order if set (not 0 or None)
             try:
@@ -914,24 +900,8 @@ class LibraryMixin:
             except (KeyError, TypeError):
                 pass
 
-            # Fallback: parse card name
-            name_lower = card['name'].lower()
-
-            # Check if it's a major arcana
-            if name_lower in MAJOR_ARCANA_ORDER:
-                return (0, MAJOR_ARCANA_ORDER[name_lower], 0)
-
-            # Check for suit cards
-            for suit_name, suit_val in suit_order.items():
-                if f'of {suit_name}' in name_lower:
-                    # Find rank
-                    for rank, rank_val in TAROT_RANK_ORDER.items():
-                        if name_lower.startswith(rank):
-                            return (1, suit_val, rank_val)
-                    return (1, suit_val, 50)  # Unknown rank
-
-            # Unknown card - put at end but preserve relative order
-            return (2, 999, 0)
+            # Fallback: parse card name (cached per name/suit names)
+            return get_tarot_sort_key(card['name'].lower(), suit_names)
 
         return sorted(cards, key=get_sort_key)
     
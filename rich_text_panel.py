@@ -271,6 +271,65 @@ class RichTextPanel(wx.Panel):
         self.rtc.SetFocus()
 
 
+class LazyRichTextPanel(wx.Panel):
+    """
+    Rich text editor that defers building the RichTextPanel until needed.
+
+    Plain-text (or empty) content is shown in a lightweight multiline
+    TextCtrl, which is swapped for a full RichTextPanel the first time it
+    receives focus. Content that is already rich text gets a RichTextPanel
+    straight away. GetValue/SetValue behave like RichTextPanel, except that
+    untouched plain text is returned as plain text.
+    """
+
+    def __init__(self, parent, value='', min_height=120):
+        super().__init__(parent)
+        self.SetBackgroundColour(get_wx_color('bg_primary'))
+        self._min_height = min_height
+
+        self._sizer = wx.BoxSizer(wx.VERTICAL)
+        if is_rich_text(value):
+            self._editor = RichTextPanel(self, value=value, min_height=min_height)
+        else:
+            self._editor = wx.TextCtrl(self, value=value or '', style=wx.TE_MULTILINE)
+            self._editor.SetBackgroundColour(get_wx_color('bg_input'))
+            self._editor.SetForegroundColour(get_wx_color('text_primary'))
+            self._editor.SetMinSize((-1, min_height))
+            self._editor.Bind(wx.EVT_SET_FOCUS, self._on_plain_focus)
+        self._sizer.Add(self._editor, 1, wx.EXPAND)
+        self.SetSizer(self._sizer)
+
+    def _on_plain_focus(self, event):
+        """Upgrade to the rich editor once the user starts editing"""
+        event.Skip()
+        wx.CallAfter(self._upgrade)
+
+    def _upgrade(self):
+        """Replace the plain TextCtrl with a RichTextPanel holding the same text"""
+        if not self or isinstance(self._editor, RichTextPanel):
+            return
+        plain = self._editor
+        self._editor = RichTextPanel(self, value=plain.GetValue(), min_height=self._min_height)
+        self._sizer.Replace(plain, self._editor)
+        plain.Destroy()
+        self.GetParent().Layout()
+        self._editor.SetFocus()
+
+    def GetValue(self):
+        """Return content (XML once the rich editor has been built)"""
+        return self._editor.GetValue()
+
+    def SetValue(self, value):
+        """Load content into whichever editor is active"""
+        if is_rich_text(value) and not isinstance(self._editor, RichTextPanel):
+            self._upgrade()
+        self._editor.SetValue(value)
+
+    def SetFocus(self):
+        """Set focus to the active editor"""
+        self._editor.SetFocus()
+
+
 class RichTextViewer(wx.Panel):
     """
     Read-only display of rich text content.
@@ -5,6 +5,8 @@ Provides theme colors, color conversion, and common constants
 used across all UI modules.
 """
 
+from functools import lru_cache
+
 import wx
 from theme_config import get_theme, PRESET_THEMES
 from logger_config import get_logger
@@ -28,8 +30,9 @@ def hex_to_rgb(hex_color):
     return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
 
 
+@lru_cache(maxsize=64)
 def get_wx_color(key):
-    """Get a wx.Colour from theme"""
+    """Get a wx.Colour from theme (cached; the instance is shared, don't mutate it)"""
     return wx.Colour(*hex_to_rgb(COLORS.get(key, '#000000')))
 
 
@@ -43,3 +46,4 @@ def refresh_colors():
     COLORS.update(_theme.get_colors())
     _fonts_config.clear()
     _fonts_config.update(_theme.get_fonts())
+    get_wx_color.cache_clear()